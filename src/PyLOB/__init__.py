@@ -11,14 +11,22 @@ into, and since ADR-0003 retired the SQL engine PR #7 built it is the only one -
 `replay` (`PyLOB.replay`) is the other half of a recorded session: it takes the
 events back, re-issues the commands among them into a fresh engine, and lets
 that engine derive every fill again. It takes an *iterable of events* rather
-than a database, so it costs no import.
+than a database, so it costs no import -- and, given a `Checkpoint` a sink
+folded out of the stream, starts there and re-issues only the tail.
+`verify_replay` is the same re-issue run as a check: it compares each fill
+the fresh engine derives with the one the stream recorded, and stops at the
+first that differs with a `Divergence` saying where and in what.
 
 Also exported: the exceptions a caller catches (`PyLOBError` and its
 subclasses), the objects the public API hands back (`Order`, `Trade`,
-`Trader`), the two vocabularies it accepts (`Side`, `OrderType` -- plain
-strings work everywhere they do), `EventSink`, the protocol a recorder
-implements, and `__version__`, which a recorded session should note alongside
-its results.
+`Trader`; `InstrumentHandle` for one instrument addressed without its name,
+`FillCount` for a quiet submission, `TopOfBook` for a BBO subscriber,
+`ArchivedOrder` for a finished order on an archiving engine, `OrderView` for
+any order on a columnar one, and `TradeTape` and `TradeRange` for an
+instrument that keeps its trades on a tape), the two vocabularies it accepts
+(`Side`, `OrderType` -- plain strings work everywhere they do), `EventSink`,
+the protocol a recorder implements, and `__version__`, which a recorded
+session should note alongside its results.
 
 `SQLiteSink` is deliberately *not* here. Persistence is optional and off the
 hot path (ADR-0001, ADR-0002), and importing it eagerly would make every
@@ -32,6 +40,10 @@ hot path (ADR-0001, ADR-0002), and importing it eagerly would make every
     book.close()
     rebuilt, trades = replay(read_events("session.db"))
 
+`ShardedOrderBook` stays out for the same reason: it lives in
+`PyLOB.sharded`, with the `multiprocessing` machinery only it needs. So does
+`AsyncOrderBook`, the asyncio front end, in `PyLOB.aio`.
+
 That this module imports no `sqlite3` is a promise, and
 `tests/test_replay.py` holds it: a subprocess imports `PyLOB` and looks.
 """
@@ -40,17 +52,24 @@ from typing import Final
 
 from .engine import (
     DEFAULT_TICK_SIZE,
+    ArchivedOrder,
     DuplicateOrderID,
+    FillCount,
+    InstrumentHandle,
     InvalidOrder,
     Order,
     OrderBook,
+    OrderView,
     PyLOBError,
     Trade,
     Trader,
+    TradeRange,
+    TopOfBook,
+    TradeTape,
     UnknownOrder,
 )
-from .events import EventSink, OrderType, Side
-from .replay import ReplayError, replay
+from .events import Checkpoint, EventSink, OrderType, Side
+from .replay import Divergence, ReplayError, Verification, replay, verify_replay
 
 #: This library's version, as a literal rather than a lookup: the package is
 #: installable from a git URL at a commit that `importlib.metadata` would
@@ -71,16 +90,27 @@ __all__ = [
     "__version__",
     "OrderBook",
     "replay",
+    "verify_replay",
     "PyLOBError",
     "InvalidOrder",
     "DuplicateOrderID",
     "UnknownOrder",
     "ReplayError",
     "Order",
+    "InstrumentHandle",
+    "ArchivedOrder",
+    "OrderView",
     "Trade",
+    "FillCount",
+    "TopOfBook",
+    "TradeTape",
+    "TradeRange",
     "Trader",
     "Side",
     "OrderType",
     "EventSink",
+    "Checkpoint",
+    "Verification",
+    "Divergence",
     "DEFAULT_TICK_SIZE",
 ]
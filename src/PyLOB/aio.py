@@ -0,0 +1,300 @@
+"""An asyncio front end: many coroutines, one engine, no lock.
+
+A service that runs the book behind an event loop has many coroutines
+wanting to submit at once, and an `OrderBook` that is one synchronous
+object. `AsyncOrderBook` sits between them. A coroutine's `submit` joins a
+queue and awaits a future; a callback on the loop drains the queue in
+micro-batches into the engine, in arrival order, and resolves each future
+with what the engine returned to it.
+
+**No lock, because nothing runs concurrently.** The engine is only ever
+touched from the loop's own thread, by the drain, between awaits. A
+coroutine never holds the engine across a suspension, so there is nothing
+to contend on; what a lock per call would have serialized, the queue
+serializes for free, and the loop goes back to the coroutines once per
+batch rather than once per order.
+
+**Zero latency is kept.** Each request is the engine call it names --
+`submit`, `submit_quiet`, `cancel` or `modify`, with the engine's own
+arguments -- made in the order the requests arrived, one after another, so
+every request meets the book exactly as the one before it left it. A batch
+is not netted, reordered or validated ahead of time, and a recorded stream
+is the one the same calls made directly would have recorded. What a batch
+changes is when a caller *hears back*, never what the engine does.
+
+**A refusal is one caller's.** The engine's error is set on the future of
+the request it refused, and the rest of the batch runs -- unlike
+`submit_many`, whose ops are one caller's and stop at the first refusal,
+these are independent callers who did not agree to share a fate.
+
+**A request cancelled before it ran is not run.** A coroutine cancelled
+while its request is still queued -- a timeout, a task group unwinding --
+withdraws the request, and the engine never sees it. Once the drain has
+made the call the result stands, whether or not anyone is still waiting
+for it.
+
+**Throughput against latency.** `max_batch` bounds how many requests one
+drain runs before it gives the loop back, so a burst cannot starve the
+coroutines producing it. `linger` is how long, in seconds, a drain waits
+after the first request of a batch for others to join it: `0.0`, the
+default, drains on the loop's next turn, and a positive `linger` trades
+that much latency for fuller batches. A queue that reaches `max_batch`
+drains at once, linger or not. `queue_depth` and `stats()` report what
+the choice is doing.
+
+Not imported by `PyLOB`, so that a caller with no event loop does not
+import `asyncio`::
+
+    from PyLOB.aio import AsyncOrderBook
+
+    async with AsyncOrderBook(OrderBook(tick_size=0.01)) as front:
+        order, trades = await front.submit(1, "FAKE", "bid", "limit", 5, 100.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+from .engine import FillCount, InvalidOrder, Order, OrderBook, Trade
+from .events import OrderType, Side
+
+__all__ = ["AsyncOrderBook", "AsyncStats"]
+
+
+class AsyncStats(NamedTuple):
+    """What an `AsyncOrderBook` has drained so far.
+
+    `requests` counts the engine calls made, `withdrawn` the requests
+    cancelled before their turn, `batches` the drains that ran at least one
+    call. `largest_batch` and `deepest_queue` are high-water marks: the most
+    calls one drain made, and the most requests ever waiting at once.
+    """
+
+    requests: int
+    withdrawn: int
+    batches: int
+    largest_batch: int
+    deepest_queue: int
+
+    @property
+    def mean_batch(self) -> float:
+        """Calls per drain, on average; 0.0 before the first."""
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class AsyncOrderBook:
+    """An `OrderBook` behind a request queue, drained on the event loop.
+
+    The module docstring has the rules. `book` is the engine, an ordinary
+    `OrderBook` built by the caller with whatever sink, tick and storage it
+    wants; reads go to it directly (`front.book.getBestBid(...)`), since a
+    read from a coroutine is already on the loop's thread and cannot
+    interleave with a drain.
+
+    A front is bound to the loop its first request is made on, and refuses
+    requests from any other. `close()` -- or leaving an `async with` block
+    -- waits for every queued request to run, then closes the engine. A
+    closed front refuses new requests.
+    """
+
+    def __init__(
+        self, book: OrderBook, *, max_batch: int = 256, linger: float = 0.0
+    ) -> None:
+        if not isinstance(max_batch, int) or isinstance(max_batch, bool):
+            raise InvalidOrder("max_batch must be an integer, got %r" % (max_batch,))
+        if max_batch < 1:
+            raise InvalidOrder("max_batch must be at least 1, got %r" % (max_batch,))
+        if not linger >= 0.0:
+            raise InvalidOrder("linger must be non-negative, got %r" % (linger,))
+        self.book = book
+        self._max_batch = max_batch
+        self._linger = linger
+        self._queue: deque[tuple[asyncio.Future[Any], Callable[..., Any], tuple]] = (
+            deque()
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        #: The pending drain: a `Handle` (next turn) or `TimerHandle` (linger).
+        self._drain: asyncio.Handle | None = None
+        self._idle: asyncio.Future[None] | None = None
+        self._closed = False
+        self._requests = 0
+        self._withdrawn = 0
+        self._batches = 0
+        self._largest_batch = 0
+        self._deepest_queue = 0
+
+    async def __aenter__(self) -> AsyncOrderBook:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return "AsyncOrderBook(%r, queued=%d, max_batch=%d, linger=%r)" % (
+            self.book,
+            len(self._queue),
+            self._max_batch,
+            self._linger,
+        )
+
+    # -- requests ----------------------------------------------------------
+
+    async def submit(
+        self,
+        tid: int,
+        instrument: str,
+        side: Side | str,
+        order_type: OrderType | str,
+        qty: int,
+        price: float | None = None,
+        idNum: int | None = None,
+        timestamp: float | None = None,
+    ) -> tuple[Order, Sequence[Trade]]:
+        """`OrderBook.submit`, in its turn. Returns what it returned."""
+        return await self._request(
+            self.book.submit,
+            (tid, instrument, side, order_type, qty, price, idNum, timestamp),
+        )
+
+    async def submit_quiet(
+        self,
+        tid: int,
+        instrument: str,
+        side: Side | str,
+        order_type: OrderType | str,
+        qty: int,
+        price: float | None = None,
+        idNum: int | None = None,
+        timestamp: float | None = None,
+    ) -> FillCount:
+        """`OrderBook.submit_quiet`, in its turn."""
+        return await self._request(
+            self.book.submit_quiet,
+            (tid, instrument, side, order_type, qty, price, idNum, timestamp),
+        )
+
+    async def cancel(
+        self,
+        idNum: int,
+        *,
+        side: Side | str | None = None,
+        timestamp: float | None = None,
+    ) -> Order:
+        """`OrderBook.cancel`, in its turn."""
+        return await self._request(self._cancel, (idNum, side, timestamp))
+
+    async def modify(
+        self,
+        idNum: int,
+        *,
+        qty: int | None = None,
+        price: float | None = None,
+        side: Side | str | None = None,
+        timestamp: float | None = None,
+    ) -> tuple[Order, Sequence[Trade]]:
+        """`OrderBook.modify`, in its turn."""
+        return await self._request(self._modify, (idNum, qty, price, side, timestamp))
+
+    def _cancel(self, idNum: int, side: Any, timestamp: Any) -> Order:
+        return self.book.cancel(idNum, side=side, timestamp=timestamp)
+
+    def _modify(
+        self, idNum: int, qty: Any, price: Any, side: Any, timestamp: Any
+    ) -> tuple[Order, Sequence[Trade]]:
+        return self.book.modify(
+            idNum, qty=qty, price=price, side=side, timestamp=timestamp
+        )
+
+    # -- metrics -----------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a drain, withdrawn ones not yet skipped included."""
+        return len(self._queue)
+
+    def stats(self) -> AsyncStats:
+        """The counters so far, as one `AsyncStats`."""
+        return AsyncStats(
+            requests=self._requests,
+            withdrawn=self._withdrawn,
+            batches=self._batches,
+            largest_batch=self._largest_batch,
+            deepest_queue=self._deepest_queue,
+        )
+
+    # -- the queue ---------------------------------------------------------
+
+    async def close(self) -> None:
+        """Run every queued request, now, then close the engine. Idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue:
+            assert self._loop is not None and self._drain is not None
+            if isinstance(self._drain, asyncio.TimerHandle):
+                # Nothing else can join the batch now: stop lingering.
+                self._drain.cancel()
+                self._drain = self._loop.call_soon(self._run)
+            self._idle = self._loop.create_future()
+            await self._idle
+        self.book.close()
+
+    def _request(self, call: Callable[..., Any], args: tuple) -> asyncio.Future[Any]:
+        if self._closed:
+            raise InvalidOrder("this AsyncOrderBook is closed")
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif loop is not self._loop:
+            raise InvalidOrder("an AsyncOrderBook serves the one loop it started on")
+        future = loop.create_future()
+        queue = self._queue
+        queue.append((future, call, args))
+        if len(queue) > self._deepest_queue:
+            self._deepest_queue = len(queue)
+        if self._drain is None:
+            if self._linger:
+                self._drain = loop.call_later(self._linger, self._run)
+            else:
+                self._drain = loop.call_soon(self._run)
+        elif len(queue) >= self._max_batch and isinstance(
+            self._drain, asyncio.TimerHandle
+        ):
+            # A full batch has nothing left to linger for.
+            self._drain.cancel()
+            self._drain = loop.call_soon(self._run)
+        return future
+
+    def _run(self) -> None:
+        """One drain: up to `max_batch` calls, in arrival order."""
+        queue = self._queue
+        ran = 0
+        while queue and ran < self._max_batch:
+            future, call, args = queue.popleft()
+            if future.cancelled():
+                self._withdrawn += 1
+                continue
+            ran += 1
+            try:
+                result = call(*args)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        if ran:
+            self._requests += ran
+            self._batches += 1
+            if ran > self._largest_batch:
+                self._largest_batch = ran
+        assert self._loop is not None
+        if queue:
+            # The rest go on the loop's next turn, behind the coroutines this
+            # batch just woke -- not after another linger.
+            self._drain = self._loop.call_soon(self._run)
+        else:
+            self._drain = None
+            if self._idle is not None and not self._idle.done():
+                self._idle.set_result(None)
@@ -34,7 +34,7 @@ never gates.
 
 from .baselines import CONFIDENCE_BAND, DEFAULT_TOLERANCE, Comparison, compare
 from .calibration import CALIBRATIONS, CalibrationResult
-from .runner import BenchResult, RunResult, measure
+from .runner import BenchResult, RunResult, build_book, measure
 from .workloads import WORKLOADS, Op, WorkloadSpec, generate
 
 __all__ = [
@@ -48,6 +48,7 @@ __all__ = [
     "RunResult",
     "WORKLOADS",
     "WorkloadSpec",
+    "build_book",
     "compare",
     "generate",
     "measure",
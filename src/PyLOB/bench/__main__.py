@@ -47,6 +47,12 @@ from . import workloads as workloads_module
 #: run's baselines and its recorded commit cannot come from two checkouts.
 _DEFAULT_BASELINES = provenance_module.repo_root() / "benchmarks" / "baselines.json"
 
+#: How the sink-attached line names a writer other than the inline flush.
+_WRITERS: Final = {
+    "sqlite-threaded": ", writer thread",
+    "sqlite-process": ", writer process",
+}
+
 
 def _parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -138,6 +144,17 @@ def _parser() -> argparse.ArgumentParser:
         action="store_true",
         help="skip the sink-attached figure (it is reported, never gating)",
     )
+    writer = parser.add_mutually_exclusive_group()
+    writer.add_argument(
+        "--threaded-sink",
+        action="store_true",
+        help="record the sink-attached figure with SQLiteSink(threaded=True)",
+    )
+    writer.add_argument(
+        "--process-sink",
+        action="store_true",
+        help="record the sink-attached figure with SQLiteProcessSink",
+    )
     parser.add_argument(
         "--no-qos",
         action="store_true",
@@ -308,11 +325,12 @@ def _report(
     )
     if result.sink is not None:
         print(
-            "sqlite sink %9.0f orders/sec   %d trades in %.4fs   [reported]"
+            "sqlite sink %9.0f orders/sec   %d trades in %.4fs   [reported%s]"
             % (
                 result.sink.orders_per_sec,
                 result.sink.trades,
                 result.sink.seconds,
+                _WRITERS.get(result.sink.sink, ""),
             )
         )
     print(
@@ -407,6 +425,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             repeats=args.repeats,
             calibration=args.calibration,
             with_sink=not args.no_sink,
+            threaded_sink=args.threaded_sink,
+            process_sink=args.process_sink,
             request_performance_core=not args.no_qos,
             machine_label=args.machine_label,
         )
@@ -136,7 +136,7 @@ from . import provenance as provenance_module
 from . import workloads as workloads_module
 from .workloads import CURRENCY, INSTRUMENT, Op, WorkloadSpec
 
-__all__ = ["BenchResult", "RunResult", "Sample", "measure"]
+__all__ = ["BenchResult", "RunResult", "Sample", "build_book", "measure"]
 
 
 class RunResult(NamedTuple):
@@ -208,8 +208,12 @@ class BenchResult(NamedTuple):
     workload_checksum: int
 
 
-def _build(spec: WorkloadSpec, sink: Any = None):
-    """A configured book, outside the timed region."""
+def build_book(spec: WorkloadSpec, sink: Any = None):
+    """A book configured for `spec`: its instrument and its traders.
+
+    Built outside the timed region. `PyLOB.sweep` builds a named workload's
+    episodes with it too, so the two configure a workload one way.
+    """
     from PyLOB import OrderBook
 
     book = OrderBook(tick_size=spec.tick_size, sink=sink)
@@ -247,12 +251,18 @@ def _drive(book: Any, ops: list[Op]) -> tuple[int, float]:
 
 
 def _run_sinkless(spec: WorkloadSpec, ops: list[Op]) -> RunResult:
-    book = _build(spec)
+    book = build_book(spec)
     trades, seconds = _drive(book, ops)
     return RunResult(sink="none", orders=len(ops), trades=trades, seconds=seconds)
 
 
-def _run_with_sink(spec: WorkloadSpec, ops: list[Op], directory: Path) -> RunResult:
+def _run_with_sink(
+    spec: WorkloadSpec,
+    ops: list[Op],
+    directory: Path,
+    threaded: bool = False,
+    process: bool = False,
+) -> RunResult:
     from time import perf_counter
 
     from PyLOB.sinks.sqlite import SQLiteSink
@@ -260,12 +270,25 @@ def _run_with_sink(spec: WorkloadSpec, ops: list[Op], directory: Path) -> RunRes
     path = directory / "bench.db"
     if path.exists():
         path.unlink()
-    book = _build(spec, sink=SQLiteSink(path))
+    if process:
+        from PyLOB.sinks.process import SQLiteProcessSink
+
+        sink: Any = SQLiteProcessSink(path)
+        name = "sqlite-process"
+    else:
+        sink = SQLiteSink(path, threaded=threaded)
+        name = "sqlite-threaded" if threaded else "sqlite"
+    book = build_book(spec, sink=sink)
     trades, seconds = _drive(book, ops)
     start = perf_counter()
     book.close()
     seconds += perf_counter() - start
-    return RunResult(sink="sqlite", orders=len(ops), trades=trades, seconds=seconds)
+    return RunResult(
+        sink=name,
+        orders=len(ops),
+        trades=trades,
+        seconds=seconds,
+    )
 
 
 def measure(
@@ -276,6 +299,8 @@ def measure(
     repeats: int = 3,
     calibration: str = "calib-v1",
     with_sink: bool = True,
+    threaded_sink: bool = False,
+    process_sink: bool = False,
     request_performance_core: bool = True,
     machine_label: str | None = None,
 ) -> BenchResult:
@@ -284,6 +309,10 @@ def measure(
     Reports the best pass as `orders_per_sec` and the median per-repeat work
     index as `work_index`; see the module docstring for why those are two
     different summaries of the same repeats.
+
+    `threaded_sink` records the sink-attached pass with `SQLiteSink(...,
+    threaded=True)`, and `process_sink` with `SQLiteProcessSink`; `close()`,
+    and so the writer's last buffers, is inside the region either way.
     """
     if repeats < 1:
         raise ValueError("repeats must be at least 1, got %r" % (repeats,))
@@ -317,7 +346,9 @@ def measure(
                 calibrations.append(calibrated)
                 samples.append(Sample(calibrated.seconds, engine))
                 if with_sink:
-                    sinked.append(_run_with_sink(spec, ops, path))
+                    sinked.append(
+                        _run_with_sink(spec, ops, path, threaded_sink, process_sink)
+                    )
 
     best_calibration = min(calibrations, key=lambda result: result.seconds)
     slowest = max(result.seconds for result in calibrations)
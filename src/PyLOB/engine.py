@@ -16,12 +16,19 @@ The structures
 --------------
 
 One `InstrumentBook` per symbol, two `BookSide`s each. A side is a dict of
-price -> `PriceLevel`, plus two heaps of prices for the two ends of the book::
+tick -> `PriceLevel`, plus one sorted list of its live ticks -- the ladder --
+which is both ends of the book and everything in between::
 
     BookSide
-      _levels   {price: PriceLevel}          membership, O(1)
-      _best     heap, best price on top      matching reads this
-      _worst    heap, worst price on top     reporting reads this
+      _levels   {tick: PriceLevel}           membership, O(1)
+      _ladder   [tick, ...] worst to best    matching and reporting read this
+
+A *tick* is a price counted in whole ticks of the engine's grid, an `int`.
+Prices cross the boundary twice and only twice: a submitted price becomes a
+tick in `create_order` or `modifyOrder`, and a level's `price` -- the double
+every query, `Trade` and event reports -- is computed once, when the level is
+created. In between, lookup, the ladder, `crosses` and `volume_at` compare
+integers, which hash and order exactly and never ask the grid again.
 
 `PriceLevel` holds `{idNum: Order}`. A dict is insertion-ordered, so it *is* a
 FIFO queue, and unlike a `deque` it also removes by identifier in O(1) --
@@ -29,45 +36,40 @@ which is what cancel does, and cancel is the second most common operation in a
 replay after submission. Re-inserting an order puts it at the back, which is
 exactly the priority re-stamp a non-passive modify owes (`order-lifecycle`).
 
-The heaps carry prices, not levels, and use lazy deletion: emptying a level
-drops it from `_levels` and leaves a stale price behind, which the next peek
-pops. A price that is re-created before its stale entry surfaces is *still
-correct* -- the heap holds the price value, and the value has not changed --
-but the heap now holds that price twice, and duplicates are the one thing
-lazy deletion has to be careful about. There are exactly two ways to make
-one: `add` re-creating a level whose stale entry has not surfaced yet, and
-`_compact` rebuilding from the live levels while `match_levels` is holding a
-price it popped, which the walk then pushes back on its way out.
-
-Neither costs accuracy -- a duplicate is the same price value -- provided the
-same *level* is never handed to one match walk twice, which is what the
-`walked` set in `match_levels` guarantees by dropping a copy on sight. What
-they cost is memory, and `_compact` is what bounds it: it rebuilds when
-*either* heap outgrows the live level count, because `_worst` is read only by
-the reporting queries and so sheds a stale entry almost never (lob-n3n: a
-gate on `_best` alone leaves `_worst` growing one entry per level creation
-for the life of the process).
-
-Costs, in the number of price levels L on a side and orders N in a level:
-
-    best / worst price          O(1) amortized (O(log L) when stale entries pop)
+The ladder holds exactly the live levels, in order, with the best price at the
+back. It is maintained eagerly -- a level enters it when created and leaves it
+when emptied -- so there is nothing stale in it to skip, no duplicate to guard
+a walk against, and no rebuild to schedule. That was not true of the two heaps
+it replaced, whose lazy deletion needed a `walked` set so one match walk was
+never handed a level twice and a compaction pass so `_worst`, which only the
+reporting queries peek, did not grow one entry per level creation for the life
+of the process (lob-n3n). Those findings are closed by construction now.
+
+Costs, in the number of price levels L on a side, orders N in a level, and k
+levels the answer covers:
+
+    best / worst price          O(1)
     insert into an old level    O(1)
-    insert into a new level     O(log L)
-    cancel                      O(1)
-    fill the front of the book  O(1) per order, O(log L) per exhausted level
+    insert into a new level     O(log L) to find the slot, plus a memmove of
+                                the levels better than it
+    cancel                      O(1), plus the same memmove if it empties a level
+    fill the front of the book  O(1) per order and per exhausted level
     step over k gated orders    O(k) per level, O(1) when the whole level is
                                 the taker's own (lob-rp4)
-    volume at price             O(L)   -- levels, not orders: `volume` is cached
-    depth ladder                O(L log L) -- levels again; the sort is the cost
-    snapshot                    O(L log L + N)
-
-Two heaps rather than one sorted structure because matching only ever asks for
-one end. `getWorstBid`/`getWorstAsk` are reporting queries (`book-queries`)
-and deserve to be cheap, but they do not deserve to slow down insertion. A
-sorted list of prices would answer both ends and range scans in one structure,
-but pays an O(L) memmove on every new level; a red-black tree pays more code
-than the research scale is worth (the inmemory-engine design.md, decision 1,
-rejected the 2013 implementation's tree for the same reason).
+    volume at price             O(k)   -- only the levels that qualify
+    depth ladder, best k        O(k)   -- no sort; the ladder is in order
+    snapshot                    O(L + N)
+
+The memmove is the price the heaps were chosen to avoid (the inmemory-engine
+design.md, decision 1), and where it lands is why it is worth paying now: the
+back of the list is the best price, which is where a book built around a touch
+creates and empties its levels, so the common case moves a handful of
+pointers. A new level deep in the book moves the levels better than it --
+a `memmove` of a few thousand machine words at research scale, against a sort
+of the whole side on every `depth`, `snapshot` and reporting query before. A
+red-black tree would drop the memmove and pay more code than the research
+scale is worth, for the same reason that design rejected the 2013
+implementation's tree.
 
 Identity
 --------
@@ -79,6 +81,13 @@ identifier unique *"across every instrument the engine holds, for that
 engine's lifetime"* rather than merely among resting orders, which is what
 `order-lifecycle` requires.
 
+An engine built with `archive=True` still retains every order, but not as an
+`Order`: a finished one moves out of `_orders` into `_archive`, one slot per
+identifier across a set of `array` columns, and `order`, `orders` and the
+duplicate check consult both. The archive answers for exactly what retention
+is for -- a finished order's fields, and the fact that its identifier was
+issued -- in about a fifth of the memory.
+
 One engine is one identifier space. `_orders` and `_next_idNum` belong to the
 engine and not to an instrument, so an identifier issued on one instrument is
 never issued again on another, and one that named a cancelled or filled order
@@ -120,6 +129,14 @@ by the tick, round to an integer, multiply back -- carried out in `decimal` so
 that 0.05 is a twentieth and not 0.05000000000000000277, and what comes back
 is the nearest double to the exact decimal multiple.
 
+That definition is `quantize_price`, and it is too slow to run per
+submission: three `decimal` operations, which a per-book memo only hides
+until a wide enough band of prices clears it. A book instead counts ticks
+with `_TickGrid`, in floating point wherever the rounding error is provably
+too small to move the answer, and in `decimal` at the near-ties where it is
+not -- so every price a book holds is the one `quantize_price` gives, and the
+`decimal` path runs on a vanishing fraction of submissions.
+
 It is the price/tick *ratio* that has to fit the 40 significant digits the
 quotient is carried at, so the usable range is "prices within forty digits of
 the tick" and a wider ratio raises `InvalidOrder` naming it (`quantize_price`).
@@ -198,7 +215,8 @@ event that describes what they did, and a replayer re-issues those events as
 the same calls (`events`, "Replay"). `cancel` and `modify` -- the same two
 operations addressed by identifier and keyword -- emit nothing of their own:
 they delegate, so there is one behaviour under two names rather than two
-behaviours to keep in step.
+behaviours to keep in step. `submit_many` emits exactly what the `submit` loop
+it stands for would, so its events replay as that loop.
 
 **A mutation no event can express is refused, not performed quietly.**
 `configure_instrument(symbol, None)` used to withdraw an instrument's currency
@@ -229,12 +247,16 @@ citations that matter to a reader are the ADRs under `docs/adr/` and the two
 
 from __future__ import annotations
 
-import heapq
-from collections.abc import Iterator
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from decimal import ROUND_HALF_EVEN, Context, Decimal, DecimalException
 from functools import lru_cache
+from heapq import merge
+from itertools import islice
 from math import isfinite
+from operator import attrgetter
 from numbers import Real
 from typing import Any, Final, NamedTuple
 
@@ -242,6 +264,7 @@ from .events import (
     Accepted,
     Cancelled,
     CancelReason,
+    Checkpoint,
     Event,
     EventSink,
     Filled,
@@ -262,11 +285,17 @@ __all__ = [
     "quantize_price",
     "commission_for",
     "Order",
+    "ArchivedOrder",
+    "OrderView",
     "Trade",
+    "FillCount",
+    "TradeTape",
+    "TradeRange",
     "Trader",
     "PriceLevel",
     "BookSide",
     "InstrumentBook",
+    "InstrumentHandle",
     "OrderBook",
     "DEFAULT_TICK_SIZE",
     "MAX_QTY",
@@ -287,6 +316,8 @@ MAX_QTY: Final = 2**53
 _NOTIONAL_GUARD: Final = 1e292
 
 _INF: Final = float("inf")
+#: A market order's missing price, in a float column (`_OrderArchive`).
+_NAN: Final = float("nan")
 
 #: How many quantized prices a book keeps (`OrderBook.quantize`). Big enough
 #: to hold the grid of any book a research workload builds around a touch;
@@ -294,6 +325,24 @@ _INF: Final = float("inf")
 #: entry per price it ever saw.
 _GRID_MEMO_SIZE: Final = 8192
 
+#: The widest `price_band` a side will preallocate, in ticks: a slot is one
+#: pointer, so this is 8 MiB per side at its limit. A band wider than this is
+#: not a band, and the ladder serves it better than an array of empty slots.
+_MAX_BAND_TICKS: Final = 1 << 20
+
+#: `submit_many`'s coercions: each member by itself. These are `StrEnum`s, so
+#: the member's string value hashes and compares equal to it and finds it too.
+_SIDE_OF: Final = {member: member for member in Side}
+_ORDER_TYPE_OF: Final = {member: member for member in OrderType}
+
+#: The columns `OrderBook.submit_many` reads from columnar ops, in op order.
+_SUBMIT_MANY_COLUMNS: Final = ("tid", "side", "type", "qty", "price")
+
+#: The widest spread of live ticks a side keeps a `_VolumeIndex` over. The
+#: tree is a list of about twice the spread, so this caps it near 4 MiB; a
+#: side spread wider than this answers `volume_at` by summing its levels.
+_VOLUME_INDEX_SPAN: Final = 1 << 18
+
 
 # --------------------------------------------------------------------------
 # errors
@@ -408,23 +457,18 @@ def _tick_decimal(tick_size: float) -> Decimal:
     return _tick_cached(_positive_real(tick_size, "tick size"))
 
 
-def _quantize(price: float, tick: Decimal) -> float:
-    """`price` snapped to the nearest multiple of an already-decimalized tick.
+def _multiples(price: Any, tick: Decimal) -> Decimal:
+    """How many ticks `price` is, rounded half-even, as an integral `Decimal`.
 
-    Three `decimal` operations and two conversions, which makes it the most
-    expensive thing on the accept path; `OrderBook.quantize` keeps the
-    answers, and this is what a miss costs. A ratio too wide for `_CTX` raises
-    `InvalidOrder` rather than leaking `decimal.InvalidOperation`, which is
-    not an error a caller catching this library's own would catch.
+    The exact half of `_quantize`, shared with `_TickGrid`'s slow path. A
+    ratio too wide for `_CTX` raises `InvalidOrder` rather than leaking
+    `decimal.InvalidOperation`, which is not an error a caller catching this
+    library's own would catch.
     """
     try:
-        multiples = _CTX.divide(Decimal(str(price)), tick).quantize(
+        return _CTX.divide(Decimal(str(price)), tick).quantize(
             _ONE, rounding=ROUND_HALF_EVEN, context=_CTX
         )
-        # `+ 0.0` only to turn a -0.0 back into 0.0: they compare and hash
-        # alike, so it is cosmetic, but a book should not report a negative
-        # zero price.
-        return float(_CTX.multiply(multiples, tick)) + 0.0
     except DecimalException as exc:
         raise InvalidOrder(
             "price %r does not quantize on a tick of %s: the price/tick ratio "
@@ -433,6 +477,19 @@ def _quantize(price: float, tick: Decimal) -> float:
         ) from exc
 
 
+def _quantize(price: float, tick: Decimal) -> float:
+    """`price` snapped to the nearest multiple of an already-decimalized tick.
+
+    Three `decimal` operations and two conversions, all of them exact. This is
+    the definition of the grid and what `quantize_price` answers with; a book
+    goes through `_TickGrid`, which agrees with it everywhere and reaches for
+    it only where floating point cannot prove the answer on its own.
+    """
+    # `+ 0.0` only to turn a -0.0 back into 0.0: they compare and hash alike,
+    # so it is cosmetic, but a book should not report a negative zero price.
+    return float(_CTX.multiply(_multiples(price, tick), tick)) + 0.0
+
+
 def quantize_price(price: float, tick_size: float) -> float:
     """`price` snapped to the nearest multiple of `tick_size`.
 
@@ -453,6 +510,82 @@ def quantize_price(price: float, tick_size: float) -> float:
     return _quantize(price, _tick_decimal(tick_size))
 
 
+#: How far from zero a price/tick ratio may be for `_TickGrid.ticks` to trust
+#: floating point with it. The product and quotient it takes are each within
+#: half an ulp, so the ratio it computes is within about 4e-16 of the exact
+#: one, relatively -- under 2e-6 of a tick at this magnitude, which is what
+#: `_TIE_MARGIN` has to be wider than.
+_FAST_RATIO: Final = float(2**32)
+
+#: How close to a half tick a ratio may land before `_TickGrid.ticks` stops
+#: trusting its own rounding and asks `decimal`. Only ratios this close to a
+#: tie could round differently from the exact computation, and they are the
+#: half-ticks a research grid deliberately generates, so they are rare in
+#: real flow and cheap to send the long way.
+_TIE_MARGIN: Final = 1e-4
+
+
+class _TickGrid:
+    """One tick size as a pair of conversions: price -> ticks -> price.
+
+    The book's own currency is the *tick count*, an `int`: a level is keyed
+    by one, the ladder is sorted on them, and `crosses` and `volume_at`
+    compare them.
+    A float price is what a caller hands in and what every query and event
+    hands back, and this is the one place the two meet -- once on the way in
+    (`create_order`, `modifyOrder`), once on the way out.
+
+    The tick is read as an exact decimal, `units / 10**places`, so both
+    directions have an all-integer definition. Going in, `price * 10**places
+    / units` in floating point is close enough to the exact ratio that its
+    rounding is provably the exact rounding, except within `_TIE_MARGIN` of a
+    half tick or past `_FAST_RATIO` -- and those fall back to `_multiples`,
+    the three `decimal` operations that used to run on every memo miss.
+    Coming out, `n * units / 10**places` is exact whenever the numerator is
+    an exact double: both operands are, and IEEE division rounds the exact
+    quotient, which is what `float(Decimal)` does too. Either way a tick
+    count converts back to the same double `quantize_price` would give.
+    """
+
+    __slots__ = ("tick", "_units", "_scale", "_exact")
+
+    def __init__(self, tick: Decimal) -> None:
+        self.tick = tick
+        _, digits, exponent = tick.as_tuple()
+        assert isinstance(exponent, int), "a tick is validated finite"
+        units = int("".join(map(str, digits)))
+        if exponent >= 0:
+            units *= 10**exponent
+            exponent = 0
+        self._units = units
+        self._scale = float(10**-exponent)
+        #: Is `_scale` itself exact? Past 10**22 a power of ten is not a
+        #: double, and neither direction's fast path holds.
+        self._exact = -exponent <= 22
+
+    def ticks(self, price: Any) -> int:
+        """`price` as a whole number of ticks, rounded half-even."""
+        if self._exact and type(price) is float:
+            ratio = price * self._scale / self._units
+            if -_FAST_RATIO < ratio < _FAST_RATIO:
+                count = round(ratio)
+                if abs(ratio - count) < 0.5 - _TIE_MARGIN:
+                    return count
+        return int(_multiples(price, self.tick))
+
+    def price(self, ticks: int) -> float:
+        """The double nearest `ticks` whole ticks."""
+        numerator = ticks * self._units
+        if self._exact and -(2**53) <= numerator <= 2**53:
+            return numerator / self._scale + 0.0
+        return float(_CTX.multiply(Decimal(ticks), self.tick)) + 0.0
+
+
+#: The grid a `BookSide` built on its own is on: the default tick's. An
+#: `OrderBook` hands every side it creates its own grid instead.
+_DEFAULT_GRID: Final = _TickGrid(_tick_decimal(DEFAULT_TICK_SIZE))
+
+
 # --------------------------------------------------------------------------
 # what the book holds
 # --------------------------------------------------------------------------
@@ -469,17 +602,20 @@ class Order:
 
     `price` and `priority` are worse than that, because they are not merely
     stored on the order -- they are the book's index into itself, and assigning
-    to either desynchronizes it permanently (`BookSide`). An order whose
-    `price` no longer names the level it is filed under is looked up in the
-    wrong place by everything that follows. `BookSide.remove` finds nothing,
-    which makes `cancelOrder` set the flag and return while leaving the order
-    resting and its quantity counted -- a cancelled order contributing volume
-    for the rest of the session. `BookSide.fill` finds no level either, so the
-    order trades down to nothing without leaving the queue, and the next taker
-    to reach it asks for a fill of zero: `InvalidOrder` out of `_execute`,
-    after the taker's own `Accepted` and the fills before it are already in
-    the stream and already settled. Nothing rejects the assignment, and no
-    later operation repairs it.
+    to either desynchronizes it permanently (`BookSide`). `tick` is `price`
+    counted in ticks, the form the book actually indexes by, so assigning
+    `price` alone leaves the two disagreeing and assigning both is the same
+    corruption twice. An order whose `tick` no longer names the level it is
+    filed under is looked up in the wrong place by everything that follows.
+    `BookSide.remove` finds nothing, which makes `cancelOrder` set the flag
+    and return while leaving the order resting and its quantity counted -- a
+    cancelled order contributing volume for the rest of the session.
+    `BookSide.fill` finds no level either, so the order trades down to nothing
+    without leaving the queue, and the next taker to reach it asks for a fill
+    of zero: `InvalidOrder` out of `_execute`, after the taker's own
+    `Accepted` and the fills before it are already in the stream and already
+    settled. Nothing rejects the assignment, and no later operation repairs
+    it.
 
     Change a resting order through `modifyOrder` or `cancelOrder`, which is
     the same request routed through `BookSide` and recorded -- and which is
@@ -524,6 +660,10 @@ class Order:
     commission: float = 0.0
     cancelled: bool = False
     cancel_reason: CancelReason | None = None
+    #: `price` as a count of ticks on the engine's grid -- what the book
+    #: actually files the order under (`_TickGrid`). Set with `price` and
+    #: never without it; derived, so it takes no part in `repr` or `==`.
+    tick: int | None = field(default=None, repr=False, compare=False)
 
     @property
     def remaining(self) -> int:
@@ -563,6 +703,259 @@ class Order:
         )
 
 
+class ArchivedOrder(NamedTuple):
+    """A finished order, as an archiving engine answers for it.
+
+    What `OrderBook.order` returns for an order the engine has moved out of
+    its store (`OrderBook(archive=True)`): the same fields as the `Order` it
+    was, less the derived `tick`, and immutable, because nothing can change
+    a finished order -- `cancelOrder` and `modifyOrder` refuse one exactly
+    as they refused the live object, on the same checks, with the same
+    errors. `cancelled` and the three state properties are derived here as
+    `Order` derives them, so a caller that only reads an order cannot tell
+    the two apart.
+    """
+
+    idNum: int
+    tid: int
+    instrument: str
+    side: Side
+    order_type: OrderType
+    price: float | None
+    qty: int
+    timestamp: float
+    priority: int
+    fulfilled: int
+    value: float
+    commission: float
+    cancel_reason: CancelReason | None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_reason is not None
+
+    @property
+    def remaining(self) -> int:
+        return self.qty - self.fulfilled
+
+    @property
+    def filled(self) -> bool:
+        return self.fulfilled >= self.qty
+
+    @property
+    def resting(self) -> bool:
+        """False, always: only a finished order is archived."""
+        return False
+
+
+#: `_OrderArchive`'s packed flags byte: set on a slot that holds an order, so
+#: a zeroed slot -- a gap, or an order still live -- reads as absent.
+_ARCHIVED: Final = 1
+_ARCHIVED_ASK: Final = 2
+_ARCHIVED_MARKET: Final = 4
+#: The cancel reason, as an index into this, above the three bits.
+_ARCHIVED_REASONS: Final = (None, *CancelReason)
+
+#: How far past its end the archive will stretch to reach an identifier.
+#: Engine-assigned identifiers are dense, so a gap is only ever the orders
+#: still live; a supplied identifier further off than this goes in the
+#: overflow dict instead of growing every column by the distance.
+_ARCHIVE_REACH: Final = 1 << 16
+
+_by_idNum = attrgetter("idNum")
+
+
+class _OrderArchive:
+    """Finished orders as columns of `array`s, one slot per identifier.
+
+    Slot `idNum - base` holds the order with that identifier; a slot whose
+    flags are zero is an identifier that is not archived -- never issued, or
+    still live in the store. `base` starts at the first identifier to finish
+    and moves down when an earlier one finishes later. Identifiers are issued
+    densely, so the columns are about as long as the number of orders
+    finished, and an order costs one slot across ten columns -- 77 bytes,
+    against the few hundred a live `Order` and its dict entry cost. Lookup is
+    an index, not a search.
+
+    A finished order the columns cannot hold -- an identifier far outside
+    them, a `tid` or a supplied timestamp an `array` will not take -- is
+    kept whole in `_overflow` as its `ArchivedOrder`, so nothing is lost and
+    nothing raises; it only costs what it would have cost unarchived.
+    """
+
+    __slots__ = (
+        "base",
+        "flags",
+        "tid",
+        "instrument",
+        "qty",
+        "fulfilled",
+        "priority",
+        "price",
+        "timestamp",
+        "value",
+        "commission",
+        "_symbols",
+        "_symbol_index",
+        "_overflow",
+        "_count",
+    )
+
+    def __init__(self) -> None:
+        self.base: int | None = None
+        self.flags = array("B")
+        self.tid = array("q")
+        self.instrument = array("I")
+        self.qty = array("q")
+        self.fulfilled = array("q")
+        self.priority = array("q")
+        self.price = array("d")
+        self.timestamp = array("d")
+        self.value = array("d")
+        self.commission = array("d")
+        self._symbols: list[str] = []
+        self._symbol_index: dict[str, int] = {}
+        self._overflow: dict[int, ArchivedOrder] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, idNum: int) -> bool:
+        slot = self._slot(idNum)
+        if slot is not None and slot < len(self.flags) and self.flags[slot]:
+            return True
+        return idNum in self._overflow
+
+    def __iter__(self) -> Iterator[ArchivedOrder]:
+        """Every archived order, in identifier order, columns and overflow alike."""
+        overflow = sorted(self._overflow.values(), key=_by_idNum)
+        return merge(self._views(), overflow, key=_by_idNum)
+
+    def _views(self) -> Iterator[ArchivedOrder]:
+        for slot, flags in enumerate(self.flags):
+            if flags:
+                yield self._view(slot)
+
+    def add(self, order: Order) -> None:
+        """Archive `order`, which the caller has just taken out of the store."""
+        self._count += 1
+        idNum = order.idNum
+        if self.base is None:
+            self.base = idNum
+        slot = idNum - self.base
+        if not -_ARCHIVE_REACH <= slot < len(self.flags) + _ARCHIVE_REACH:
+            self._overflow[idNum] = _archived(order)
+            return
+        if slot < 0:
+            # An order that finishes after later ones did -- a resting order
+            # outliving the market orders behind it, which is most of them.
+            # Grown downward by the columns' length, or by what the slot
+            # needs if that is more, so that a run of ever-earlier
+            # identifiers costs amortised O(1) copies. Not past 1, the first
+            # identifier the engine issues, unless the order's own is lower.
+            grow = max(-slot, min(len(self.flags), self.base - 1))
+            for column in self._columns():
+                column[:0] = array(column.typecode, bytes(grow * column.itemsize))
+            self.base -= grow
+            slot += grow
+        if slot >= len(self.flags):
+            grow = slot + 1 - len(self.flags)
+            for column in self._columns():
+                column.frombytes(bytes(grow * column.itemsize))
+        symbol = self._symbol_index.get(order.instrument)
+        if symbol is None:
+            symbol = self._symbol_index[order.instrument] = len(self._symbols)
+            self._symbols.append(order.instrument)
+        try:
+            self.tid[slot] = order.tid
+            self.timestamp[slot] = order.timestamp
+        except (OverflowError, TypeError):
+            self._overflow[idNum] = _archived(order)
+            return
+        self.instrument[slot] = symbol
+        self.qty[slot] = order.qty
+        self.fulfilled[slot] = order.fulfilled
+        self.priority[slot] = order.priority
+        self.price[slot] = _NAN if order.price is None else order.price
+        self.value[slot] = order.value
+        self.commission[slot] = order.commission
+        # Last, so a slot only reads as archived once every column is written.
+        self.flags[slot] = (
+            _ARCHIVED
+            | (_ARCHIVED_ASK if order.side is Side.ASK else 0)
+            | (_ARCHIVED_MARKET if order.order_type is OrderType.MARKET else 0)
+            | _ARCHIVED_REASONS.index(order.cancel_reason) << 3
+        )
+
+    def get(self, idNum: int) -> ArchivedOrder | None:
+        slot = self._slot(idNum)
+        if slot is not None and slot < len(self.flags) and self.flags[slot]:
+            return self._view(slot)
+        return self._overflow.get(idNum)
+
+    def _slot(self, idNum: int) -> int | None:
+        if self.base is None or not isinstance(idNum, int):
+            return None
+        slot = idNum - self.base
+        return slot if slot >= 0 else None
+
+    def _columns(self) -> tuple[array[Any], ...]:
+        return (
+            self.flags,
+            self.tid,
+            self.instrument,
+            self.qty,
+            self.fulfilled,
+            self.priority,
+            self.price,
+            self.timestamp,
+            self.value,
+            self.commission,
+        )
+
+    def _view(self, slot: int) -> ArchivedOrder:
+        assert self.base is not None
+        flags = self.flags[slot]
+        price = self.price[slot]
+        return ArchivedOrder(
+            idNum=self.base + slot,
+            tid=self.tid[slot],
+            instrument=self._symbols[self.instrument[slot]],
+            side=Side.ASK if flags & _ARCHIVED_ASK else Side.BID,
+            order_type=(
+                OrderType.MARKET if flags & _ARCHIVED_MARKET else OrderType.LIMIT
+            ),
+            price=None if price != price else price,
+            qty=self.qty[slot],
+            timestamp=self.timestamp[slot],
+            priority=self.priority[slot],
+            fulfilled=self.fulfilled[slot],
+            value=self.value[slot],
+            commission=self.commission[slot],
+            cancel_reason=_ARCHIVED_REASONS[flags >> 3],
+        )
+
+
+def _archived(order: Order) -> ArchivedOrder:
+    """`order`'s fields as an `ArchivedOrder`, whole."""
+    return ArchivedOrder(
+        idNum=order.idNum,
+        tid=order.tid,
+        instrument=order.instrument,
+        side=order.side,
+        order_type=order.order_type,
+        price=order.price,
+        qty=order.qty,
+        timestamp=order.timestamp,
+        priority=order.priority,
+        fulfilled=order.fulfilled,
+        value=order.value,
+        commission=order.commission,
+        cancel_reason=order.cancel_reason,
+    )
+
+
 class Trade(NamedTuple):
     """One execution, as reported to whoever caused it.
 
@@ -608,6 +1001,251 @@ class Trade(NamedTuple):
         return self.ask_idNum if self.taker_side is Side.BID else self.bid_idNum
 
 
+class FillCount(NamedTuple):
+    """What `submit_quiet` reports of a submission: how much, in how many.
+
+    `idNum` is the order's, for the cancel or modify a caller may want next;
+    `filled` is the quantity it traded on arrival and `trades` the number of
+    executions that took -- `submit`'s `Trade` list, summed and counted,
+    without the list.
+    """
+
+    idNum: int
+    filled: int
+    trades: int
+
+
+#: A level-feed subscriber (`OrderBook.subscribe_levels`): called with the
+#: side, price and new total volume of every level that changed, 0 for one
+#: that emptied. Its return value is ignored.
+LevelSubscriber = Callable[[Side, float, int], object]
+
+
+class TopOfBook(NamedTuple):
+    """One instrument's touch: the best price on each side and what rests there.
+
+    What a `subscribe_bbo` subscriber is handed. A side with nothing resting
+    has a price of None and a volume of 0.
+    """
+
+    instrument: str
+    bid: float | None
+    bid_volume: int
+    ask: float | None
+    ask_volume: int
+
+
+#: A top-of-book subscriber (`OrderBook.subscribe_bbo`). Its return value is
+#: ignored.
+BBOSubscriber = Callable[[TopOfBook], object]
+
+
+class TradeTape:
+    """An instrument's executions, one `array` column per `Trade` field.
+
+    Opt-in, per instrument (`OrderBook.configure_instrument(trade_tape=True)`),
+    and for the long sinkless run that wants a trade history without paying
+    for one `Trade` per fill to get it. With a tape, `_execute` appends a row
+    here instead of building the tuple, and `submit`, `submit_many`,
+    `modifyOrder` and `match` hand back a `TradeRange` over the rows they
+    added -- an order that traded nothing gets an empty range the tape keeps
+    for the purpose, so a passive order allocates nothing either.
+
+    A `Trade` is still what anything reading the tape sees: indexing builds
+    one from its row, so a tape-backed session and a list-backed one report
+    equal trades. `column` is the vectorized read, a copy of one field's
+    array over a range -- a copy and not a `memoryview`, because a view
+    exported over an `array` forbids resizing it, and the next execution
+    would raise `BufferError` from inside `_execute` with its fills already
+    applied.
+
+    The identifiers are `array("q")` columns, and nothing upstream bounds a
+    `tid` or a supplied `idNum` to 64 bits, nor a supplied timestamp to a
+    float. A row that will not fit turns the columns that can hold such a
+    value -- timestamps, identifiers, traders -- into plain lists, once,
+    and goes in; the cost is memory, never a lost or a failed execution.
+
+    Not recorded, for the reason the price band is not: it changes where
+    trades are kept, never which trades happen, and a replay into a book
+    without one reports the same ones.
+    """
+
+    __slots__ = (
+        "instrument",
+        "trade_id",
+        "timestamp",
+        "price",
+        "qty",
+        "taker_side",
+        "bid_idNum",
+        "bid_tid",
+        "ask_idNum",
+        "ask_tid",
+        "_empty",
+    )
+
+    #: The columns, in `Trade` field order less `instrument`, which is the
+    #: tape's own. `column` reads these names and nothing else.
+    COLUMNS: Final = (
+        "trade_id",
+        "timestamp",
+        "price",
+        "qty",
+        "taker_side",
+        "bid_idNum",
+        "bid_tid",
+        "ask_idNum",
+        "ask_tid",
+    )
+
+    #: The columns a caller-supplied value lands in, and so the ones that may
+    #: have to fall back to a list.
+    _WIDE: Final = ("timestamp", "bid_idNum", "bid_tid", "ask_idNum", "ask_tid")
+
+    def __init__(self, instrument: str) -> None:
+        self.instrument = instrument
+        self.trade_id: array[int] | list[int] = array("q")
+        self.timestamp: array[float] | list[float] = array("d")
+        self.price = array("d")
+        self.qty = array("q")
+        #: 0 for `Side.BID`, 1 for `Side.ASK`.
+        self.taker_side = array("b")
+        self.bid_idNum: array[int] | list[int] = array("q")
+        self.bid_tid: array[int] | list[int] = array("q")
+        self.ask_idNum: array[int] | list[int] = array("q")
+        self.ask_tid: array[int] | list[int] = array("q")
+        self._empty = TradeRange(self, 0, 0)
+
+    def __len__(self) -> int:
+        return len(self.trade_id)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return TradeRange(self, 0, len(self))[index]
+
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(TradeRange(self, 0, len(self)))
+
+    def __repr__(self) -> str:
+        return "TradeTape(%r, %d trades)" % (self.instrument, len(self))
+
+    def append(
+        self,
+        trade_id: int,
+        timestamp: float,
+        price: float,
+        qty: int,
+        taker_side: Side,
+        bid_idNum: int,
+        bid_tid: int,
+        ask_idNum: int,
+        ask_tid: int,
+    ) -> None:
+        """Add one execution's row."""
+        row = len(self.trade_id)
+        try:
+            self.timestamp.append(timestamp)
+            self.bid_idNum.append(bid_idNum)
+            self.bid_tid.append(bid_tid)
+            self.ask_idNum.append(ask_idNum)
+            self.ask_tid.append(ask_tid)
+        except (OverflowError, TypeError):
+            for name in self._WIDE:
+                column = getattr(self, name)
+                setattr(self, name, list(column[:row]))
+            self.timestamp.append(timestamp)
+            self.bid_idNum.append(bid_idNum)
+            self.bid_tid.append(bid_tid)
+            self.ask_idNum.append(ask_idNum)
+            self.ask_tid.append(ask_tid)
+        # The engine's own numbers: a counter, a gated float, a gated qty.
+        self.trade_id.append(trade_id)
+        self.price.append(price)
+        self.qty.append(qty)
+        self.taker_side.append(taker_side is Side.ASK)
+
+    def since(self, start: int) -> TradeRange:
+        """The rows added after the tape was `start` long."""
+        stop = len(self.trade_id)
+        if start == stop:
+            return self._empty
+        return TradeRange(self, start, stop)
+
+    def trade(self, row: int) -> Trade:
+        """Row `row` as the `Trade` a list-backed book would have returned."""
+        return Trade(
+            trade_id=self.trade_id[row],
+            timestamp=self.timestamp[row],
+            instrument=self.instrument,
+            price=self.price[row],
+            qty=self.qty[row],
+            taker_side=Side.ASK if self.taker_side[row] else Side.BID,
+            bid_idNum=self.bid_idNum[row],
+            bid_tid=self.bid_tid[row],
+            ask_idNum=self.ask_idNum[row],
+            ask_tid=self.ask_tid[row],
+        )
+
+
+class TradeRange(Sequence[Trade]):
+    """A run of rows on a `TradeTape`: a sequence of `Trade`s, built on demand.
+
+    What a taped book returns where a list-backed one returns `list[Trade]`.
+    It holds the tape and two row numbers, nothing more, so slicing one is
+    another of these and copies nothing; rows are immutable once appended,
+    so a range stays accurate however long the session runs after it.
+    Compares equal to any sequence of the same trades, a list included.
+    """
+
+    __slots__ = ("tape", "start", "stop")
+
+    def __init__(self, tape: TradeTape, start: int, stop: int) -> None:
+        self.tape = tape
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            stop = max(stop, start)
+            return TradeRange(self.tape, self.start + start, self.start + stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trade range index out of range")
+        return self.tape.trade(self.start + index)
+
+    def __iter__(self) -> Iterator[Trade]:
+        trade = self.tape.trade
+        for row in range(self.start, self.stop):
+            yield trade(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "TradeRange(%r, %d:%d)" % (self.tape.instrument, self.start, self.stop)
+
+    def column(self, name: str) -> array[Any] | list[Any]:
+        """One field over this range, as a copy of the tape's column slice."""
+        if name not in TradeTape.COLUMNS:
+            raise KeyError(
+                "no trade column %r; the tape keeps %s"
+                % (name, ", ".join(TradeTape.COLUMNS))
+            )
+        return getattr(self.tape, name)[self.start : self.stop]
+
+
 @dataclass(slots=True)
 class Trader:
     """A participant's standing configuration.
@@ -665,6 +1303,9 @@ class PriceLevel:
     the members' `remaining`, maintained incrementally so that a volume query
     costs one addition per *level* rather than one per order.
 
+    `tick` is the level's key in its `BookSide` and `price` the same point as
+    the double every query reports; both are fixed for the level's life.
+
     `sole_tid` is the same trick applied to ownership: the tid every order
     here belongs to, or `_MIXED`. Matching reads it to answer "is this whole
     level the taker's own?" in one comparison, and it is maintained only where
@@ -674,10 +1315,11 @@ class PriceLevel:
     that would matter.
     """
 
-    __slots__ = ("price", "volume", "sole_tid", "_orders")
+    __slots__ = ("price", "tick", "volume", "sole_tid", "_orders")
 
-    def __init__(self, price: float) -> None:
+    def __init__(self, price: float, tick: int) -> None:
         self.price = price
+        self.tick = tick
         self.volume = 0
         self.sole_tid: Any = _MIXED
         self._orders: dict[int, Order] = {}
@@ -724,6 +1366,529 @@ class PriceLevel:
         return True
 
 
+#: `_OrderColumns`'s packed flags byte, one bit per fixed or boolean field.
+_COLUMN_ASK: Final = 1
+_COLUMN_MARKET: Final = 2
+_COLUMN_CANCELLED: Final = 4
+#: The cancel reason, as an index into `_ARCHIVED_REASONS`, above the bits.
+_COLUMN_REASON_SHIFT: Final = 3
+
+
+class _OrderColumns:
+    """A columnar engine's orders: one slot each, one `array` per field.
+
+    Slots are handed out in acceptance order and never reused, so every
+    column is exactly as long as the number of orders accepted and nothing
+    is a hole. The `idNum` column is what maps an identifier back to its
+    slot. Engine-assigned identifiers arrive in increasing order, which makes
+    it sorted and the lookup a bisection; a supplied identifier below the
+    highest seen so far is a stray, kept in `_strays`, and its slot in the
+    column repeats the value before it so that the bisection still holds --
+    `bisect_left` lands on the first of a run, which is the genuine one.
+
+    A value an `array` will not take -- a `tid` or identifier past 64 bits, a
+    supplied timestamp that is not a number, a price so far off the grid its
+    tick count overflows -- turns that one column into a list, once, and is
+    stored. Slower to read, and no execution, modification or acceptance can
+    fail half-applied on account of the layout.
+    """
+
+    __slots__ = (
+        "idNum",
+        "flags",
+        "tid",
+        "instrument",
+        "qty",
+        "fulfilled",
+        "priority",
+        "price",
+        "tick",
+        "timestamp",
+        "value",
+        "commission",
+        "position",
+        "_symbols",
+        "_symbol_index",
+        "_strays",
+        "_stray_ids",
+    )
+
+    def __init__(self) -> None:
+        self.idNum: Any = array("q")
+        self.flags: Any = array("B")
+        self.tid: Any = array("q")
+        self.instrument: Any = array("I")
+        self.qty: Any = array("q")
+        self.fulfilled: Any = array("q")
+        self.priority: Any = array("q")
+        self.price: Any = array("d")
+        self.tick: Any = array("q")
+        self.timestamp: Any = array("d")
+        self.value: Any = array("d")
+        self.commission: Any = array("d")
+        #: Where the order sits in its `_ColumnLevel`'s queue, while it does.
+        self.position: Any = array("q")
+        self._symbols: list[str] = []
+        self._symbol_index: dict[str, int] = {}
+        self._strays: dict[int, int] = {}
+        self._stray_ids: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def __contains__(self, idNum: int) -> bool:
+        return self.slot(idNum) is not None
+
+    def __iter__(self) -> Iterator[OrderView]:
+        """Every order, in acceptance order."""
+        for slot in range(len(self.flags)):
+            yield OrderView(self, slot)
+
+    def admit(
+        self,
+        idNum: int,
+        tid: int,
+        instrument: str,
+        side: Side,
+        order_type: OrderType,
+        price: float | None,
+        tick: int | None,
+        qty: int,
+        timestamp: float,
+        priority: int,
+    ) -> OrderView:
+        """Append a new order's row; its view."""
+        slot = len(self.flags)
+        ids = self.idNum
+        if ids and idNum < ids[-1]:
+            self._strays[idNum] = slot
+            self._stray_ids[slot] = idNum
+            idNum = ids[-1]
+        symbol = self._symbol_index.get(instrument)
+        if symbol is None:
+            symbol = self._symbol_index[instrument] = len(self._symbols)
+            self._symbols.append(instrument)
+        self._append("idNum", idNum)
+        self._append("tid", tid)
+        self._append("instrument", symbol)
+        self._append("qty", qty)
+        self._append("fulfilled", 0)
+        self._append("priority", priority)
+        self._append("price", _NAN if price is None else price)
+        self._append("tick", 0 if tick is None else tick)
+        self._append("timestamp", timestamp)
+        self._append("value", 0.0)
+        self._append("commission", 0.0)
+        self._append("position", -1)
+        # Last: the row exists once its flags do.
+        self.flags.append(
+            (_COLUMN_ASK if side is Side.ASK else 0)
+            | (_COLUMN_MARKET if order_type is OrderType.MARKET else 0)
+        )
+        return OrderView(self, slot)
+
+    def slot(self, idNum: int) -> int | None:
+        """The slot holding `idNum`, or None."""
+        slot = self._strays.get(idNum)
+        if slot is not None:
+            return slot
+        ids = self.idNum
+        index = bisect_left(ids, idNum)
+        if index < len(self.flags) and ids[index] == idNum:
+            return index
+        return None
+
+    def get(self, idNum: int) -> OrderView | None:
+        slot = self.slot(idNum)
+        return None if slot is None else OrderView(self, slot)
+
+    def write(self, name: str, slot: int, value: Any) -> None:
+        """Store `value` in column `name`, widening the column if it must."""
+        column = getattr(self, name)
+        try:
+            column[slot] = value
+        except (OverflowError, TypeError):
+            column = list(column)
+            setattr(self, name, column)
+            column[slot] = value
+
+    def _append(self, name: str, value: Any) -> None:
+        column = getattr(self, name)
+        try:
+            column.append(value)
+        except (OverflowError, TypeError):
+            # The columns appended before this one already hold the row's
+            # value, so only this one changes form; `flags` goes last.
+            column = list(column)
+            setattr(self, name, column)
+            column.append(value)
+
+
+class OrderView:
+    """An order on a columnar engine: a slot number, read and written through.
+
+    What `OrderBook(columnar=True)` hands back wherever the default engine
+    hands back an `Order` -- `submit`, `order`, `snapshot`, `orders` -- with
+    the same attributes and the same derived properties, so code that reads
+    an order reads either. It holds nothing but its store and its slot, and
+    is built when asked for: the engine itself keeps no order objects at
+    all, which is where the memory goes.
+
+    Live, not a copy: a view taken before a fill reads the fill after it.
+    Two views of one order are equal but not identical, so compare orders
+    with `==` or by `idNum` on a columnar engine, never with `is`.
+    `materialize` is the detached `Order` a caller may keep, compare and
+    write to freely.
+
+    **Yours to read, not to write**, for exactly `Order`'s reasons: every
+    attribute assigns through to the engine's columns, and the book indexes
+    itself by `price`, `tick` and `priority`.
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: _OrderColumns, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not OrderView:
+            return NotImplemented
+        return self._store is other._store and self._slot == other._slot
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._slot))
+
+    def __repr__(self) -> str:
+        return "OrderView(%s)" % ", ".join(
+            "%s=%r" % (name, getattr(self, name)) for name in _ORDER_FIELDS
+        )
+
+    @property
+    def idNum(self) -> int:
+        store = self._store
+        if store._stray_ids:
+            idNum = store._stray_ids.get(self._slot)
+            if idNum is not None:
+                return idNum
+        return store.idNum[self._slot]
+
+    @property
+    def tid(self) -> int:
+        return self._store.tid[self._slot]
+
+    @property
+    def instrument(self) -> str:
+        store = self._store
+        return store._symbols[store.instrument[self._slot]]
+
+    @property
+    def side(self) -> Side:
+        return Side.ASK if self._store.flags[self._slot] & _COLUMN_ASK else Side.BID
+
+    @property
+    def order_type(self) -> OrderType:
+        if self._store.flags[self._slot] & _COLUMN_MARKET:
+            return OrderType.MARKET
+        return OrderType.LIMIT
+
+    @property
+    def price(self) -> float | None:
+        price = self._store.price[self._slot]
+        return None if price != price else price
+
+    @price.setter
+    def price(self, value: float | None) -> None:
+        self._store.write("price", self._slot, _NAN if value is None else value)
+
+    @property
+    def tick(self) -> int | None:
+        store = self._store
+        if store.flags[self._slot] & _COLUMN_MARKET:
+            return None
+        return store.tick[self._slot]
+
+    @tick.setter
+    def tick(self, value: int | None) -> None:
+        self._store.write("tick", self._slot, 0 if value is None else value)
+
+    @property
+    def qty(self) -> int:
+        return self._store.qty[self._slot]
+
+    @qty.setter
+    def qty(self, value: int) -> None:
+        self._store.write("qty", self._slot, value)
+
+    @property
+    def timestamp(self) -> float:
+        return self._store.timestamp[self._slot]
+
+    @property
+    def priority(self) -> int:
+        return self._store.priority[self._slot]
+
+    @priority.setter
+    def priority(self, value: int) -> None:
+        self._store.write("priority", self._slot, value)
+
+    @property
+    def fulfilled(self) -> int:
+        return self._store.fulfilled[self._slot]
+
+    @fulfilled.setter
+    def fulfilled(self, value: int) -> None:
+        self._store.write("fulfilled", self._slot, value)
+
+    @property
+    def value(self) -> float:
+        return self._store.value[self._slot]
+
+    @value.setter
+    def value(self, value: float) -> None:
+        self._store.write("value", self._slot, value)
+
+    @property
+    def commission(self) -> float:
+        return self._store.commission[self._slot]
+
+    @commission.setter
+    def commission(self, value: float) -> None:
+        self._store.write("commission", self._slot, value)
+
+    @property
+    def cancelled(self) -> bool:
+        return bool(self._store.flags[self._slot] & _COLUMN_CANCELLED)
+
+    @cancelled.setter
+    def cancelled(self, value: bool) -> None:
+        flags = self._store.flags
+        if value:
+            flags[self._slot] |= _COLUMN_CANCELLED
+        else:
+            flags[self._slot] &= ~_COLUMN_CANCELLED & 0xFF
+
+    @property
+    def cancel_reason(self) -> CancelReason | None:
+        flags = self._store.flags[self._slot]
+        return _ARCHIVED_REASONS[flags >> _COLUMN_REASON_SHIFT]
+
+    @cancel_reason.setter
+    def cancel_reason(self, value: CancelReason | None) -> None:
+        flags = self._store.flags
+        low = flags[self._slot] & ((1 << _COLUMN_REASON_SHIFT) - 1)
+        code = _ARCHIVED_REASONS.index(value)
+        flags[self._slot] = low | code << _COLUMN_REASON_SHIFT
+
+    @property
+    def remaining(self) -> int:
+        store, slot = self._store, self._slot
+        return store.qty[slot] - store.fulfilled[slot]
+
+    @property
+    def filled(self) -> bool:
+        store, slot = self._store, self._slot
+        return store.fulfilled[slot] >= store.qty[slot]
+
+    @property
+    def resting(self) -> bool:
+        """`Order.resting`, read off the columns."""
+        store, slot = self._store, self._slot
+        return (
+            not store.flags[slot] & (_COLUMN_MARKET | _COLUMN_CANCELLED)
+            and store.fulfilled[slot] < store.qty[slot]
+        )
+
+    def materialize(self) -> Order:
+        """This order as a detached `Order`, as of now."""
+        return Order(
+            idNum=self.idNum,
+            tid=self.tid,
+            instrument=self.instrument,
+            side=self.side,
+            order_type=self.order_type,
+            price=self.price,
+            qty=self.qty,
+            timestamp=self.timestamp,
+            priority=self.priority,
+            fulfilled=self.fulfilled,
+            value=self.value,
+            commission=self.commission,
+            cancelled=self.cancelled,
+            cancel_reason=self.cancel_reason,
+            tick=self.tick,
+        )
+
+
+#: `Order`'s fields, as `OrderView.__repr__` lists them.
+_ORDER_FIELDS: Final = (
+    "idNum",
+    "tid",
+    "instrument",
+    "side",
+    "order_type",
+    "price",
+    "qty",
+    "timestamp",
+    "priority",
+    "fulfilled",
+    "value",
+    "commission",
+    "cancelled",
+    "cancel_reason",
+)
+
+
+class _ColumnLevel:
+    """`PriceLevel` for a columnar engine: a queue of slot numbers.
+
+    The queue is an `array` of slots in arrival order. Leaving it writes -1
+    over the leaver's entry rather than closing the gap, so removal is O(1)
+    and the array is compacted only once the dead entries outnumber the live
+    ones -- amortized O(1) too. Each order's `position` column says where its
+    entry is, and membership is that entry still naming the order: exact,
+    with no flag to keep in step.
+
+    `volume` and `sole_tid` are `PriceLevel`'s, maintained identically.
+    """
+
+    __slots__ = (
+        "price",
+        "tick",
+        "volume",
+        "sole_tid",
+        "_store",
+        "_slots",
+        "_head",
+        "_live",
+    )
+
+    def __init__(self, price: float, tick: int, store: _OrderColumns) -> None:
+        self.price = price
+        self.tick = tick
+        self.volume = 0
+        self.sole_tid: Any = _MIXED
+        self._store = store
+        self._slots = array("q")
+        #: Index of the first entry that may be live.
+        self._head = 0
+        self._live = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __bool__(self) -> bool:
+        return self._live > 0
+
+    def __iter__(self) -> Iterator[OrderView]:
+        """Members in queue order -- the order they will match in."""
+        store = self._store
+        slots = self._slots
+        for index in range(self._head, len(slots)):
+            slot = slots[index]
+            if slot >= 0:
+                yield OrderView(store, slot)
+
+    def __contains__(self, order: Any) -> bool:
+        if type(order) is not OrderView or order._store is not self._store:
+            return False
+        position = self._store.position[order._slot]
+        slots = self._slots
+        return 0 <= position < len(slots) and slots[position] == order._slot
+
+    def __repr__(self) -> str:
+        return "PriceLevel(price=%r, orders=%d, volume=%d)" % (
+            self.price,
+            self._live,
+            self.volume,
+        )
+
+    def append(self, order: OrderView) -> None:
+        """Put `order` at the back of the queue."""
+        if order in self:
+            raise DuplicateOrderID(
+                "order %r is already resting at %r" % (order.idNum, self.price)
+            )
+        tid = order.tid
+        if not self._live:
+            self.sole_tid = tid
+        elif self.sole_tid != tid:
+            self.sole_tid = _MIXED
+        self._store.position[order._slot] = len(self._slots)
+        self._slots.append(order._slot)
+        self._live += 1
+        self.volume += order.remaining
+
+    def discard(self, order: OrderView) -> bool:
+        """Take `order` out of the queue; False if it was not in it."""
+        if order not in self:
+            return False
+        slots = self._slots
+        slots[self._store.position[order._slot]] = -1
+        self._live -= 1
+        self.volume -= order.remaining
+        head = self._head
+        while head < len(slots) and slots[head] < 0:
+            head += 1
+        self._head = head
+        if len(slots) - self._live > max(self._live, 32):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Close the gaps, and tell each survivor where it now is."""
+        position = self._store.position
+        live = array("q", (slot for slot in self._slots if slot >= 0))
+        for index, slot in enumerate(live):
+            position[slot] = index
+        self._slots = live
+        self._head = 0
+
+
+class _VolumeIndex:
+    """Resting volume by ladder key, as a Fenwick tree over a window of keys.
+
+    Point update and "everything at or above this key" in O(log R), R the
+    width of the window -- which is what turns `volume_at` from a sum over
+    the qualifying levels into two short loops. The window is sized with
+    room either side of the keys it was built over; a key outside it is the
+    owner's cue to rebuild a wider one (`BookSide._count`).
+    """
+
+    __slots__ = ("base", "total", "_tree")
+
+    def __init__(self, low: int, high: int) -> None:
+        span = high - low + 1
+        size = 64
+        while size < 2 * span:
+            size *= 2
+        self.base = low - (size - span) // 2
+        self.total = 0
+        self._tree = [0] * (size + 1)
+
+    def covers(self, key: int) -> bool:
+        return 0 <= key - self.base < len(self._tree) - 1
+
+    def add(self, key: int, delta: int) -> None:
+        self.total += delta
+        tree = self._tree
+        size = len(tree)
+        slot = key - self.base + 1
+        while slot < size:
+            tree[slot] += delta
+            slot += slot & -slot
+
+    def at_least(self, key: int) -> int:
+        """Volume at keys from `key` up: the total, less everything below it."""
+        tree = self._tree
+        slot = min(key - self.base, len(tree) - 1)
+        below = 0
+        while slot > 0:
+            below += tree[slot]
+            slot -= slot & -slot
+        return self.total - below
+
+
 class BookSide:
     """One side of one instrument's book: its levels and its two ends.
 
@@ -734,22 +1899,93 @@ class BookSide:
     with nothing left to trade.
 
     Two fields are the book's index into itself and must not be changed while
-    an order rests: `price` names its level and `priority` is its place in
-    that level's queue. A modification that changes either is `remove`, then
-    the change, then `add` -- which is also exactly the trip to the back of
-    the queue that `order-lifecycle` requires of a non-passive modify.
+    an order rests: `tick` (the price, counted on the grid) names its level
+    and `priority` is its place in that level's queue. A modification that
+    changes either is `remove`, then the change, then `add` -- which is also
+    exactly the trip to the back of the queue that `order-lifecycle` requires
+    of a non-passive modify.
+
+    Everything inside is in ticks. The methods that answer with a price --
+    `best_price`, `worst_price`, and `level_at`'s argument -- convert at
+    their own edge, through the grid the side was built on; the ones that
+    take a tick (`crosses`, `match_levels`, `volume_at`) are what the engine
+    calls on the hot path, where the order has already been converted once.
+
+    **The band.** `set_band` gives the side a preallocated array with one slot
+    per tick across a price range, and a pointer to the best and worst
+    occupied slot (`configure_instrument(price_band=...)`). A level inside the
+    band is filed in its slot rather than in the ladder, so creating or
+    emptying it moves nothing, the best price after an emptied level is a
+    short scan to the next occupied slot, and a volume or depth query over the
+    band is a slice. A level outside it goes to the ladder exactly as before,
+    so the band changes the cost of an order and never its outcome. Ladder
+    and band are disjoint, and every live level is in `_levels` either way,
+    which is what membership and the write path read.
+
+    **The volume index.** `volume_at` is answered from a `_VolumeIndex` once
+    it has been asked once: the first query builds the tree, and from then on
+    every change to a level's volume -- `add`, `remove`, `fill`, `resize`, the
+    four places one happens -- is also posted to it. A session that never
+    asks pays one attribute test per write and nothing else. A side whose
+    live ticks spread wider than `_VOLUME_INDEX_SPAN` keeps no index and sums
+    its qualifying levels instead, which is the same answer, slower.
+
+    **The level feed.** `_feed` is the instrument's level subscribers
+    (`OrderBook.subscribe_levels`), shared by both its sides, or None when
+    it has none. The same four writes hand each of them `(side, price,
+    volume)` for the level they changed, after changing it -- volume 0 for a
+    level that emptied and left -- behind the same single attribute test as
+    the index. A subscriber is called on this thread, inside the operation,
+    and is owed what a sink is owed: nothing guards it, and one that raises
+    takes the operation down with it.
+
+    **Columnar.** Built with a `store` -- an `OrderBook(columnar=True)`'s
+    order columns -- the side's levels are `_ColumnLevel`s, queues of slot
+    numbers rather than of `Order` objects. Nothing else here changes.
     """
 
-    __slots__ = ("side", "_levels", "_best", "_worst", "_best_sign")
+    __slots__ = (
+        "side",
+        "_grid",
+        "_levels",
+        "_ladder",
+        "_sign",
+        "_band",
+        "_base",
+        "_top",
+        "_bottom",
+        "_volumes",
+        "_store",
+        "_feed",
+    )
 
-    def __init__(self, side: Side) -> None:
+    def __init__(
+        self,
+        side: Side,
+        grid: _TickGrid | None = None,
+        store: _OrderColumns | None = None,
+    ) -> None:
         self.side = side
-        self._levels: dict[float, PriceLevel] = {}
-        # Prices, sign-flipped so `heapq`'s minimum is the end we want. A bid
-        # is better the higher it is, an ask the lower.
-        self._best_sign = -1.0 if side is Side.BID else 1.0
-        self._best: list[float] = []
-        self._worst: list[float] = []
+        self._grid = _DEFAULT_GRID if grid is None else grid
+        #: A columnar engine's order columns, which its levels queue slots of.
+        self._store = store
+        self._levels: dict[int, PriceLevel] = {}
+        # Every live tick, sign-flipped so that ascending order runs from the
+        # worst price to the best: a bid is better the higher it is, an ask
+        # the lower. The best end is the *back* of the list, which is the end
+        # matching drains and the quoting around a touch grows, so the common
+        # insertion and the common removal move nothing.
+        self._sign = 1 if side is Side.BID else -1
+        self._ladder: list[int] = []
+        # The band, in the ladder's own keys: slot `i` is key `_base + i`, and
+        # `_top`/`_bottom` are the best and worst occupied slots -- -1 and
+        # `len(_band)` when none is.
+        self._band: list[PriceLevel | None] | None = None
+        self._base = 0
+        self._top = -1
+        self._bottom = 0
+        self._volumes: _VolumeIndex | None = None
+        self._feed: tuple[LevelSubscriber, ...] | None = None
 
     def __len__(self) -> int:
         """How many price levels are on this side."""
@@ -778,99 +2014,130 @@ class BookSide:
 
     def best_price(self) -> float | None:
         """Highest bid / lowest ask, or None when the side is empty."""
-        return self._peek(self._best, self._best_sign)
+        tick = self.best_tick()
+        return None if tick is None else self._levels[tick].price
+
+    def best_tick(self) -> int | None:
+        """`best_price` as a tick count: what `crosses` takes, with no lookup."""
+        ladder = self._ladder
+        best = ladder[-1] if ladder else None
+        if self._top >= 0:
+            banded = self._base + self._top
+            if best is None or banded > best:
+                best = banded
+        return None if best is None else best * self._sign
 
     def worst_price(self) -> float | None:
         """Lowest bid / highest ask, or None when the side is empty."""
-        return self._peek(self._worst, -self._best_sign)
+        ladder = self._ladder
+        worst = ladder[0] if ladder else None
+        if self._top >= 0:
+            banded = self._base + self._bottom
+            if worst is None or banded < worst:
+                worst = banded
+        return None if worst is None else self._levels[worst * self._sign].price
 
     def level_at(self, price: float) -> PriceLevel | None:
         """The level at exactly `price` -- which must already be quantized."""
-        return self._levels.get(price)
+        return self._levels.get(self._grid.ticks(price))
 
-    def levels(self) -> list[PriceLevel]:
-        """Every non-empty level, best price first."""
-        return [
-            self._levels[price]
-            for price in sorted(self._levels, reverse=self.side is Side.BID)
-        ]
+    def levels(self, count: int | None = None) -> list[PriceLevel]:
+        """Every non-empty level, best price first -- or the best `count`.
+
+        A read of the ladder, not a sort: the levels are already in price
+        order, so the best `count` cost `count` steps however deep the side
+        (plus, with a band, the empty slots between them).
+        """
+        if self._band is not None:
+            return list(islice(self._descending(), count))
+        ladder = self._ladder
+        levels = self._levels
+        sign = self._sign
+        stop = 0 if count is None else max(len(ladder) - count, 0)
+        return [levels[key * sign] for key in reversed(ladder[stop:])]
 
-    def crosses(self, level_price: float, price: float | None) -> bool:
-        """Would an opposite order priced at `price` trade at `level_price`?
+    def crosses(self, level_tick: int, tick: int | None) -> bool:
+        """Would an opposite order at `tick` trade at the level at `level_tick`?
 
         `None` is a market order's price and crosses everything: it has named
         no terms, so there are none to fail.
         """
-        if price is None:
+        if tick is None:
             return True
         if self.side is Side.BID:
-            return level_price >= price
-        return level_price <= price
+            return level_tick >= tick
+        return level_tick <= tick
 
-    def match_levels(self, price: float | None) -> Iterator[PriceLevel]:
-        """Levels an opposite order priced at `price` may trade with, best first.
+    def match_levels(self, tick: int | None) -> Iterator[PriceLevel]:
+        """Levels an opposite order at `tick` may trade with, best first.
 
-        The walk lifts each price off the best-price heap before handing over
-        its level and puts back the ones whose level survived. That is what
-        lets the caller *not* consume a level -- every order in it skipped by
-        the self-matching gate -- and still reach the next one: without it the
-        same untouchable price would be on top forever.
+        The walk holds a position in the ladder, not a level out of it: each
+        step asks for the best level strictly worse than the last one handed
+        over, by bisection, so it reads whatever the ladder says *now*. A
+        level the caller emptied is simply gone when the walk looks again; a
+        level it could not touch -- every order in it skipped by the
+        self-matching gate -- stays where it is and the walk carries on past
+        it. Nothing is lifted out and nothing has to be put back, so an
+        abandoned walk leaves the book exactly as it found it, and no level is
+        ever handed to one walk twice.
+
+        With a band the step is the same question asked of both structures
+        (`_below`); without one it is a bisection of the ladder, inline.
 
         Only the caller's own filling removes a level. This yields; it does
-        not delete.
-
-        A price already handed out is dropped rather than yielded again. The
-        heap can hold a price twice (module docstring, "The structures"), and
-        a duplicate is harmless there, where a price is only a price, but not
-        *here*: handing the same level over twice restarts the caller's cursor
-        into it from the front. So `walked` is the set of prices this walk has
-        yielded, and a second copy is popped and forgotten -- which is also
-        how the heaps shed the duplicates they accumulate.
-
-        Close the iterator -- a `try`/`finally` around the walk, or exhaust it
-        -- or the prices it walked past stay out of the heap until it is
-        collected. An open walk is not a paused one: while it is held, the
-        levels it has handed out are live in `_levels` and absent from
-        `_best`, so `best_price` names the best level *behind* the walk, or
-        `None`, which is exactly what a corrupted heap looks like from the
-        outside. Nothing distinguishes the two, and only the `finally` above
-        repairs it.
-
-        Public by name and internal by contract: `OrderBook.match` is the only
-        caller, and it is written around this requirement (its `try`/`finally`
-        is the reason it takes no `contextlib.closing`).
+        not delete. Public by name and internal by contract: `OrderBook.match`
+        is the only caller.
         """
-        walked: set[float] = set()
-        try:
-            while True:
-                best = self._peek(self._best, self._best_sign)
-                if best is None or not self.crosses(best, price):
-                    return
-                heapq.heappop(self._best)
-                if best in walked:
-                    continue
-                walked.add(best)
-                yield self._levels[best]
-        finally:
-            for level_price in walked:
-                if level_price in self._levels:
-                    heapq.heappush(self._best, level_price * self._best_sign)
+        ladder = self._ladder
+        levels = self._levels
+        sign = self._sign
+        # Crossing, in ladder keys: a level trades when its key is at least the
+        # taker's. `crosses` is the same rule, stated per level.
+        floor = None if tick is None else tick * sign
+        if self._band is not None:
+            key = self._below(None)
+            while key is not None and (floor is None or key >= floor):
+                yield levels[key * sign]
+                key = self._below(key)
+            return
+        index = len(ladder)
+        while index:
+            key = ladder[index - 1]
+            if floor is not None and key < floor:
+                return
+            yield levels[key * sign]
+            index = bisect_left(ladder, key)
 
-    def volume_at(self, price: float) -> int:
-        """Unfulfilled quantity an opposite order priced at `price` could take.
+    def volume_at(self, tick: int) -> int:
+        """Unfulfilled quantity an opposite order at `tick` could take.
 
         `book-queries` defines this as the marketable question, not the
-        exact-price one: bids priced at or above `price` when this is the bid
+        exact-price one: bids priced at or above the price when this is the bid
         side, asks priced at or below it when this is the ask side, and 0 when
-        nothing qualifies. `price` must already be quantized.
+        nothing qualifies. Those are the keys from `tick` up, which is one
+        `_VolumeIndex.at_least`; without an index it is the levels from the
+        best end of the ladder down to `tick`, summed.
         """
-        if self.side is Side.BID:
-            return sum(
-                level.volume for level in self._levels.values() if level.price >= price
-            )
-        return sum(
-            level.volume for level in self._levels.values() if level.price <= price
-        )
+        sign = self._sign
+        floor = tick * sign
+        index = self._volumes
+        if index is None and self._levels:
+            low, high = self._key_range()
+            if high - low < _VOLUME_INDEX_SPAN:
+                index = self._volumes = self._index(low, high)
+        if index is not None:
+            return index.at_least(floor)
+        ladder = self._ladder
+        levels = self._levels
+        start = bisect_left(ladder, floor)
+        volume = sum(levels[key * sign].volume for key in ladder[start:])
+        band = self._band
+        if band is not None and self._top >= 0:
+            start = max(floor - self._base, self._bottom)
+            for level in band[start : self._top + 1]:
+                if level is not None:
+                    volume += level.volume
+        return volume
 
     # -- writing -----------------------------------------------------------
 
@@ -881,7 +2148,8 @@ class BookSide:
         makes the stamp the queue position. An order with nothing left to
         trade never reaches the book.
         """
-        if order.price is None:
+        tick = order.tick
+        if tick is None:
             raise InvalidOrder("a market order never rests")
         if order.side is not self.side:
             raise InvalidOrder(
@@ -890,12 +2158,21 @@ class BookSide:
         if order.remaining <= 0:
             raise InvalidOrder("order %r has nothing left to rest" % (order.idNum,))
 
-        level = self._levels.get(order.price)
+        level = self._levels.get(tick)
         if level is None:
-            level = self._levels[order.price] = PriceLevel(order.price)
-            heapq.heappush(self._best, order.price * self._best_sign)
-            heapq.heappush(self._worst, order.price * -self._best_sign)
+            assert order.price is not None
+            if self._store is None:
+                level = self._levels[tick] = PriceLevel(order.price, tick)
+            else:
+                level = self._levels[tick] = _ColumnLevel(
+                    order.price, tick, self._store
+                )
+            self._file(level)
         level.append(order)
+        if self._volumes is not None:
+            self._count(tick, order.remaining)
+        if self._feed is not None:
+            self._publish(level)
         return level
 
     def remove(self, order: Order) -> bool:
@@ -905,13 +2182,17 @@ class BookSide:
         touch the order's own state -- whether it left because it was
         cancelled or because it is being put back is the caller's business.
         """
-        if order.price is None:
+        if order.tick is None:
             return False
-        level = self._levels.get(order.price)
+        level = self._levels.get(order.tick)
         if level is None or not level.discard(order):
             return False
         if not level:
-            self._drop(order.price)
+            self._drop(order.tick)
+        if self._volumes is not None:
+            self._count(order.tick, -order.remaining)
+        if self._feed is not None:
+            self._publish(level)
         return True
 
     def fill(self, order: Order, qty: int) -> None:
@@ -930,13 +2211,17 @@ class BookSide:
                 % (qty, order.idNum, order.remaining)
             )
         order.fulfilled += qty
-        level = None if order.price is None else self._levels.get(order.price)
+        level = None if order.tick is None else self._levels.get(order.tick)
         if level is not None and order in level:
             level.volume -= qty
             if order.remaining <= 0:
                 level.discard(order)
                 if not level:
-                    self._drop(order.price)
+                    self._drop(order.tick)
+            if self._volumes is not None:
+                self._count(level.tick, -qty)
+            if self._feed is not None:
+                self._publish(level)
 
     def resize(self, order: Order, qty: int) -> None:
         """Change a resting order's quantity without moving it in the queue.
@@ -951,7 +2236,7 @@ class BookSide:
                 "quantity %r is below order %r's fulfilled %d -- clamp first"
                 % (qty, order.idNum, order.fulfilled)
             )
-        level = None if order.price is None else self._levels.get(order.price)
+        level = None if order.tick is None else self._levels.get(order.tick)
         resting = level is not None and order in level
         delta = qty - order.qty
         order.qty = qty
@@ -962,48 +2247,216 @@ class BookSide:
         if order.remaining <= 0:
             level.discard(order)
             if not level:
-                self._drop(order.price)
+                self._drop(order.tick)
+        if self._volumes is not None:
+            self._count(level.tick, delta)
+        if self._feed is not None:
+            self._publish(level)
+
+    # -- internals ---------------------------------------------------------
+
+    def set_band(self, low: int, high: int) -> None:
+        """File the levels from tick `low` to tick `high` in a preallocated array.
+
+        Re-files every live level, so a band may be set -- or moved -- on a
+        side that already has orders resting; their queues are untouched.
+        """
+        first, last = sorted((low * self._sign, high * self._sign))
+        self._band = [None] * (last - first + 1)
+        self._base = first
+        self._top, self._bottom = -1, len(self._band)
+        self._ladder = []
+        for level in self._levels.values():
+            self._file(level)
+
+    def _file(self, level: PriceLevel) -> None:
+        """Put a new level in order: its band slot if it has one, else the ladder."""
+        key = level.tick * self._sign
+        band = self._band
+        if band is not None:
+            index = key - self._base
+            if 0 <= index < len(band):
+                band[index] = level
+                if index > self._top:
+                    self._top = index
+                if index < self._bottom:
+                    self._bottom = index
+                return
+        insort(self._ladder, key)
+
+    def _drop(self, tick: int | None) -> None:
+        """Forget an emptied level: out of the dict, out of the ladder or band."""
+        if tick is None:
+            return
+        del self._levels[tick]
+        key = tick * self._sign
+        band = self._band
+        if band is not None:
+            index = key - self._base
+            if 0 <= index < len(band):
+                band[index] = None
+                top, bottom = self._top, self._bottom
+                if top == bottom:
+                    # The band's only level: nothing to scan to.
+                    self._top, self._bottom = -1, len(band)
+                elif index == top:
+                    # Another occupied slot exists below, so this stops.
+                    top -= 1
+                    while band[top] is None:
+                        top -= 1
+                    self._top = top
+                elif index == bottom:
+                    bottom += 1
+                    while band[bottom] is None:
+                        bottom += 1
+                    self._bottom = bottom
+                return
+        ladder = self._ladder
+        if ladder[-1] == key:
+            ladder.pop()
+        else:
+            del ladder[bisect_left(ladder, key)]
+
+    def _publish(self, level: PriceLevel) -> None:
+        """Hand every level subscriber the level's side, price and new volume."""
+        assert self._feed is not None
+        side, price, volume = self.side, level.price, level.volume
+        for subscriber in self._feed:
+            subscriber(side, price, volume)
+
+    def _count(self, tick: int, delta: int) -> None:
+        """Post a change to one level's volume to the index, widening it if need be.
+
+        Called after the level itself has changed, so a rebuild -- the key
+        fell outside the window -- reads the new volume along with the rest.
+        """
+        index = self._volumes
+        assert index is not None
+        key = tick * self._sign
+        if index.covers(key):
+            index.add(key, delta)
+            return
+        low, high = self._key_range()
+        if high - low < _VOLUME_INDEX_SPAN:
+            self._volumes = self._index(low, high)
+        else:
+            self._volumes = None
 
-    # -- internals ---------------------------------------------------------
+    def _index(self, low: int, high: int) -> _VolumeIndex:
+        """A fresh `_VolumeIndex` around keys `low` to `high`, filled from levels."""
+        index = _VolumeIndex(low, high)
+        sign = self._sign
+        for tick, level in self._levels.items():
+            index.add(tick * sign, level.volume)
+        return index
 
-    def _drop(self, price: float | None) -> None:
-        """Forget an emptied level, leaving its prices in the heaps as stale."""
-        if price is not None:
-            del self._levels[price]
-            self._compact()
+    def _key_range(self) -> tuple[int, int]:
+        """The lowest and highest live keys, from the ladder's ends and the band's.
 
-    def _peek(self, heap: list[float], sign: float) -> float | None:
-        """Top of `heap` after discarding prices whose level is gone."""
+        Only meaningful on a side with at least one level.
+        """
+        ends = []
+        ladder = self._ladder
+        if ladder:
+            ends += (ladder[0], ladder[-1])
+        if self._band is not None and self._top >= 0:
+            ends += (self._base + self._bottom, self._base + self._top)
+        return min(ends), max(ends)
+
+    def _below(self, key: int | None) -> int | None:
+        """The best live key strictly worse than `key` (`None`: the best of all)."""
+        ladder = self._ladder
+        index = len(ladder) if key is None else bisect_left(ladder, key)
+        found = ladder[index - 1] if index else None
+        band = self._band
+        if band is not None and self._top >= 0:
+            slot = self._top if key is None else min(self._top, key - self._base - 1)
+            bottom = self._bottom
+            while slot >= bottom and band[slot] is None:
+                slot -= 1
+            if slot >= bottom and (found is None or self._base + slot > found):
+                found = self._base + slot
+        return found
+
+    def _descending(self) -> Iterator[PriceLevel]:
+        """Every level, best first, across ladder and band: three runs in turn.
+
+        Ladder and band are disjoint, so the ladder splits at the band into the
+        keys above it and the keys below it, and the band runs in between.
+        """
+        ladder = self._ladder
         levels = self._levels
-        while heap:
-            price = heap[0] * sign
-            if price in levels:
-                return price
-            heapq.heappop(heap)
-        return None
+        sign = self._sign
+        split = bisect_left(ladder, self._base)
+        for key in reversed(ladder[split:]):
+            yield levels[key * sign]
+        band = self._band
+        if band is not None:
+            for slot in range(self._top, self._bottom - 1, -1):
+                level = band[slot]
+                if level is not None:
+                    yield level
+        for key in reversed(ladder[:split]):
+            yield levels[key * sign]
+
+
+class _Touch:
+    """An instrument's BBO subscription: what was last reported, and whether to look.
+
+    It rides the level feed as one more subscriber, and a level write calls
+    it with the level's side and price. Only a level at or better than the
+    reported touch can move the touch -- a level behind it can change all it
+    likes and the best price and its volume stay what they were -- so those
+    writes, and only those, queue it on the engine's `_moved` list, once per
+    operation. `OrderBook._notify` then reads the touch off the two sides,
+    and hands it to the subscribers if it differs from the one they last
+    had.
+    """
 
-    def _compact(self) -> None:
-        """Rebuild the heaps when stale prices come to outnumber live ones.
-
-        Lazy deletion only pays for itself if the stale entries eventually
-        surface, and a price that churns deep in the book never does. This
-        bounds the heaps at a small multiple of the live level count for an
-        O(L) rebuild that happens O(1/L) of the time.
-
-        The gate reads whichever heap is longer, and it has to: `_best` is
-        drained by every match, so gating on it alone meant the gate never
-        opened, and `_worst` -- peeked only by the reporting queries -- grew
-        one entry per level creation for the life of the process, until a
-        first `getWorst*` call cost hundreds of milliseconds
-        (`docs/engine-review-2026-08.md`, lob-n3n).
-        """
-        live = len(self._levels)
-        if max(len(self._best), len(self._worst)) <= 2 * live + 16:
+    __slots__ = ("book", "subscribers", "last", "pending", "_moved")
+
+    def __init__(self, book: InstrumentBook, moved: list[_Touch]) -> None:
+        self.book = book
+        self.subscribers: tuple[BBOSubscriber, ...] = ()
+        self.last = self.top()
+        self.pending = False
+        self._moved = moved
+
+    def __call__(self, side: Side, price: float, volume: int) -> None:
+        if self.pending:
+            return
+        last = self.last
+        if side is Side.BID:
+            if last.bid is not None and price < last.bid:
+                return
+        elif last.ask is not None and price > last.ask:
             return
-        self._best = [price * self._best_sign for price in self._levels]
-        self._worst = [price * -self._best_sign for price in self._levels]
-        heapq.heapify(self._best)
-        heapq.heapify(self._worst)
+        self.pending = True
+        self._moved.append(self)
+
+    def top(self) -> TopOfBook:
+        """The touch as the book stands."""
+        book = self.book
+        bid = book.bids.best_tick()
+        ask = book.asks.best_tick()
+        bid_level = None if bid is None else book.bids._levels[bid]
+        ask_level = None if ask is None else book.asks._levels[ask]
+        return TopOfBook(
+            book.symbol,
+            None if bid_level is None else bid_level.price,
+            0 if bid_level is None else bid_level.volume,
+            None if ask_level is None else ask_level.price,
+            0 if ask_level is None else ask_level.volume,
+        )
+
+    def check(self) -> None:
+        """Report the touch if it moved since it was last reported."""
+        self.pending = False
+        top = self.top()
+        if top != self.last:
+            self.last = top
+            for subscriber in self.subscribers:
+                subscriber(top)
 
 
 @dataclass(slots=True)
@@ -1013,6 +2466,10 @@ class InstrumentBook:
     `last_price` is reporting state (`book-queries`: "reporting, not matching
     state"). Nothing in matching may read it -- IOC market orders price at the
     maker, so the book never needs a reference price to match against.
+
+    `tape` is the instrument's `TradeTape` when one was asked for, and where
+    its executions are kept in place of per-trade tuples. `touch` is its BBO
+    subscription (`OrderBook.subscribe_bbo`), when it has subscribers.
     """
 
     symbol: str
@@ -1020,6 +2477,8 @@ class InstrumentBook:
     last_price: float | None = None
     bids: BookSide = field(default_factory=lambda: BookSide(Side.BID))
     asks: BookSide = field(default_factory=lambda: BookSide(Side.ASK))
+    tape: TradeTape | None = None
+    touch: _Touch | None = None
 
     def side(self, side: Side | str) -> BookSide:
         """The named side of this book."""
@@ -1035,13 +2494,174 @@ class InstrumentBook:
 # --------------------------------------------------------------------------
 
 
+class InstrumentHandle:
+    """One instrument of an `OrderBook`, with everything about it looked up.
+
+    What `OrderBook.instrument(symbol)` returns: the engine's own
+    `InstrumentBook` and both its `BookSide`s, resolved once, so that a loop
+    trading a single symbol pays no instrument lookup and no side coercion
+    per call. Every method is the string-addressed method of the same name
+    with the symbol already supplied -- the same gate, the same matching, the
+    same events, the same results -- and reaches into the engine only where
+    that method would have, minus the lookups.
+
+    A handle holds no state of its own and cannot go stale: an instrument's
+    book is created once and never replaced, and what may change about it
+    (its currency, band, tape) is read through the book on every call.
+
+    `cancel` and `modify` address the order by identifier, as the engine
+    does, and refuse one on another instrument before anything moves -- a
+    handle is one instrument, and acting on another through it is a bug the
+    string API could not catch.
+    """
+
+    __slots__ = ("symbol", "_engine", "_book", "bids", "asks", "_sides")
+
+    def __init__(self, engine: OrderBook, book: InstrumentBook) -> None:
+        self.symbol = book.symbol
+        self._engine = engine
+        self._book = book
+        self.bids = book.bids
+        self.asks = book.asks
+        #: `Side` members and their values alike -- a `StrEnum` hashes as its
+        #: value -- to the side they name.
+        self._sides = {Side.BID: book.bids, Side.ASK: book.asks}
+
+    def __repr__(self) -> str:
+        return "InstrumentHandle(symbol=%r)" % (self.symbol,)
+
+    @property
+    def currency(self) -> str | None:
+        return self._book.currency
+
+    @property
+    def last_price(self) -> float | None:
+        """`getLastPrice`."""
+        return self._book.last_price
+
+    def side(self, side: Side | str) -> BookSide:
+        """The named `BookSide`, or an `InvalidOrder` naming what was allowed."""
+        try:
+            return self._sides[side]
+        except (KeyError, TypeError):
+            return self._book.side(side)
+
+    def submit(
+        self,
+        tid: int,
+        side: Side | str,
+        order_type: OrderType | str,
+        qty: int,
+        price: float | None = None,
+        idNum: int | None = None,
+        timestamp: float | None = None,
+    ) -> tuple[Order, Sequence[Trade]]:
+        """`OrderBook.submit` on this instrument."""
+        engine = self._engine
+        try:
+            coerced = _SIDE_OF[side]
+            kind = _ORDER_TYPE_OF[order_type]
+        except (KeyError, TypeError):
+            coerced, kind = _as_side(side), _as_order_type(order_type)
+        order = engine.create_order(
+            tid, self.symbol, coerced, kind, qty, price, idNum, timestamp
+        )
+        book = self._book
+        tape = book.tape
+        trades: Sequence[Trade]
+        if tape is None:
+            trades = []
+            engine._cross(book, order, trades)
+        else:
+            start = len(tape)
+            engine._cross(book, order, None)
+            trades = tape.since(start)
+        if order.remaining > 0:
+            if kind is OrderType.MARKET:
+                engine._cancel(order, CancelReason.IOC_REMAINDER)
+            else:
+                self._sides[coerced].add(order)
+        if engine._archive is not None and not order.resting:
+            engine._retire(order)
+        if engine._moved:
+            engine._notify()
+        return order, trades
+
+    def cancel(
+        self,
+        idNum: int,
+        *,
+        side: Side | str | None = None,
+        timestamp: float | None = None,
+    ) -> Order:
+        """`OrderBook.cancel`, for an order on this instrument."""
+        self._check_own(idNum)
+        return self._engine.cancelOrder(side, idNum, timestamp)
+
+    def modify(
+        self,
+        idNum: int,
+        *,
+        qty: int | None = None,
+        price: float | None = None,
+        side: Side | str | None = None,
+        timestamp: float | None = None,
+    ) -> tuple[Order, Sequence[Trade]]:
+        """`OrderBook.modify`, for an order on this instrument."""
+        self._check_own(idNum)
+        return self._engine.modify(
+            idNum, qty=qty, price=price, side=side, timestamp=timestamp
+        )
+
+    def best_bid(self) -> float | None:
+        """`getBestBid`."""
+        return self.bids.best_price()
+
+    def worst_bid(self) -> float | None:
+        """`getWorstBid`."""
+        return self.bids.worst_price()
+
+    def best_ask(self) -> float | None:
+        """`getBestAsk`."""
+        return self.asks.best_price()
+
+    def worst_ask(self) -> float | None:
+        """`getWorstAsk`."""
+        return self.asks.worst_price()
+
+    def volume_at(self, side: Side | str, price: float) -> int:
+        """`getVolumeAtPrice`."""
+        return self.side(side).volume_at(self._engine._ticks(price))
+
+    def depth(
+        self, side: Side | str, levels: int | None = None
+    ) -> tuple[tuple[float, int], ...]:
+        """`OrderBook.depth`."""
+        if levels is not None:
+            _check_levels(levels)
+        ladder = self.side(side).levels(levels)
+        return tuple((level.price, level.volume) for level in ladder)
+
+    def snapshot(self, side: Side | str) -> tuple[Order, ...]:
+        """`OrderBook.snapshot`."""
+        return tuple(self.side(side))
+
+    def _check_own(self, idNum: int) -> None:
+        order = self._engine.require_order(idNum)
+        if order.instrument != self.symbol:
+            raise InvalidOrder(
+                "order %r is on %r, not %r" % (idNum, order.instrument, self.symbol)
+            )
+
+
 class OrderBook:
     """The engine: instruments, traders, orders, matching, and the ledgers.
 
     configuration
         `configure_instrument`, `configure_trader`, `quantize`
     operations
-        `submit`, `cancelOrder`, `modifyOrder`, and `processOrder` -- the
+        `submit` and `submit_many`, its batched form, `cancelOrder`,
+        `modifyOrder`, and `processOrder` -- the
         legacy dict-quote shape, kept because the public API is a standing
         constraint -- and `cancel`/`modify`, the last two addressed by
         identifier and keyword, which delegate to them
@@ -1070,11 +2690,10 @@ class OrderBook:
     **A sink is not that caller.** `emit` hands each event to `consume`
     synchronously, from inside the operation that caused it, so a sink is the
     one observer positioned to see the engine mid-update -- and mid-update the
-    book contradicts itself. A match walk lifts the level it is working off
-    the best-price heap and leaves it in the level dict, so `getBestAsk`
-    answers `None` for a side that `getWorstAsk`, `snapshot` and
-    `getVolumeAtPrice` all report as occupied: the disagreement `book-queries`
-    requires never to happen. A sink that *writes* is worse. Cancelling a
+    engine contradicts itself. A taker partway through its walk answers
+    `resting` and is in no level, so the order and `snapshot` disagree about
+    the book `book-queries` requires them to describe alike (`Order.resting`).
+    A sink that *writes* is worse. Cancelling a
     maker the walk has stepped over shortens the prefix the skip cursor is
     walked back over, so the walk resumes past a maker the taker was entitled
     to and the taker rests against it -- a book left crossed between two
@@ -1098,6 +2717,8 @@ class OrderBook:
         tick_size: float = DEFAULT_TICK_SIZE,
         sink: EventSink | None = None,
         timestamp: float = 0.0,
+        archive: bool = False,
+        columnar: bool = False,
     ) -> None:
         """Build an engine. It takes orders as soon as this returns.
 
@@ -1125,17 +2746,45 @@ class OrderBook:
 
         Construction is cheap and reserves nothing, so a fresh engine per
         episode is the intended way to reset state; there is no `reset()`.
+
+        `archive=True` is for the run that cannot be split into episodes. A
+        finished order -- filled, cancelled, or an IOC remainder -- leaves
+        the store as its operation ends and goes into a columnar archive, at
+        about a fifth of the memory, where `order(idNum)` still finds it as
+        an `ArchivedOrder` and an identifier it held still cannot be reused
+        (module docstring, "Identity"). What a caller holds is untouched: the
+        `Order` that `submit` returned goes on answering for itself, it is
+        simply no longer the engine's. Matching, the stream and every query
+        are exactly as they are without it.
+
+        `columnar=True` keeps no `Order` objects at all. Every order is a row
+        in a set of parallel `array` columns, one per field, the levels queue
+        row numbers, and what `submit`, `order`, `snapshot` and `orders` hand
+        back is an `OrderView` onto the row -- the same attributes, read and
+        written through, built when asked for. A resting order costs about
+        120 bytes rather than 350, and the collector has nothing per order to
+        walk. The columns keep every order for the engine's life, finished
+        ones included, at that size, so `archive` has nothing left to do and
+        is ignored. Matching, the stream and every
+        query are exactly as they are without it; what differs is that an
+        order is a view, so two lookups of one order are `==` and not `is`.
         """
-        self._tick = _tick_decimal(tick_size)
+        self._tick_grid = _TickGrid(_tick_decimal(tick_size))
         self.tick_size = tick_size
-        #: `quantize`'s memo: submitted price -> price on this book's grid.
-        self._grid: dict[float, float] = {}
+        #: `_ticks`'s memo: submitted price -> whole ticks on this book's grid.
+        self._grid: dict[float, int] = {}
         #: The engine clock. Advanced by one per non-replay operation; set
         #: from the caller's value on the data-replay path. Recorded data.
         self.time: float = timestamp
 
         self._orders: dict[int, Order] = {}
+        #: Finished orders out of `_orders`, when the engine archives them.
+        self._archive = _OrderArchive() if archive and not columnar else None
+        #: Every order as columns, in place of `_orders`, on a columnar engine.
+        self._columns = _OrderColumns() if columnar else None
         self._books: dict[str, InstrumentBook] = {}
+        #: BBO subscriptions a level write may have moved in this operation.
+        self._moved: list[_Touch] = []
         self._traders: dict[int, Trader] = {}
         #: (tid, symbol) -> amount, where a symbol is an instrument or a
         #: currency: both are things a trader holds, and holding -5 of either
@@ -1174,7 +2823,9 @@ class OrderBook:
         return "OrderBook(tick_size=%r, instruments=%d, orders=%d)" % (
             self.tick_size,
             len(self._books),
-            len(self._orders),
+            len(self._orders)
+            + (0 if self._archive is None else len(self._archive))
+            + (0 if self._columns is None else len(self._columns)),
         )
 
     # -- prices ------------------------------------------------------------
@@ -1182,14 +2833,24 @@ class OrderBook:
     def quantize(self, price: float) -> float:
         """This book's tick grid applied to `price`.
 
-        Answers are kept, because `_quantize` is the most expensive thing on
-        the accept path and a book asks it about the same handful of prices
-        all session: a level is a price, and a workload that quotes around a
-        touch offers the same ones over and over.
+        The nearest double to the nearest multiple of the tick, exactly as
+        `quantize_price` computes it -- by way of the whole number of ticks
+        the book itself keeps (`_ticks`), converted back.
+        """
+        return self._tick_grid.price(self._ticks(price))
+
+    def _ticks(self, price: float) -> int:
+        """`price` as a whole number of this book's ticks.
+
+        Answers are kept, because a book asks about the same handful of
+        prices all session: a level is a price, and a workload that quotes
+        around a touch offers the same ones over and over. A miss costs
+        `_TickGrid.ticks`, which is a few float operations and only rarely
+        the `decimal` path, so a memo that clears is no longer a cliff.
 
         A plain dict and not an LRU, because at this size the cost that
         matters is the garbage collector's rather than the lookup's: a dict of
-        float keys and float values holds nothing for it to trace, where an
+        float keys and int values holds nothing for it to trace, where an
         LRU's link nodes are one traced object per entry. Full means cleared,
         not evicted one by one -- the price of a policy cheap enough not to eat
         what it saves. `_grid` is per book because the tick is fixed at
@@ -1199,13 +2860,13 @@ class OrderBook:
         `_check_price` has already made every submitted price one.
         """
         if type(price) is float:
-            value = self._grid.get(price)
-            if value is None:
+            ticks = self._grid.get(price)
+            if ticks is None:
                 if len(self._grid) >= _GRID_MEMO_SIZE:
                     self._grid.clear()
-                value = self._grid[price] = _quantize(price, self._tick)
-            return value
-        return _quantize(price, self._tick)
+                ticks = self._grid[price] = self._tick_grid.ticks(price)
+            return ticks
+        return self._tick_grid.ticks(price)
 
     #: The 2013 engine's name for `quantize`, and the same function object, so
     #: the two share one docstring. Kept because removing a public name needs
@@ -1214,7 +2875,13 @@ class OrderBook:
 
     # -- configuration -----------------------------------------------------
 
-    def configure_instrument(self, symbol: str, currency: str) -> None:
+    def configure_instrument(
+        self,
+        symbol: str,
+        currency: str,
+        price_band: tuple[float, float] | None = None,
+        trade_tape: bool | None = None,
+    ) -> None:
         """Declare an instrument and the currency it settles in.
 
         **Call this before trading the instrument.** Until it is called, a
@@ -1264,6 +2931,24 @@ class OrderBook:
         and their traders' cash and position net together the same way. Name
         instruments and currencies out of disjoint sets and neither can
         happen.
+
+        **`price_band=(low, high)`** is a layout hint and nothing else: both
+        sides of the book preallocate one slot per tick from `low` to `high`
+        (`BookSide`, "The band"), which makes level creation, best-price
+        advance and the volume and depth queries cheap for an instrument whose
+        prices stay inside a known range. An order outside the band rests and
+        matches exactly as it would without one. Omitted, the layout is left
+        as it is; given again, the band moves and the resting levels are
+        re-filed. It is not recorded, because nothing a replay could observe
+        depends on it -- a replayed session trades identically without it.
+        A band wider than `_MAX_BAND_TICKS` ticks raises `InvalidOrder`.
+
+        **`trade_tape=True`** keeps the instrument's executions on a
+        `TradeTape` -- array columns, appended to by `_execute` -- and makes
+        every call that reports trades return a `TradeRange` into it rather
+        than a fresh `list[Trade]`. `False` drops the tape and goes back to
+        lists; omitted, or `True` again, the tape is left as it is, history
+        and all. Unrecorded, like the band, and for the same reason.
         """
         if not isinstance(currency, str) or not currency:
             raise InvalidOrder(
@@ -1277,8 +2962,17 @@ class OrderBook:
                 "both legs of every trade would post to the same key and net "
                 "to a number that is neither a position nor cash" % (symbol,)
             )
+        band = None if price_band is None else self._band_ticks(symbol, price_band)
         book = self.book(symbol)
         book.currency = currency
+        if band is not None:
+            book.bids.set_band(*band)
+            book.asks.set_band(*band)
+        if trade_tape is not None:
+            if not trade_tape:
+                book.tape = None
+            elif book.tape is None:
+                book.tape = TradeTape(symbol)
         if self.recording:
             self.emit(
                 InstrumentConfigured(
@@ -1289,6 +2983,31 @@ class OrderBook:
                 )
             )
 
+    def _band_ticks(
+        self, symbol: str, price_band: tuple[float, float]
+    ) -> tuple[int, int]:
+        """`price_band` as a validated pair of ticks, or an `InvalidOrder`."""
+        try:
+            low, high = price_band
+        except (TypeError, ValueError) as exc:
+            raise InvalidOrder(
+                "price_band for %r must be a (low, high) pair, got %r"
+                % (symbol, price_band)
+            ) from exc
+        first = self._ticks(_check_price(low))
+        last = self._ticks(_check_price(high))
+        if first > last:
+            raise InvalidOrder(
+                "price_band for %r runs from %r down to %r: low comes first"
+                % (symbol, low, high)
+            )
+        if last - first + 1 > _MAX_BAND_TICKS:
+            raise InvalidOrder(
+                "price_band for %r spans %d ticks, more than the %d a side "
+                "preallocates" % (symbol, last - first + 1, _MAX_BAND_TICKS)
+            )
+        return first, last
+
     def configure_trader(
         self,
         tid: int,
@@ -1340,23 +3059,43 @@ class OrderBook:
 
     # -- the store ---------------------------------------------------------
 
-    def order(self, idNum: int) -> Order | None:
-        """The order with `idNum`, resting or finished, or None if none has it."""
-        return self._orders.get(idNum)
+    def order(self, idNum: int) -> Order | ArchivedOrder | None:
+        """The order with `idNum`, resting or finished, or None if none has it.
+
+        On an archiving engine a finished order comes back as the read-only
+        `ArchivedOrder` it was archived as; on a columnar engine every order
+        comes back as an `OrderView`.
+        """
+        if self._columns is not None:
+            return self._columns.get(idNum)
+        order = self._orders.get(idNum)
+        if order is None and self._archive is not None:
+            return self._archive.get(idNum)
+        return order
 
-    def require_order(self, idNum: int) -> Order:
+    def require_order(self, idNum: int) -> Order | ArchivedOrder:
         """`order`, but an unknown identifier raises rather than returning None.
 
         `order-lifecycle`: cancel or modify against an identifier no order has
         raises a library exception and leaves the book unchanged.
         """
-        order = self._orders.get(idNum)
+        order = self.order(idNum)
         if order is None:
             raise UnknownOrder("no order with idNum %r" % (idNum,))
         return order
 
-    def orders(self) -> Iterator[Order]:
-        """Every order the engine has accepted, in acceptance order."""
+    def orders(self) -> Iterator[Order | ArchivedOrder]:
+        """Every order the engine has accepted, in acceptance order.
+
+        An archiving engine merges its archived orders with its live ones by
+        identifier, which is acceptance order for every identifier the engine
+        issued. An identifier supplied out of order, on the data-replay path,
+        is yielded in its identifier's place instead.
+        """
+        if self._columns is not None:
+            return iter(self._columns)
+        if self._archive is not None:
+            return merge(self._archive, self._orders.values(), key=_by_idNum)
         return iter(self._orders.values())
 
     def create_order(
@@ -1407,7 +3146,8 @@ class OrderBook:
         if order_type is OrderType.LIMIT:
             if price is None:
                 raise InvalidOrder("a limit order needs a price")
-            working_price: float | None = self.quantize(_check_price(price))
+            tick: int | None = self._ticks(_check_price(price))
+            working_price: float | None = self._tick_grid.price(tick)
             _check_working_price(price, working_price, qty, self.tick_size)
         else:
             if price is not None:
@@ -1418,23 +3158,37 @@ class OrderBook:
                     "a market order takes no price, got %r: it crosses every "
                     "level and prices at the maker" % (price,)
                 )
-            working_price = None
+            working_price = tick = None
 
         idNum = self._assign_idNum(idNum)
         self._advance(timestamp)
 
-        order = Order(
-            idNum=idNum,
-            tid=tid,
-            instrument=instrument,
-            side=side,
-            order_type=order_type,
-            price=working_price,
-            qty=qty,
-            timestamp=self.time,
-            priority=self.next_priority(),
-        )
-        self._orders[idNum] = order
+        if self._columns is not None:
+            order: Any = self._columns.admit(
+                idNum,
+                tid,
+                instrument,
+                side,
+                order_type,
+                working_price,
+                tick,
+                qty,
+                self.time,
+                self.next_priority(),
+            )
+        else:
+            order = self._orders[idNum] = Order(
+                idNum=idNum,
+                tid=tid,
+                instrument=instrument,
+                side=side,
+                order_type=order_type,
+                price=working_price,
+                qty=qty,
+                timestamp=self.time,
+                priority=self.next_priority(),
+                tick=tick,
+            )
         self.book(instrument)
         if self.recording:
             self.emit(
@@ -1465,7 +3219,7 @@ class OrderBook:
         price: float | None = None,
         idNum: int | None = None,
         timestamp: float | None = None,
-    ) -> tuple[Order, list[Trade]]:
+    ) -> tuple[Order, Sequence[Trade]]:
         """One submission end to end: accept, cross, then rest or cancel.
 
         Returns the order and the executions it caused, in match order. The
@@ -1483,6 +3237,9 @@ class OrderBook:
         Emission order is `Accepted`, then one `Filled` per execution, then
         the `Cancelled` of an IOC remainder -- the order the transitions
         happened in.
+
+        On an instrument with a `TradeTape` the executions come back as a
+        `TradeRange` over the tape's new rows, not as a list.
         """
         order = self.create_order(
             tid=tid,
@@ -1494,17 +3251,181 @@ class OrderBook:
             idNum=idNum,
             timestamp=timestamp,
         )
-        trades = self.match(order)
+        trades = self._match(order)
         if order.remaining > 0:
             if order.order_type is OrderType.MARKET:
                 self._cancel(order, CancelReason.IOC_REMAINDER)
             else:
-                self.rest(order)
+                self._rest(order)
+        if self._archive is not None and not order.resting:
+            self._retire(order)
+        if self._moved:
+            self._notify()
         return order, trades
 
+    def submit_quiet(
+        self,
+        tid: int,
+        instrument: str,
+        side: Side | str,
+        order_type: OrderType | str,
+        qty: int,
+        price: float | None = None,
+        idNum: int | None = None,
+        timestamp: float | None = None,
+    ) -> FillCount:
+        """`submit`, reporting how much traded rather than every trade.
+
+        For the sweep that steps an agent thousands of times and reads
+        nothing per execution but the total. The submission is `submit`'s to
+        the letter -- the same gate, the same walk, the same fills, balances
+        and commissions, and when a sink is attached the same `Accepted`,
+        `Filled` and `Cancelled` events in the same order -- and what it
+        skips is the `Trade` each execution would have built for the return
+        value. Returns a `FillCount`: the order's identifier, the quantity
+        it filled on arrival, and the number of executions that took.
+
+        An instrument with a `TradeTape` still takes its rows: the tape is
+        the instrument's record of its trades, not a return value.
+        """
+        order = self.create_order(
+            tid=tid,
+            instrument=instrument,
+            side=side,
+            order_type=order_type,
+            qty=qty,
+            price=price,
+            idNum=idNum,
+            timestamp=timestamp,
+        )
+        first = self._next_trade_id
+        self._cross(self._books[instrument], order, None)
+        if order.remaining > 0:
+            if order.order_type is OrderType.MARKET:
+                self._cancel(order, CancelReason.IOC_REMAINDER)
+            else:
+                self._rest(order)
+        if self._archive is not None and not order.resting:
+            self._retire(order)
+        if self._moved:
+            self._notify()
+        return FillCount(order.idNum, order.fulfilled, self._next_trade_id - first)
+
+    def submit_many(
+        self,
+        instrument: str,
+        ops: Iterable[tuple[int, Side | str, OrderType | str, int, float | None]]
+        | Mapping[str, Sequence[Any]],
+    ) -> tuple[list[Order], Sequence[Trade]]:
+        """A run of `submit`s on one instrument, in one call.
+
+        `ops` is `(tid, side, type, qty, price)` per submission -- the shape
+        `bench.workloads` generates, less its label -- or the same five as
+        columns: a mapping from `tid`, `side`, `type`, `qty` and `price` to
+        equal-length sequences. Returns one order per op, in op order, and
+        every trade they caused as one flat list in execution order; each
+        trade names its taker, so a caller that wants them per op can group
+        them back. On an instrument with a `TradeTape` the flat list is a
+        `TradeRange` over every row the batch added.
+
+        It is the `submit` loop and not a variation on it: each op is
+        accepted by `create_order` -- the one input gate -- and crossed,
+        rested or cancelled exactly as `submit` does it, so the event stream
+        is the loop's, event for event, and a replay cannot tell which one
+        recorded it. What it saves is the loop's overhead around that. The
+        side and type are coerced by one dict lookup each rather than by the
+        enum constructor, nothing is packed into a per-op tuple, and a limit
+        order that cannot cross -- the opposite side is empty, or its best
+        tick is behind the order's -- goes straight to its level without the
+        `match` call that would have walked nothing.
+
+        Refusal is the loop's too: an op `submit` would refuse raises here
+        with the same error, the ops before it stand, and the ones after it
+        are not attempted. The error carries what stood as `partial`: the
+        `(orders, trades)` pair the call would have returned had the batch
+        ended just before the refused op. Nothing is validated ahead of time,
+        because a batch pre-checked against the book as it stood at the start
+        is not the book op 500 meets.
+        """
+        if isinstance(ops, Mapping):
+            try:
+                columns = [ops[name] for name in _SUBMIT_MANY_COLUMNS]
+            except KeyError as missing:
+                raise InvalidOrder(
+                    "columnar ops need a %s column: submit_many reads %s"
+                    % (missing, ", ".join(_SUBMIT_MANY_COLUMNS))
+                ) from None
+            lengths = [len(column) for column in columns]
+            if len(set(lengths)) > 1:
+                raise InvalidOrder(
+                    "columnar ops need columns of one length, got %s"
+                    % ", ".join(
+                        "%s=%d" % pair for pair in zip(_SUBMIT_MANY_COLUMNS, lengths)
+                    )
+                )
+            ops = zip(*columns)
+
+        create_order = self.create_order
+        limit, market = OrderType.LIMIT, OrderType.MARKET
+        orders: list[Order] = []
+        trades: list[Trade] | None = []
+        book = self._books.get(instrument)
+        tape = None if book is None else book.tape
+        start = 0
+        if tape is not None:
+            start, trades = len(tape), None
+        try:
+            for tid, side, order_type, qty, price in ops:
+                try:
+                    coerced = _SIDE_OF[side]
+                    kind = _ORDER_TYPE_OF[order_type]
+                except (KeyError, TypeError):
+                    # Not a member nor its value: let the usual gate word the error.
+                    coerced, kind = _as_side(side), _as_order_type(order_type)
+                order = create_order(tid, instrument, coerced, kind, qty, price)
+                orders.append(order)
+                if book is None:
+                    book = self._books[instrument]
+                if kind is limit:
+                    makers = book.opposite(coerced)
+                    best = makers.best_tick()
+                    if best is None or not makers.crosses(best, order.tick):
+                        if best is not None:
+                            # `match` would have looked the trader up before
+                            # finding nothing to walk, registering a default one.
+                            self.trader(tid)
+                        book.side(coerced).add(order)
+                        if self._moved:
+                            self._notify()
+                        continue
+                made = self._match(order)
+                if trades is not None:
+                    trades += made
+                if order.remaining > 0:
+                    if kind is market:
+                        self._cancel(order, CancelReason.IOC_REMAINDER)
+                    else:
+                        book.side(coerced).add(order)
+                if self._archive is not None and not order.resting:
+                    self._retire(order)
+                if self._moved:
+                    self._notify()
+        except Exception as refused:
+            # What the ops before it committed, for a caller that must account
+            # for them before handling the refusal.
+            refused.partial = (  # type: ignore[attr-defined]
+                orders,
+                trades if tape is None else tape.since(start),
+            )
+            raise
+        if trades is None:
+            assert tape is not None
+            return orders, tape.since(start)
+        return orders, trades
+
     def processOrder(
         self, quote: dict[str, Any], fromData: bool = False, verbose: bool = False
-    ) -> tuple[list[Trade], dict[str, Any]]:
+    ) -> tuple[Sequence[Trade], dict[str, Any]]:
         """`submit` in the legacy dict-quote shape: quote in, `(trades, quote)` out.
 
         Kept because the public API is a standing constraint. The quote is
@@ -1588,6 +3509,10 @@ class OrderBook:
             raise InvalidOrder("order %r is fully filled, nothing to cancel" % (idNum,))
         self._advance(time)
         self._cancel(order, CancelReason.REQUESTED)
+        if self._archive is not None:
+            self._retire(order)
+        if self._moved:
+            self._notify()
         return order
 
     def modifyOrder(
@@ -1596,7 +3521,7 @@ class OrderBook:
         orderUpdate: dict[str, Any],
         time: float | None = None,
         verbose: bool = False,
-    ) -> tuple[list[Trade], dict[str, Any]]:
+    ) -> tuple[Sequence[Trade], dict[str, Any]]:
         """Change a resting order's price or quantity (legacy dict shape, kept).
 
         `orderUpdate` states `side`, `qty` and `price`. All three keys are
@@ -1662,7 +3587,11 @@ class OrderBook:
         # A modification is a submission of the same order at new terms, so
         # it goes through the same gate: a NaN here would corrupt the book
         # exactly as one on the submission path would (lob-d6i).
-        new_price = prev_price if price is None else self.quantize(_check_price(price))
+        if price is None:
+            new_price, new_tick = prev_price, order.tick
+        else:
+            new_tick = self._ticks(_check_price(price))
+            new_price = self._tick_grid.price(new_tick)
         new_qty = max(prev_qty if qty is None else qty, order.fulfilled)
         if new_price is not None:
             _check_working_price(price, new_price, new_qty, self.tick_size)
@@ -1674,6 +3603,7 @@ class OrderBook:
             if order.resting:
                 side_book.remove(order)
             order.price = new_price
+            order.tick = new_tick
             order.qty = new_qty
             order.priority = self.next_priority()
         else:
@@ -1700,13 +3630,17 @@ class OrderBook:
                 )
             )
 
-        trades: list[Trade] = []
+        trades: Sequence[Trade] = []
         if reprioritized:
             # The order is out of the book, so it crosses as a taker like any
             # arriving order -- and, like one, only what survives goes back in.
-            trades = self.match(order)
+            trades = self._match(order)
             if order.remaining > 0:
-                self.rest(order)
+                self._rest(order)
+        if self._archive is not None and not order.resting:
+            self._retire(order)
+        if self._moved:
+            self._notify()
         if verbose:
             _report(trades, order.tid)
         return trades, orderUpdate
@@ -1743,7 +3677,7 @@ class OrderBook:
         price: float | None = None,
         side: Side | str | None = None,
         timestamp: float | None = None,
-    ) -> tuple[Order, list[Trade]]:
+    ) -> tuple[Order, Sequence[Trade]]:
         """`modifyOrder` addressed by identifier and keyword. Returns (order, trades).
 
         The return shape is `submit`'s rather than `modifyOrder`'s `(trades,
@@ -1787,7 +3721,7 @@ class OrderBook:
 
     # -- matching ----------------------------------------------------------
 
-    def match(self, taker: Order) -> list[Trade]:
+    def match(self, taker: Order) -> Sequence[Trade]:
         """Trade `taker` against the opposite side as far as it is entitled to.
 
         Levels best-price-first, orders within a level front-to-back: (price,
@@ -1813,69 +3747,83 @@ class OrderBook:
         liquidity, moving four balances and draining the book for an order
         `order()` returned `None` for and no `Accepted` ever described
         (lob-9fu).
+
+        Returns a `list[Trade]`, or a `TradeRange` over the rows it added
+        when the instrument keeps a `TradeTape`.
         """
-        if self._orders.get(taker.idNum) is not taker:
+        trades = self._match(taker)
+        if self._moved:
+            self._notify()
+        return trades
+
+    def _match(self, taker: Order) -> Sequence[Trade]:
+        """`match`, as one step of an operation that reports its own touch."""
+        if not self._owns(taker):
             raise UnknownOrder(
                 "order %r is not this engine's: matching an order it never "
                 "accepted trades real liquidity for an order no event "
                 "describes" % (taker.idNum,)
             )
-        trades: list[Trade] = []
         book = self.book(taker.instrument)
+        tape = book.tape
+        if tape is not None:
+            start = len(tape)
+            self._cross(book, taker, None)
+            return tape.since(start)
+        trades: list[Trade] = []
+        self._cross(book, taker, trades)
+        return trades
+
+    def _cross(
+        self, book: InstrumentBook, taker: Order, trades: list[Trade] | None
+    ) -> None:
+        """`match`'s walk, for a taker already known to be the engine's.
+
+        Each execution's `Trade` is appended to `trades`; with `trades` None
+        none is built, unless the instrument keeps a tape, which takes the
+        row either way.
+        """
         # Both are whole `BookSide`s, not collections of counterparties: the
         # maker book is the side being walked, the taker book the side the
         # taker would rest on -- and does rest on already when this is a
         # repriced modify, which is why its fills go through it.
         maker_book = book.opposite(taker.side)
         if taker.cancelled or taker.remaining <= 0 or not maker_book:
-            return trades
+            return
         taker_book = book.side(taker.side)
         gated = not self.trader(taker.tid).allow_self_matching
-        # `try`/`finally` rather than `contextlib.closing`: the walk has to be
-        # closed on every exit (that is what puts the popped prices back), and
-        # the context manager charges an object, an `__enter__` and an
-        # `__exit__` per submission for the same guarantee. Nothing may come
-        # between the two lines below: an exception there would leave the walk
-        # holding prices it popped off the heap.
-        levels = maker_book.match_levels(taker.price)
-        try:
-            for level in levels:
-                if gated and level.sole_tid == taker.tid:
-                    # Every order here is the taker's own, so the gate would
-                    # step over all of them and trade nothing. One comparison
-                    # instead of one per order -- the single-agent case.
-                    continue
-                # Orders skipped by the gate stay at the front of the level
-                # and stay put, so `skipped` is the length of a prefix that
-                # cannot change under us: it is what a replacement cursor has
-                # to be walked back over, and only a fill needs one.
-                skipped = 0
-                cursor: Iterator[Order] | None = None
-                while taker.remaining > 0:
-                    if cursor is None:
-                        cursor = iter(level)
-                        for _ in range(skipped):
-                            next(cursor, None)
-                    maker = next(cursor, None)
-                    if maker is None:
-                        break
-                    if gated and maker.tid == taker.tid:
-                        skipped += 1
-                        continue
-                    trades.append(
-                        self._execute(
-                            book, taker, taker_book, maker, maker_book, level.price
-                        )
-                    )
-                    # A fill that did not exhaust the taker exhausted its
-                    # maker, which leaves the level's dict a member shorter
-                    # and the cursor over it unusable.
-                    cursor = None
-                if taker.remaining <= 0:
+        for level in maker_book.match_levels(taker.tick):
+            if gated and level.sole_tid == taker.tid:
+                # Every order here is the taker's own, so the gate would step
+                # over all of them and trade nothing. One comparison instead
+                # of one per order -- the single-agent case.
+                continue
+            # Orders skipped by the gate stay at the front of the level and
+            # stay put, so `skipped` is the length of a prefix that cannot
+            # change under us: it is what a replacement cursor has to be
+            # walked back over, and only a fill needs one.
+            skipped = 0
+            cursor: Iterator[Order] | None = None
+            while taker.remaining > 0:
+                if cursor is None:
+                    cursor = iter(level)
+                    for _ in range(skipped):
+                        next(cursor, None)
+                maker = next(cursor, None)
+                if maker is None:
                     break
-        finally:
-            levels.close()
-        return trades
+                if gated and maker.tid == taker.tid:
+                    skipped += 1
+                    continue
+                self._execute(
+                    book, taker, taker_book, maker, maker_book, level.price, trades
+                )
+                # A fill that did not exhaust the taker exhausted its maker,
+                # which leaves the level's dict a member shorter and the
+                # cursor over it unusable.
+                cursor = None
+            if taker.remaining <= 0:
+                break
 
     def _execute(
         self,
@@ -1885,9 +3833,14 @@ class OrderBook:
         maker: Order,
         maker_book: BookSide,
         price: float,
-    ) -> Trade:
+        trades: list[Trade] | None,
+    ) -> None:
         """One execution: fill both orders, charge both, move four balances.
 
+        The execution is appended to `trades` as a `Trade`, or onto the
+        instrument's `TradeTape` as a row when it keeps one; with neither,
+        it is recorded by its `Filled` and the two orders alone.
+
         The arithmetic comes first and the fills second, so that an execution
         is all-or-nothing with respect to its own numbers: computed between
         the fills and the settlement, an `OverflowError` out of `qty * price`
@@ -1938,18 +3891,37 @@ class OrderBook:
                     ask_commission_delta=ask_delta,
                 )
             )
-        return Trade(
-            trade_id=trade_id,
-            timestamp=self.time,
-            instrument=book.symbol,
-            price=price,
-            qty=qty,
-            taker_side=taker.side,
-            bid_idNum=bid.idNum,
-            bid_tid=bid.tid,
-            ask_idNum=ask.idNum,
-            ask_tid=ask.tid,
-        )
+        if self._archive is not None and maker.remaining <= 0:
+            # Out of its level already; the taker is its operation's to retire.
+            self._retire(maker)
+        tape = book.tape
+        if tape is not None:
+            tape.append(
+                trade_id,
+                self.time,
+                price,
+                qty,
+                taker.side,
+                bid.idNum,
+                bid.tid,
+                ask.idNum,
+                ask.tid,
+            )
+        elif trades is not None:
+            trades.append(
+                Trade(
+                    trade_id=trade_id,
+                    timestamp=self.time,
+                    instrument=book.symbol,
+                    price=price,
+                    qty=qty,
+                    taker_side=taker.side,
+                    bid_idNum=bid.idNum,
+                    bid_tid=bid.tid,
+                    ask_idNum=ask.idNum,
+                    ask_tid=ask.tid,
+                )
+            )
 
     def _cancel(self, order: Order, reason: CancelReason) -> None:
         """Take `order` out of the book and record why it left.
@@ -2074,9 +4046,23 @@ class OrderBook:
         """
         book = self._books.get(instrument)
         if book is None:
-            book = self._books[instrument] = InstrumentBook(symbol=instrument)
+            book = self._books[instrument] = InstrumentBook(
+                symbol=instrument,
+                bids=BookSide(Side.BID, self._tick_grid, self._columns),
+                asks=BookSide(Side.ASK, self._tick_grid, self._columns),
+            )
         return book
 
+    def instrument(self, symbol: str) -> InstrumentHandle:
+        """A handle on `symbol`, for a caller that trades it call after call.
+
+        The handle (`InstrumentHandle`) has `submit`, `cancel`, `modify` and
+        the read queries with the instrument, its two sides and their
+        coercions resolved here, once. Naming the symbol creates its book as
+        `book` does.
+        """
+        return InstrumentHandle(self, self.book(symbol))
+
     def instruments(self) -> Iterator[str]:
         """Every instrument this engine has a book for.
 
@@ -2088,6 +4074,115 @@ class OrderBook:
         """
         return iter(self._books)
 
+    def subscribe_levels(self, instrument: str, subscriber: LevelSubscriber) -> None:
+        """Feed `subscriber` every change to `instrument`'s price levels.
+
+        The Level 2 delta feed: `subscriber(side, price, volume)` whenever a
+        level's resting volume changes -- an order rests, fills, is resized,
+        cancelled or moved -- with the level's new total, and with 0 when the
+        level empties and leaves the ladder. A level that is created arrives
+        as its first volume. A consumer that keeps `{price: volume}` per side,
+        deleting on 0, holds `depth`'s ladder at O(1) a change rather than
+        re-reading it at O(levels) a poll.
+
+        The subscriber starts in step: before this returns it is handed every
+        level already resting, bids then asks, best first, as though each had
+        just been created. Deltas follow the change that caused them, inside
+        the operation and before it returns, so a subscriber sees a repriced
+        order leave its old level before it joins its new one, and a walk's
+        fills level by level in the order they took. A modification that
+        changes nothing about a level -- a resize to the same quantity --
+        still reports the level, at the volume it already had.
+
+        Opt-in and per instrument: a book with no subscribers pays one
+        attribute test per level write and builds nothing. Subscribing the
+        same callable twice feeds it twice. Naming an instrument creates its
+        book, as `book` does.
+
+        Not recorded. A subscription is an observer, not a transition; a
+        replay rebuilds the levels and a replayed engine's subscribers see
+        them rebuilt. What a subscriber may do from inside an operation is
+        what a sink may (`emit`), and nothing here checks it.
+        """
+        book = self.book(instrument)
+        for side in (book.bids, book.asks):
+            for level in side.levels():
+                subscriber(side.side, level.price, level.volume)
+        feed = (*(book.bids._feed or ()), subscriber)
+        book.bids._feed = book.asks._feed = feed
+
+    def unsubscribe_levels(self, instrument: str, subscriber: LevelSubscriber) -> None:
+        """Stop feeding `subscriber` `instrument`'s level changes.
+
+        Undoes one `subscribe_levels`. A subscriber that is not subscribed
+        raises `InvalidOrder` rather than passing for a successful
+        unsubscribe.
+        """
+        book = self.book(instrument)
+        feed = list(book.bids._feed or ())
+        try:
+            feed.remove(subscriber)
+        except ValueError:
+            raise InvalidOrder(
+                "%r is not subscribed to %r's levels" % (subscriber, instrument)
+            ) from None
+        book.bids._feed = book.asks._feed = tuple(feed) or None
+
+    def subscribe_bbo(self, instrument: str, subscriber: BBOSubscriber) -> None:
+        """Hand `subscriber` `instrument`'s `TopOfBook` whenever the touch moves.
+
+        At most once per operation -- a `submit`, a `cancel`, a `modify`, one
+        op of a `submit_many` -- and only when the best bid or ask, or the
+        volume resting at either, differs from what the subscriber was last
+        handed. A submission that walks three levels and rests its remainder
+        moves the touch several times and reports it once, as it stands when
+        the operation returns. A change behind the touch reports nothing.
+
+        Nothing is re-queried per operation to find out. The subscription
+        rides the level feed (`subscribe_levels`): a level write at or better
+        than the reported touch marks the instrument, and the operation reads
+        the touch back only when something marked it. So a book with BBO
+        subscribers pays a call per level write and a comparison, and an
+        agent subscribed here is not woken by the deep-book churn that
+        cannot affect it.
+
+        The subscriber is first handed the touch as it stands. Delivery is
+        inside the operation, after its last event, on this thread, and owed
+        what a sink is owed (`emit`). Not recorded, like `subscribe_levels`,
+        and naming an instrument creates its book, as `book` does.
+        """
+        book = self.book(instrument)
+        touch = book.touch
+        if touch is None:
+            touch = book.touch = _Touch(book, self._moved)
+            feed = (*(book.bids._feed or ()), touch)
+            book.bids._feed = book.asks._feed = feed
+        touch.subscribers = (*touch.subscribers, subscriber)
+        subscriber(touch.last)
+
+    def unsubscribe_bbo(self, instrument: str, subscriber: BBOSubscriber) -> None:
+        """Stop handing `subscriber` `instrument`'s touch.
+
+        Undoes one `subscribe_bbo`, and refuses a subscriber that is not
+        subscribed, as `unsubscribe_levels` does. The last one to leave takes
+        the subscription off the level feed, and the instrument's writes go
+        back to costing nothing.
+        """
+        book = self.book(instrument)
+        touch = book.touch
+        subscribers = list(() if touch is None else touch.subscribers)
+        try:
+            subscribers.remove(subscriber)
+        except ValueError:
+            raise InvalidOrder(
+                "%r is not subscribed to %r's touch" % (subscriber, instrument)
+            ) from None
+        assert touch is not None
+        touch.subscribers = tuple(subscribers)
+        if not subscribers:
+            book.touch = None
+            self.unsubscribe_levels(instrument, touch)
+
     def rest(self, order: Order) -> None:
         """Put `order` into the book at the back of its price level.
 
@@ -2102,7 +4197,13 @@ class OrderBook:
         refused for the reason `match` is: an order in the book that no event
         describes is liquidity a replay cannot rebuild.
         """
-        if self._orders.get(order.idNum) is not order:
+        self._rest(order)
+        if self._moved:
+            self._notify()
+
+    def _rest(self, order: Order) -> None:
+        """`rest`, as one step of an operation that reports its own touch."""
+        if not self._owns(order):
             raise UnknownOrder(
                 "order %r is not this engine's: resting an order it never "
                 "accepted puts liquidity in the book that no event describes"
@@ -2154,7 +4255,7 @@ class OrderBook:
         price this book can hold, so asking about it means asking about the
         grid point it names.
         """
-        return self.book(instrument).side(side).volume_at(self.quantize(price))
+        return self.book(instrument).side(side).volume_at(self._ticks(price))
 
     def depth(
         self, instrument: str, side: Side | str, levels: int | None = None
@@ -2175,8 +4276,9 @@ class OrderBook:
         A side with nothing resting answers an empty ladder and does not raise:
         an empty book is a book, and every other read-side query says so too.
 
-        The volume is the level's own running total (`PriceLevel`), so a ladder
-        costs the sort over prices and nothing per order. Levels aggregate by
+        The volume is the level's own running total (`PriceLevel`) and the
+        levels are already kept in price order, so the best N cost N steps and
+        nothing per order. Levels aggregate by
         exact price and every resting price is already on the tick grid, so no
         level can be split in two by a rounding difference.
 
@@ -2187,19 +4289,8 @@ class OrderBook:
         its pairs are `snapshot`'s remainders aggregated by price.
         """
         if levels is not None:
-            if not isinstance(levels, int) or isinstance(levels, bool):
-                raise InvalidOrder(
-                    "levels must be an integer, or None for the whole ladder, "
-                    "got %r" % (levels,)
-                )
-            if levels < 1:
-                raise InvalidOrder(
-                    "levels must be at least 1, got %r: pass None for the whole "
-                    "ladder" % (levels,)
-                )
-        ladder = self.book(instrument).side(side).levels()
-        if levels is not None:
-            ladder = ladder[:levels]
+            _check_levels(levels)
+        ladder = self.book(instrument).side(side).levels(levels)
         return tuple((level.price, level.volume) for level in ladder)
 
     def getLastPrice(self, instrument: str) -> float | None:
@@ -2363,6 +4454,24 @@ class OrderBook:
 
     # -- internals ---------------------------------------------------------
 
+    def _notify(self) -> None:
+        """End of an operation: report every touch a level write may have moved."""
+        moved, self._moved[:] = list(self._moved), ()
+        for touch in moved:
+            touch.check()
+
+    def _owns(self, order: Order) -> bool:
+        """Is `order` the engine's own, rather than a look-alike built outside?"""
+        if self._columns is not None:
+            return type(order) is OrderView and order._store is self._columns
+        return self._orders.get(order.idNum) is order
+
+    def _retire(self, order: Order) -> None:
+        """Move a finished `order` from the store into the archive."""
+        assert self._archive is not None
+        del self._orders[order.idNum]
+        self._archive.add(order)
+
     def _advance(self, timestamp: float | None) -> float:
         """Move the clock on by one, or to the caller's value on the replay path.
 
@@ -2376,6 +4485,167 @@ class OrderBook:
             self.time = timestamp
         return self.time
 
+    def _submit_trusted(
+        self,
+        tid: int,
+        instrument: str,
+        side: Side,
+        order_type: OrderType,
+        qty: int,
+        price: float | None,
+        idNum: int,
+        timestamp: float,
+    ) -> Sequence[Trade]:
+        """`submit` for an `Accepted` this engine's own gate already passed.
+
+        `replay(..., trusted=True)`'s path, and nothing else's. Every argument
+        is taken as the recording has it: `side` and `order_type` are already
+        members, `price` is already on this grid, `qty` is already a positive
+        whole number and `idNum` is known unique. So none of it is checked --
+        no coercion, no `_check_qty`, no `_check_price` nor working-price
+        check, no duplicate-identifier lookup in up to three stores -- and
+        the price goes straight to `_ticks` and back into the order as the
+        double it already is. What is left is the part that decides the
+        outcome, exactly as `create_order` and `submit` do it: the counter
+        and the clock, the priority stamp, the `Accepted`, the cross, and the
+        rest or IOC cancel.
+
+        Handed anything the gate would have refused, it builds a wrong book
+        without a word. That is the trade.
+        """
+        if idNum >= self._next_idNum:
+            self._next_idNum = idNum + 1
+        self.time = timestamp
+        tick = None if price is None else self._ticks(price)
+        if self._columns is not None:
+            order: Any = self._columns.admit(
+                idNum,
+                tid,
+                instrument,
+                side,
+                order_type,
+                price,
+                tick,
+                qty,
+                timestamp,
+                self.next_priority(),
+            )
+        else:
+            order = self._orders[idNum] = Order(
+                idNum=idNum,
+                tid=tid,
+                instrument=instrument,
+                side=side,
+                order_type=order_type,
+                price=price,
+                qty=qty,
+                timestamp=timestamp,
+                priority=self.next_priority(),
+                tick=tick,
+            )
+        book = self.book(instrument)
+        if self.recording:
+            self.emit(
+                Accepted(
+                    seq=self.next_seq(),
+                    timestamp=timestamp,
+                    idNum=idNum,
+                    tid=tid,
+                    instrument=instrument,
+                    side=side,
+                    order_type=order_type,
+                    price=price,
+                    qty=qty,
+                    priority=order.priority,
+                )
+            )
+        tape = book.tape
+        trades: Sequence[Trade]
+        if tape is None:
+            trades = []
+            self._cross(book, order, trades)
+        else:
+            start = len(tape)
+            self._cross(book, order, None)
+            trades = tape.since(start)
+        if order.remaining > 0:
+            if order_type is OrderType.MARKET:
+                self._cancel(order, CancelReason.IOC_REMAINDER)
+            else:
+                book.side(side).add(order)
+        if self._archive is not None and not order.resting:
+            self._retire(order)
+        if self._moved:
+            self._notify()
+        return trades
+
+    def _restore(self, checkpoint: Checkpoint) -> None:
+        """Load `checkpoint` into this engine, which has done nothing yet.
+
+        `replay(..., checkpoint=...)`'s path, and nothing else's: a sinkless
+        engine with the plain store, since that is the one `replay` builds.
+        It emits nothing. A checkpoint is state the recorded stream already
+        described, not a transition, and an event for it would be a second
+        description of the same session.
+
+        Resting orders go back in priority order, each to the back of its
+        level, which puts every level's queue back as it was: a queue is in
+        arrival-stamp order, and only a fresh stamp moves an order within it.
+        The counters are set rather than pushed past anything, because the
+        acceptances that would have pushed them are the part of the stream
+        being skipped (`events`, "Replay").
+        """
+        assert self._columns is None and not self._orders and not self.recording
+        self.time = checkpoint.timestamp
+        self._next_idNum = checkpoint.next_idNum
+        self._next_priority = checkpoint.next_priority
+        self._next_trade_id = checkpoint.next_trade_id
+        self._next_seq = checkpoint.seq + 1
+        for symbol, currency, last_price in checkpoint.instruments:
+            book = self.book(symbol)
+            book.currency = currency
+            book.last_price = last_price
+        for tid, name, allow, minimum, max_percnt, per_unit in checkpoint.traders:
+            self._traders[tid] = Trader(
+                tid=tid,
+                name=name,
+                allow_self_matching=bool(allow),
+                commission_min=minimum,
+                commission_max_percnt=max_percnt,
+                commission_per_unit=per_unit,
+            )
+        for tid, symbol, amount in checkpoint.balances:
+            self._balances[tid, symbol] = amount
+        for (
+            idNum,
+            tid,
+            instrument,
+            side,
+            price,
+            qty,
+            fulfilled,
+            value,
+            commission,
+            priority,
+            timestamp,
+        ) in checkpoint.orders:
+            order = self._orders[idNum] = Order(
+                idNum=idNum,
+                tid=tid,
+                instrument=instrument,
+                side=side,
+                order_type=OrderType.LIMIT,
+                price=price,
+                qty=qty,
+                timestamp=timestamp,
+                priority=priority,
+                fulfilled=fulfilled,
+                value=value,
+                commission=commission,
+                tick=self._ticks(price),
+            )
+            self.book(instrument).side(side).add(order)
+
     def _assign_idNum(self, idNum: int | None) -> int:
         """Allocate or accept an identifier, keeping it unique for all time.
 
@@ -2391,13 +4661,31 @@ class OrderBook:
             return idNum
         if not isinstance(idNum, int) or isinstance(idNum, bool):
             raise InvalidOrder("idNum must be an integer, got %r" % (idNum,))
-        if idNum in self._orders:
+        if (
+            idNum in self._orders
+            or (self._archive is not None and idNum in self._archive)
+            or (self._columns is not None and idNum in self._columns)
+        ):
             raise DuplicateOrderID("idNum %r is already in use" % (idNum,))
         if idNum >= self._next_idNum:
             self._next_idNum = idNum + 1
         return idNum
 
 
+def _check_levels(levels: int) -> None:
+    """`depth`'s bound: a positive whole number, or an `InvalidOrder`."""
+    if not isinstance(levels, int) or isinstance(levels, bool):
+        raise InvalidOrder(
+            "levels must be an integer, or None for the whole ladder, "
+            "got %r" % (levels,)
+        )
+    if levels < 1:
+        raise InvalidOrder(
+            "levels must be at least 1, got %r: pass None for the whole "
+            "ladder" % (levels,)
+        )
+
+
 def _check_qty(qty: int) -> None:
     """A quantity the engine will work with, or an `InvalidOrder` saying why not.
 
@@ -2435,12 +4723,12 @@ def _check_price(price: Any) -> float:
     with it, as the price at which every fill is worth nothing.
 
     Non-finite is the one that cost a book: `float("nan")` compares false
-    against everything, so a NaN price that rests is never the minimum of its
-    heap, never evicted, and buries every better price underneath it -- a book
-    left crossed between two traders, permanently and silently, and faithfully
-    reproduced by replay. That same property is what the fast path leans on:
-    `0.0 < price` is already false for a NaN and for `-inf`, so the bounded
-    comparison below is the whole finiteness test.
+    against everything, so a NaN price that rested was never the minimum of
+    its heap, never evicted, and buried every better price underneath it -- a
+    book left crossed between two traders, permanently and silently, and
+    faithfully reproduced by replay. That same property is what the fast path
+    leans on: `0.0 < price` is already false for a NaN and for `-inf`, so the
+    bounded comparison below is the whole finiteness test.
     """
     if type(price) is float and 0.0 < price < _INF:
         return price
@@ -2568,7 +4856,7 @@ def _book_line(order: Order) -> str:
     )
 
 
-def _report(trades: list[Trade], tid: int) -> None:
+def _report(trades: Sequence[Trade], tid: int) -> None:
     """Print one line per trade, in the legacy engine's format.
 
     `verbose` output is read by eyeballs and by nothing else; keeping the
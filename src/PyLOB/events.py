@@ -121,6 +121,12 @@ re-derives every execution and takes a fresh identifier for each, reaching the
 same count because it performs the same matches. Whether that agreement is a
 promise or an accident is not currently settled by any requirement.
 
+A replay that starts from a `Checkpoint` is the one place counters are read
+rather than re-derived, because the acceptances that would have pushed them
+are the part it skips. The checkpoint carries all three, folded out of the
+stream it was taken from, and the tail carries on from there by the rules
+above.
+
 Notes for the engine implementer
 --------------------------------
 
@@ -141,7 +147,7 @@ Notes for the engine implementer
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from types import MappingProxyType
@@ -163,6 +169,7 @@ __all__ = [
     "EVENT_TYPES",
     "EVENT_BY_KIND",
     "is_replayable",
+    "Checkpoint",
     "EventSink",
     "ClosableEventSink",
     "close_sink",
@@ -499,6 +506,61 @@ def is_replayable(event: Event) -> bool:
     return True
 
 
+# --------------------------------------------------------------------------
+# checkpoints
+# --------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """The state a stream had reached at `seq`, for a replay to start from.
+
+    Not an event: the engine never emits one, and it has no `KIND`. A sink
+    folds it out of the stream it has already recorded -- `SQLiteSink`'s
+    `checkpoint_every` -- and `replay(tail, checkpoint=...)` loads it into a
+    fresh engine and re-issues only what came after it, which is how the end
+    of a long session is reached without replaying the whole of it.
+
+    **Taken between operations, never inside one.** `seq` is the last event
+    of an operation: the next event in the stream is one `is_replayable`
+    admits, so the tail opens with a command a replayer can re-issue rather
+    than with the fills of a command it never saw.
+
+    **The book, not the store.** `orders` is what was resting, in priority
+    order, and not every order the session accepted: a finished order takes
+    no further part in matching, a recorded stream never refers to one again
+    (a cancel or modify of it was refused, and a refusal emits nothing), and
+    the projections that hold its history are where a reader finds it. The
+    counters carry what the finished orders still decide -- that their
+    identifiers stay used and their priority stamps stay spent.
+
+    Rows are plain tuples, in these column orders:
+
+        instruments  (symbol, currency, last_price)
+        traders      (tid, name, allow_self_matching, commission_min,
+                      commission_max_percnt, commission_per_unit)
+        balances     (tid, symbol, amount)
+        orders       (idNum, tid, instrument, side, price, qty, fulfilled,
+                      value, commission, priority, timestamp)
+
+    `timestamp` is the engine clock at `seq`, and `tick_size` the grid the
+    session was opened with.
+    """
+
+    seq: int
+    timestamp: float
+    tick_size: float
+    next_idNum: int
+    next_priority: int
+    next_trade_id: int
+    instruments: Sequence[tuple[str, str | None, float | None]]
+    traders: Sequence[tuple[int, str, bool, float, float, float]]
+    balances: Sequence[tuple[int, str, float]]
+    orders: Sequence[
+        tuple[int, int, str, Side, float, int, int, float, float, int, float]
+    ]
+
+
 # --------------------------------------------------------------------------
 # the sink protocol
 # --------------------------------------------------------------------------
@@ -529,13 +591,12 @@ class EventSink(Protocol):
     describes what the engine is left holding afterwards.
 
     *Reading* returns an answer that is not merely stale but
-    self-contradictory. A match walk lifts the level it is working off the
-    best-price heap and leaves it in the book, so a sink that asks during a
-    `Filled` sees `getBestAsk` return `None` for a side whose `getWorstAsk`,
-    `snapshot` and `getVolumeAtPrice` all report a resting order at that price
-    -- the disagreement `book-queries` requires never to happen. The engine
-    keeps that promise everywhere a caller of its own methods can stand, and a
-    sink is standing somewhere else.
+    self-contradictory. A taker partway through its walk answers `resting`
+    from no level, so a sink that asks during a `Filled` is told by the order
+    that it rests and by `snapshot` that it does not -- the disagreement
+    `book-queries` requires never to happen. The engine keeps that promise
+    everywhere a caller of its own methods can stand, and a sink is standing
+    somewhere else.
 
     *Calling back* corrupts the walk in progress. Cancelling a maker the walk
     has stepped over -- one of the taker's own, held in place by the
@@ -34,19 +34,39 @@ caller is what lets an unfiltered stream (a `ListSink`'s, which holds the fills
 too) and a filtered one (`read_events(..., replayable_only=True)`, which
 applies the column the sink materialised from the same function) both be
 correct inputs.
+
+**Or from a checkpoint, and only the tail.** A long session reconstructed from
+its first event takes as long to rebuild as it took to run. A `Checkpoint` is
+the state a stream had reached at one `seq`, and `replay(tail,
+checkpoint=...)` starts from it: the engine is loaded with what was resting
+and what the counters and ledgers held, and only the events after it are
+re-issued. `sinks.sqlite.read_checkpoint` finds the latest one at or before a
+target, and `read_events(..., start=...)` reads the tail it leaves::
+
+    checkpoint = read_checkpoint("session.db", seq=target)
+    book, trades = replay(
+        read_events("session.db", start=checkpoint.seq + 1, stop=target + 1),
+        checkpoint=checkpoint,
+    )
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import fields
+from time import perf_counter
+from typing import NamedTuple
 
 from .engine import OrderBook, PyLOBError, Trade
 from .events import (
     STREAM_VERSION,
     Accepted,
     Cancelled,
+    Checkpoint,
     Event,
     EventSink,
+    Filled,
     InstrumentConfigured,
     Modified,
     SessionStarted,
@@ -54,7 +74,7 @@ from .events import (
     is_replayable,
 )
 
-__all__ = ["replay", "ReplayError"]
+__all__ = ["replay", "ReplayError", "verify_replay", "Verification", "Divergence"]
 
 
 class ReplayError(PyLOBError, ValueError):
@@ -73,7 +93,11 @@ class ReplayError(PyLOBError, ValueError):
 
 
 def replay(
-    events: Iterable[Event], *, sink: EventSink | None = None
+    events: Iterable[Event],
+    *,
+    sink: EventSink | None = None,
+    trusted: bool = False,
+    checkpoint: Checkpoint | None = None,
 ) -> tuple[OrderBook, list[Trade]]:
     """Re-issue `events` into a fresh engine; return it and the trades it made.
 
@@ -91,6 +115,36 @@ def replay(
     engine derived, in the order it derived them: the sequence a caller of the
     original session saw, arrived at again rather than read back.
 
+    **`trusted=True`** re-issues each `Accepted` without the input gate. A
+    recorded `Accepted` is the gate's output -- its price already quantized,
+    its quantity already checked, its identifier already unique -- so
+    checking it again proves nothing about a stream this library wrote,
+    and on a long recording it is most of the replay's time. The trusted
+    path skips the coercions, the checks, the `decimal` fallback and the
+    duplicate-identifier lookups, and keeps everything that decides the
+    outcome (`OrderBook._submit_trusted`): the same book, the same trades,
+    and with a `sink` the same stream. `Modified` and `Cancelled` go
+    through the ordinary calls either way; they are a small share of any
+    stream, and their checks read the book rather than the input.
+
+    Trust means what it says. A stream that did not come out of this
+    library's own engine -- hand-built, edited, or decoded by something
+    that is not `sinks.sqlite.decode_event` -- can rebuild a wrong book on
+    the trusted path without raising. Replay it untrusted first.
+
+    **`checkpoint`** starts the replay from a `Checkpoint` rather than from
+    the session's first event: the engine is built with its tick size and
+    loaded with its state (`OrderBook._restore`), and only the events after
+    its `seq` are re-issued -- any at or before it are skipped, so a whole
+    stream is as good an input as its tail. The tail opens with no
+    `SessionStarted`, and one in it is refused as a second session. `trades`
+    are then the tail's executions only, and the engine holds the orders
+    that were resting at the checkpoint and the ones the tail accepted, not
+    the finished orders before it: the projections of the recording are
+    where those are. A `sink` is refused alongside it, since the stream it
+    would record opens part-way through a session with no `SessionStarted`
+    to say how.
+
     Raises `ReplayError` if the stream does not open with a `SessionStarted`,
     if it carries a second one (two sessions' events, which would mix two
     books together), or if its `stream_version` is not the one this release
@@ -99,88 +153,28 @@ def replay(
     """
     book: OrderBook | None = None
     trades: list[Trade] = []
+    after = -1
 
-    for event in events:
-        if not is_replayable(event):
-            continue
-
-        if isinstance(event, SessionStarted):
-            if book is not None:
-                raise ReplayError(
-                    "a second SessionStarted at seq %d: one stream is one "
-                    "session, and replaying two into one engine would mix "
-                    "two books together" % (event.seq,)
-                )
-            if event.stream_version != STREAM_VERSION:
-                raise ReplayError(
-                    "the stream records stream_version %r, and this PyLOB "
-                    "implements %d: an older stream replays wrongly rather "
-                    "than incompletely, which is what the version is for"
-                    % (event.stream_version, STREAM_VERSION)
-                )
-            book = OrderBook(tick_size=event.tick_size, sink=sink)
-            continue
-
-        if book is None:
+    if checkpoint is not None:
+        if sink is not None:
             raise ReplayError(
-                "the stream opens with %s at seq %d, not SessionStarted: "
-                "without it there is no tick size to build an engine with"
-                % (type(event).__name__, event.seq)
+                "a replay from the checkpoint at seq %d cannot be recorded: "
+                "its stream would open part-way through a session, with no "
+                "SessionStarted to say where" % (checkpoint.seq,)
             )
+        book = OrderBook(tick_size=checkpoint.tick_size)
+        book._restore(checkpoint)
+        after = checkpoint.seq
 
-        # Dispatch on the event classes rather than on `KIND` strings: the
-        # union is closed (`events.Event`), so a type checker can see that
-        # every member is handled and a new one would not be.
-        match event:
-            case InstrumentConfigured():
-                book.configure_instrument(event.symbol, event.currency)
-            case TraderConfigured():
-                book.configure_trader(
-                    event.tid,
-                    name=event.name,
-                    allow_self_matching=event.allow_self_matching,
-                    commission_min=event.commission_min,
-                    commission_max_percnt=event.commission_max_percnt,
-                    commission_per_unit=event.commission_per_unit,
-                )
-            case Accepted():
-                # The identifier and timestamp are re-used, not reassigned:
-                # this is the data-replay path, and it is also what re-seeds
-                # the identifier counter past every order in the log.
-                _, made = book.submit(
-                    tid=event.tid,
-                    instrument=event.instrument,
-                    side=event.side,
-                    order_type=event.order_type,
-                    qty=event.qty,
-                    price=event.price,
-                    idNum=event.idNum,
-                    timestamp=event.timestamp,
-                )
-                trades.extend(made)
-            case Modified():
-                # `side`, `qty` and `price` are the whole of `orderUpdate`
-                # (`OrderBook.modifyOrder`). `Modified` also carries the
-                # owner, but a modification cannot change one, and the engine
-                # reads the order's own `tid` when it re-emits.
-                made, _ = book.modifyOrder(
-                    idNum=event.idNum,
-                    orderUpdate=dict(side=event.side, qty=event.qty, price=event.price),
-                    time=event.timestamp,
-                )
-                trades.extend(made)
-            case Cancelled():
-                # Named, both of them: `cancelOrder` takes the side first, and
-                # an identifier passed positionally would silently become one.
-                book.cancelOrder(
-                    side=event.side, idNum=event.idNum, time=event.timestamp
-                )
-            case _:  # pragma: no cover - a replayable kind with no re-issue
-                raise ReplayError(
-                    "no way to re-issue %s at seq %d, which "
-                    "`events.is_replayable` says is an input"
-                    % (type(event).__name__, event.seq)
-                )
+    for event in events:
+        if event.seq <= after or not is_replayable(event):
+            continue
+        if isinstance(event, SessionStarted):
+            book = _open(book, event, sink)
+        elif book is None:
+            raise _no_session(event)
+        else:
+            trades.extend(_reissue(book, event, trusted))
 
     if book is None:
         raise ReplayError(
@@ -188,3 +182,251 @@ def replay(
             "every recorded session opens with"
         )
     return book, trades
+
+
+class Divergence(NamedTuple):
+    """Where a replay first stopped agreeing with the recording it replayed.
+
+    `seq` is the recorded `seq` the disagreement was found at. `recorded` and
+    `replayed` are the two `Filled` events that disagree, and one of them is
+    None when a fill is missing on that side: the recording holds one the
+    rebuilt engine did not make, or the other way about. `diff` names every
+    field the two disagree on as `(field, recorded, replayed)`, and is empty
+    when either is missing. `error` is the engine's refusal when re-issuing
+    the command at `seq` raised instead of matching -- the sharpest
+    divergence there is, since the original engine accepted it.
+    """
+
+    seq: int
+    recorded: Filled | None
+    replayed: Filled | None
+    diff: tuple[tuple[str, object, object], ...]
+    error: str | None = None
+
+
+class Verification(NamedTuple):
+    """The verdict of one `verify_replay`.
+
+    `events` is how many recorded events were read, `fills` how many of
+    them were `Filled` events checked against a re-derived one, and
+    `seconds` the wall time the read and the replay took together. A
+    verification that found a `divergence` stopped there, so all three
+    count up to it and not past it.
+    """
+
+    events: int
+    fills: int
+    seconds: float
+    divergence: Divergence | None
+
+    @property
+    def ok(self) -> bool:
+        """True if every recorded fill was re-derived exactly."""
+        return self.divergence is None
+
+    @property
+    def events_per_second(self) -> float:
+        """Recorded events verified per second of wall time."""
+        return self.events / self.seconds if self.seconds > 0 else 0.0
+
+
+class _FillCollector:
+    """The rebuilt engine's sink: its `Filled` events, oldest first.
+
+    Everything else it emits is discarded. The verifier pops from the left
+    as the recording's own fills arrive, so this never holds more than one
+    command's executions.
+    """
+
+    __slots__ = ("fills",)
+
+    def __init__(self) -> None:
+        self.fills: deque[Filled] = deque()
+
+    def consume(self, event: Event, /) -> None:
+        if type(event) is Filled:
+            self.fills.append(event)
+
+
+def verify_replay(events: Iterable[Event], *, trusted: bool = False) -> Verification:
+    """Replay `events` and check each `Filled` in them as it is re-derived.
+
+    `replay` proves a recording by its end state; this proves it on the way.
+    A full stream carries both halves of the check -- the commands a replay
+    re-issues, and the fills the original engine derived from them -- so
+    each command is re-issued as it is read, and each recorded `Filled`
+    after it is compared with the one the rebuilt engine made, field for
+    field and `seq` included. The first disagreement ends the verification:
+    the rest of `events` is not read, and a generator is left where it
+    stopped. On a long recording that is the difference between learning
+    that a replay diverged and learning where, without paying for the rest.
+
+    `events` must be the *whole* stream -- `sinks.ListSink.events`, or
+    `sinks.sqlite.read_events` without `replayable_only` -- since a filtered
+    one has no fills to check and verifies vacuously. `trusted` is as for
+    `replay`. Engine output other than `Filled` (an IOC remainder's
+    `Cancelled`) is skipped, not checked: the fills are what the ledger and
+    the last price are made from.
+
+    Returns a `Verification`, whose `divergence` is None when every fill
+    agreed. A command the rebuilt engine refuses is a divergence at that
+    command's `seq`, not an exception. Raises `ReplayError` for a stream that
+    is not one session, exactly as `replay` does.
+    """
+    collector = _FillCollector()
+    replayed = collector.fills
+    book: OrderBook | None = None
+    read = checked = 0
+    divergence: Divergence | None = None
+    start = perf_counter()
+
+    for event in events:
+        read += 1
+        if type(event) is Filled:
+            if not replayed:
+                divergence = Divergence(event.seq, event, None, ())
+                break
+            made = replayed.popleft()
+            if made != event:
+                divergence = Divergence(event.seq, event, made, _diff(event, made))
+                break
+            checked += 1
+            continue
+        if not is_replayable(event):
+            continue
+        if replayed:
+            # The rebuilt engine made a fill the recording does not have.
+            made = replayed[0]
+            divergence = Divergence(made.seq, None, made, ())
+            break
+        if isinstance(event, SessionStarted):
+            book = _open(book, event, collector)
+        elif book is None:
+            raise _no_session(event)
+        else:
+            try:
+                _reissue(book, event, trusted)
+            except ReplayError:
+                raise
+            except PyLOBError as exc:
+                divergence = Divergence(event.seq, None, None, (), str(exc))
+                break
+    else:
+        if replayed:
+            made = replayed[0]
+            divergence = Divergence(made.seq, None, made, ())
+        elif book is None:
+            raise ReplayError(
+                "the stream is empty: a replay needs at least the "
+                "SessionStarted every recorded session opens with"
+            )
+
+    return Verification(read, checked, perf_counter() - start, divergence)
+
+
+def _diff(recorded: Filled, replayed: Filled) -> tuple[tuple[str, object, object], ...]:
+    """Every field two fills disagree on, as `(field, recorded, replayed)`."""
+    return tuple(
+        (f.name, getattr(recorded, f.name), getattr(replayed, f.name))
+        for f in fields(Filled)
+        if getattr(recorded, f.name) != getattr(replayed, f.name)
+    )
+
+
+def _open(
+    book: OrderBook | None, event: SessionStarted, sink: EventSink | None
+) -> OrderBook:
+    """The engine a `SessionStarted` builds, or `ReplayError` if it cannot be one."""
+    if book is not None:
+        raise ReplayError(
+            "a second SessionStarted at seq %d: one stream is one "
+            "session, and replaying two into one engine would mix "
+            "two books together" % (event.seq,)
+        )
+    if event.stream_version != STREAM_VERSION:
+        raise ReplayError(
+            "the stream records stream_version %r, and this PyLOB "
+            "implements %d: an older stream replays wrongly rather "
+            "than incompletely, which is what the version is for"
+            % (event.stream_version, STREAM_VERSION)
+        )
+    return OrderBook(tick_size=event.tick_size, sink=sink)
+
+
+def _no_session(event: Event) -> ReplayError:
+    """The refusal for a command that arrives before any `SessionStarted`."""
+    return ReplayError(
+        "the stream opens with %s at seq %d, not SessionStarted: "
+        "without it there is no tick size to build an engine with"
+        % (type(event).__name__, event.seq)
+    )
+
+
+def _reissue(book: OrderBook, event: Event, trusted: bool) -> Sequence[Trade]:
+    """Re-issue one replayable event other than `SessionStarted` into `book`.
+
+    Returns the executions it caused, which is none for configuration.
+    """
+    # Dispatch on the event classes rather than on `KIND` strings: the
+    # union is closed (`events.Event`), so a type checker can see that
+    # every member is handled and a new one would not be.
+    match event:
+        case InstrumentConfigured():
+            book.configure_instrument(event.symbol, event.currency)
+        case TraderConfigured():
+            book.configure_trader(
+                event.tid,
+                name=event.name,
+                allow_self_matching=event.allow_self_matching,
+                commission_min=event.commission_min,
+                commission_max_percnt=event.commission_max_percnt,
+                commission_per_unit=event.commission_per_unit,
+            )
+        case Accepted() if trusted:
+            return book._submit_trusted(
+                event.tid,
+                event.instrument,
+                event.side,
+                event.order_type,
+                event.qty,
+                event.price,
+                event.idNum,
+                event.timestamp,
+            )
+        case Accepted():
+            # The identifier and timestamp are re-used, not reassigned:
+            # this is the data-replay path, and it is also what re-seeds
+            # the identifier counter past every order in the log.
+            _, made = book.submit(
+                tid=event.tid,
+                instrument=event.instrument,
+                side=event.side,
+                order_type=event.order_type,
+                qty=event.qty,
+                price=event.price,
+                idNum=event.idNum,
+                timestamp=event.timestamp,
+            )
+            return made
+        case Modified():
+            # `side`, `qty` and `price` are the whole of `orderUpdate`
+            # (`OrderBook.modifyOrder`). `Modified` also carries the
+            # owner, but a modification cannot change one, and the engine
+            # reads the order's own `tid` when it re-emits.
+            made, _ = book.modifyOrder(
+                idNum=event.idNum,
+                orderUpdate=dict(side=event.side, qty=event.qty, price=event.price),
+                time=event.timestamp,
+            )
+            return made
+        case Cancelled():
+            # Named, both of them: `cancelOrder` takes the side first, and
+            # an identifier passed positionally would silently become one.
+            book.cancelOrder(side=event.side, idNum=event.idNum, time=event.timestamp)
+        case _:  # pragma: no cover - a replayable kind with no re-issue
+            raise ReplayError(
+                "no way to re-issue %s at seq %d, which "
+                "`events.is_replayable` says is an input"
+                % (type(event).__name__, event.seq)
+            )
+    return ()
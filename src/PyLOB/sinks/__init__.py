@@ -4,7 +4,7 @@ A sink is anything with `consume(event)` (`events.EventSink`, a structural
 `Protocol`). Nothing here is required for matching -- ADR-0001 made
 persistence optional, and an engine with no sink attached does no I/O at all.
 
-Two implementations ship:
+Three implementations ship here:
 
 `SQLiteSink` turns the stream into a queryable database off the matching path.
 Its module docstring (`PyLOB.sinks.sqlite`) is the reference for the recorded
@@ -24,19 +24,42 @@ notebook asking "what did the engine emit" does not write it a fourth time:
 
 It has no `close`, holds everything it is given, and is therefore for sessions
 whose size you know. A long run wants `SQLiteSink`.
+
+`BinaryLogSink` (`PyLOB.sinks.binlog`) writes the log and nothing else, into
+memory-mapped segment files, at a quarter of `SQLiteSink`'s cost.
+`read_binary_log` reads it back for `replay`, and `convert_binary_log` turns
+it into the database `SQLiteSink` would have written, when the projections
+are wanted after all.
+
+A fourth, `PyLOB.sinks.process.SQLiteProcessSink`, runs a `SQLiteSink` in a
+child process, for a session with a core to spare. It is imported from its
+module and not from here, since it brings in `multiprocessing`.
 """
 
 from ..events import Event
+from .binlog import (
+    DEFAULT_INDEX_EVERY,
+    DEFAULT_SEGMENT_SIZE,
+    BinaryLogSink,
+    BinaryRecord,
+    check_binary_log,
+    convert_binary_log,
+    read_binary_log,
+    read_binary_records,
+)
 from .sqlite import (
     MIN_READABLE_SCHEMA_VERSION,
     SCHEMA_VERSION,
     EventLogError,
     IncompleteLogError,
     SQLiteSink,
+    book_at,
     check_log,
     decode_event,
+    read_checkpoint,
     read_events,
     read_meta,
+    rebuild_projections,
 )
 
 __all__ = [
@@ -48,8 +71,19 @@ __all__ = [
     "IncompleteLogError",
     "check_log",
     "decode_event",
+    "read_checkpoint",
     "read_events",
     "read_meta",
+    "book_at",
+    "rebuild_projections",
+    "BinaryLogSink",
+    "BinaryRecord",
+    "DEFAULT_SEGMENT_SIZE",
+    "DEFAULT_INDEX_EVERY",
+    "check_binary_log",
+    "convert_binary_log",
+    "read_binary_log",
+    "read_binary_records",
 ]
 
 
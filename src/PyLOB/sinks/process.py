@@ -0,0 +1,340 @@
+"""Recording in another process: `SQLiteSink`, with the matching process spared it.
+
+`SQLiteSink(threaded=True)` takes the flush off the matching thread and
+leaves it in the matching process, where the fold's Python and the payload
+encoding still take the GIL from matching. `SQLiteProcessSink` takes them out
+of the process. A child process runs an ordinary `SQLiteSink` -- the same
+fold, the same salvage, the same `event_loss` and `session_end` -- and the
+matching process keeps only a buffer. Every `buffer_size` events it turns
+the buffer into rows of plain values, `(kind, fields)`, and sends them down
+a `multiprocessing` pipe; the child rebuilds each event from its row and
+consumes it. The file it writes is the file an in-process sink with the same
+options would have written.
+
+**What the matching process pays.** One list append per event, and per
+buffer one tuple per event and one pickle of the list. A list of tuples of
+plain values is pickle's fast path: on the replay suite's workload it
+measured 1.3 us an event, where pickling the event objects themselves costs
+6 us, and the in-process flush this replaces costs about 25. The pipe is the
+backpressure: a child that cannot keep up fills it, and the `consume` that
+sends the next buffer waits.
+
+The work moves; it does not go away. The child still folds and writes every
+event, and it needs a core of its own to do it beside matching. Recording
+those 28k events took 0.07 s of the matching process's CPU against 0.89 s
+in-process. On a single-core machine, though, `python -m PyLOB.bench
+--process-sink` measured the sink-attached pass slower than the inline
+sink's, 9.2k orders/sec against 11.2k, because the child took turns with
+matching for the one core and the pipe added to the total.
+
+Ending, and the parent dying
+----------------------------
+
+`close` sends the tail, tells the child to close its sink, and waits for the
+answer. That is `SQLiteSink.close` in the child: the last flush, then the
+`session_end` row. A loss the child's sink made comes back over the pipe and
+is raised here, by `flush` the first time and by `close` every time, as the
+in-process sink raises it. `event_loss` records it in the file as always.
+
+A parent that dies without closing closes its end of the pipe all the same.
+The operating system does it for a killed process, and the sink's finalizer
+does it for one that exits, or drops the sink, without calling `close`. The
+child reads that as the session ending undeliberately. It commits every event
+it was sent, then stops without a `session_end` row, so `check_log` reads the
+file as incomplete, which is what it is. The events still in the parent's
+buffer are lost with it, as they would be with an in-process sink, and the
+file's lack of an end row is what says so. The child ignores SIGINT, so a
+Ctrl-C in a terminal, which signals the whole process group, interrupts the
+session and not its recording.
+
+A child that dies is the case a file cannot report on, because its writer is
+gone. The parent notices at its next send or `flush` and remembers a
+`RuntimeError` that `flush` and `close` raise from then on. Nothing more is
+sent: what the child had not committed and everything after it is lost, and
+the file, with no `session_end` row, reads as incomplete.
+
+Not imported by `PyLOB` or by `PyLOB.sinks`, since it brings in
+`multiprocessing`::
+
+    from PyLOB.sinks.process import SQLiteProcessSink
+
+    with SQLiteProcessSink("session.db") as sink:
+        book = OrderBook(tick_size=0.01, sink=sink)
+        ...
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import signal
+from collections.abc import Mapping
+from contextlib import suppress
+from multiprocessing import get_context
+from multiprocessing.util import Finalize
+from typing import Any
+
+from ..events import EVENT_BY_KIND, Event
+from .sqlite import _LAYOUTS, DEFAULT_BUFFER_SIZE, SQLiteSink
+
+__all__ = ["SQLiteProcessSink"]
+
+
+def _portable(exc: BaseException) -> BaseException:
+    """`exc`, or a `RuntimeError` naming it if it would not survive a pickle."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def _record(conn: Any, parent: Any, path: str, options: dict[str, Any]) -> None:
+    """The child's whole life: one `SQLiteSink`, fed over `conn` until it ends.
+
+    Answers once on opening, `("ok", None)` or `("error", exc)`, then reads
+    `(request, rows)` messages. `"events"` is consumed without an answer;
+    `"flush"` and `"close"` are answered with the loss the parent has not yet
+    been told of, if any. `"abandon"`, or the pipe closing, is the parent
+    gone without closing: write what arrived, and close the connection
+    without the end row.
+
+    `parent` is the other end of the pipe, which a forked child inherits and
+    must not hold, or the parent's death would never reach it as an EOF.
+    """
+    parent.close()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        sink = SQLiteSink(path, **options)
+    except Exception as exc:
+        conn.send(("error", _portable(exc)))
+        return
+    conn.send(("ok", None))
+    consume = sink.consume
+    reported: Exception | None = None
+    try:
+        while True:
+            request, rows = conn.recv()
+            if request == "events":
+                for kind, values in rows:
+                    consume(EVENT_BY_KIND[kind](*values))
+            elif request == "flush":
+                with suppress(Exception):  # the sink has remembered it
+                    sink.flush()
+                lost = sink.error if sink.error is not reported else None
+                reported = sink.error
+                conn.send(("ok", None) if lost is None else ("error", _portable(lost)))
+            elif request == "close":
+                try:
+                    sink.close()
+                except Exception as exc:
+                    conn.send(("error", _portable(exc)))
+                else:
+                    conn.send(("ok", None))
+                return
+            else:
+                break
+    except (EOFError, OSError):
+        pass
+    with suppress(Exception):  # recorded in `event_loss`, if anywhere
+        sink.flush()
+    sink.connection.close()
+
+
+def _abandon(conn: Any, process: Any) -> None:
+    """Tell the child the session ends unclosed, and wait for it to finish.
+
+    Said rather than left to the pipe's EOF, because a process forked since
+    holds a copy of this end and would keep the pipe open. A child that has
+    already gone finds the message refused, which is what it would say.
+    """
+    with suppress(OSError):
+        conn.send(("abandon", None))
+    conn.close()
+    process.join()
+
+
+class SQLiteProcessSink:
+    """Records an event stream into a SQLite database from a child process.
+
+    Satisfies `events.EventSink`, and `events.ClosableEventSink` once you
+    count `close`, as `SQLiteSink` does:
+
+        with SQLiteProcessSink("session.db") as sink:
+            book = OrderBook(sink=sink)
+            ...
+
+    `buffer_size`, `meta`, `checkpoint_every` and `log_only` are the child's
+    `SQLiteSink`'s and mean what they mean there. `buffer_size` is also how
+    many events go down the pipe at a time. `start_method` is
+    `multiprocessing`'s, as for `ShardedOrderBook`.
+
+    Opening waits for the child to open the database, so a path, a `meta` or
+    an option that `SQLiteSink` refuses is refused here, with its exception.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        meta: Mapping[str, str | int | float | bool] | None = None,
+        checkpoint_every: int | None = None,
+        log_only: bool = False,
+        start_method: str | None = None,
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be >= 1, got {buffer_size}")
+        self._buffer_size = buffer_size
+        self._buffer: list[Event] = []
+        self._error: Exception | None = None
+        self._closed = False
+
+        context = get_context(start_method)
+        parent, child = context.Pipe()
+        options = {
+            "buffer_size": buffer_size,
+            "meta": None if meta is None else dict(meta),
+            "checkpoint_every": checkpoint_every,
+            "log_only": log_only,
+        }
+        self._process = context.Process(
+            target=_record,
+            args=(child, parent, os.fspath(path), options),
+            name="SQLiteProcessSink recorder",
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+        self._conn: Any = parent
+        # Run by `close`, by the sink being dropped unclosed, and at exit --
+        # where a priority is what puts it before `multiprocessing` terminates
+        # its daemonic children, so that the child writes what it was sent.
+        self._finalize = Finalize(
+            self, _abandon, args=(parent, self._process), exitpriority=0
+        )
+        try:
+            status, exc = parent.recv()
+        except (EOFError, OSError):
+            status = "error"
+            exc = RuntimeError(
+                f"the recording process exited before opening {os.fspath(path)!r}"
+            )
+        if status == "error":
+            self._closed = True
+            self._finalize()
+            raise exc
+
+    # -- the sink protocol -------------------------------------------------
+
+    def consume(self, event: Event, /) -> None:
+        """Record one event.
+
+        Does not raise on the recording's account, and raises after `close`,
+        both for `SQLiteSink.consume`'s reasons. The matching process pays for
+        one list append and, every `buffer_size` events, for sending them.
+        """
+        if self._closed:
+            raise RuntimeError(
+                f"SQLiteProcessSink is closed: it cannot record "
+                f"{type(event).__name__} at seq {event.seq}"
+            )
+        self._buffer.append(event)
+        if len(self._buffer) >= self._buffer_size:
+            self._send()
+
+    def flush(self) -> None:
+        """Send everything buffered and wait for the child to write it.
+
+        Raises if and only if events were lost: a loss the child's sink made
+        since the last `flush` said so, or the child itself gone. Either is
+        remembered, for `close` to raise.
+        """
+        if self._closed:
+            return
+        self._send()
+        self._ask("flush")
+
+    def close(self) -> None:
+        """Send the tail, close the child's sink, and wait for the child to end.
+
+        Idempotent, and raises what was lost on every call, as
+        `SQLiteSink.close` does. The `session_end` row is the child sink's to
+        write, and it writes it even when events were lost.
+        """
+        if not self._closed:
+            self._closed = True
+            try:
+                with suppress(Exception):  # `_ask` has remembered it
+                    self._send()
+                    self._ask("close")
+            finally:
+                self._finalize()
+        if self._error is not None:
+            raise self._error
+
+    # -- the pipe ----------------------------------------------------------
+
+    def _send(self) -> None:
+        """Hand the buffer to the child as rows of plain values."""
+        if not self._buffer:
+            return
+        buffered, self._buffer = self._buffer, []
+        if self._conn is None:
+            return
+        rows = [(event.KIND, _LAYOUTS[event.KIND].get(event)) for event in buffered]
+        try:
+            self._conn.send(("events", rows))
+        except OSError:
+            self._gone()
+
+    def _ask(self, request: str) -> None:
+        """Send `request` and raise the loss the child answers with, if any."""
+        if self._conn is None:
+            raise self._error  # type: ignore[misc]
+        try:
+            self._conn.send((request, None))
+            status, exc = self._conn.recv()
+        except (EOFError, OSError):
+            self._gone()
+            raise self._error  # type: ignore[misc]
+        if status == "error":
+            self._error = exc
+            raise exc
+
+    def _gone(self) -> None:
+        """The child is dead: remember it, and send it nothing more."""
+        self._conn = None
+        self._process.join()
+        self._error = RuntimeError(
+            f"the recording process exited unexpectedly (exit code "
+            f"{self._process.exitcode}): the events it had not committed, and "
+            f"every one after them, were not recorded"
+        )
+
+    # -- accessors ---------------------------------------------------------
+
+    @property
+    def buffered(self) -> int:
+        """Events accepted but not yet sent to the child."""
+        return len(self._buffer)
+
+    @property
+    def error(self) -> Exception | None:
+        """The latest loss reported to this process, or None if there was none.
+
+        Only what a `flush` has asked the child about: a loss in a buffer
+        written since is the child's until the next `flush` or `close`.
+        """
+        return self._error
+
+    @property
+    def pid(self) -> int | None:
+        """The recording process's id."""
+        return self._process.pid
+
+    def __enter__(self) -> SQLiteProcessSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
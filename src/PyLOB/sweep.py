@@ -0,0 +1,337 @@
+"""Sweeps: many short episodes over a seed grid, fanned out over processes.
+
+The README's pattern for a sweep is a fresh `OrderBook` per episode, run
+sinkless, with a `SQLiteSink(meta=...)` on the few episodes worth keeping
+(ADR-0006: an episode is a fresh engine, and there is no `reset()`). This is
+that pattern, once, so that a study does not rebuild it by hand:
+
+    from PyLOB.sweep import sweep
+
+    results = sweep("mixed-v1", seeds=range(64), orders=5_000,
+                    record={0, 17}, directory="runs/")
+
+or from a shell::
+
+    python -m PyLOB.sweep --workload mixed-v1 --seeds 0-63 --orders 5000 \\
+        --record 0,17 --directory runs/
+
+**An episode** is either a named workload from `bench.workloads` -- the
+book is configured as the benchmark configures it, and the workload's ops
+are submitted in order -- or a callable of the caller's own, given a fresh
+configured-by-nobody `OrderBook` and the episode's seed, which drives the
+book however it likes and returns whatever it wants reported. Either way the
+runner builds the book, attaches a sink only if the episode is one of
+`record`, and reads the summary off the book when the episode returns.
+
+**What crosses the process boundary is small, on purpose.** A worker sends
+back an `EpisodeResult` -- a handful of numbers, the ledger, the callable's
+own return value -- and never the book. Shipping a book back costs a pickle
+of every order it ever held, which is where a hand-rolled sweep spends the
+time it thought it was saving. It also means a callable's return value must
+be picklable, and that a callable must be importable by name (a function at
+module level, not a lambda), because `ProcessPoolExecutor` sends it by
+reference.
+
+**Chunking.** Episodes go to the pool in chunks, `chunksize` per dispatch:
+by default enough to give each worker about four chunks, which keeps the
+per-task overhead off short episodes without leaving a worker idle behind a
+slow last chunk. `workers=1` runs every episode in this process, in order,
+and is what a debugger wants.
+
+Results come back in grid order, one `EpisodeResult` per seed, whatever
+order the workers finished in.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+from collections.abc import Callable, Collection, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any, NamedTuple
+
+from .bench import workloads as workloads_module
+from .bench.runner import build_book
+from .engine import OrderBook
+
+__all__ = ["EpisodeResult", "sweep", "main"]
+
+#: What a caller-supplied episode is: the fresh book, and the episode's seed.
+Episode = Callable[[OrderBook, int], Any]
+
+
+class EpisodeResult(NamedTuple):
+    """One episode, summarized in the worker that ran it.
+
+    `orders` and `trades` are what the engine accepted and executed.
+    `trades` is None for a callable episode, whose submissions never pass
+    through the runner: it returns its own count in `result` if it wants one.
+    `seconds` is wall time inside the episode (building the book excluded),
+    `last_prices` is `(instrument, price)` for every instrument with a book,
+    and `holdings` is the ledger as `OrderBook.holdings` yields it, sorted.
+    `path` is the database the episode was recorded to, or None if it ran
+    sinkless. `result` is the episode callable's return value, and None for
+    a named workload.
+    """
+
+    episode: int
+    seed: int
+    orders: int
+    trades: int | None
+    seconds: float
+    last_prices: tuple[tuple[str, float | None], ...]
+    holdings: tuple[tuple[int, str, float], ...]
+    path: str | None
+    result: Any
+
+
+def sweep(
+    workload: str | Episode,
+    seeds: Iterable[int],
+    *,
+    orders: int | None = None,
+    record: Collection[int] = (),
+    directory: str | os.PathLike[str] | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    tick_size: float = 0.01,
+) -> list[EpisodeResult]:
+    """Run one episode per seed and return their results in grid order.
+
+    `workload` is a `bench.workloads` name or an `Episode` callable; `orders`
+    overrides a named workload's canonical length and means nothing to a
+    callable. Episode `i` is the `i`-th seed of `seeds`.
+
+    `record` names the episodes -- by index in the grid, not by seed, since
+    a grid may repeat a seed -- to record to `directory`, one database each,
+    `episode-NNNN.db`, with `seed`, `episode` and `workload` in its
+    `session_meta`. A directory is required when anything is recorded, and
+    is created if missing; an existing database is refused by the sink, as
+    it always is, rather than appended to.
+
+    `workers` is the pool size, `os.cpu_count()` by default, and `tick_size`
+    the grid of a callable's book. A named workload uses its own.
+    """
+    grid = list(seeds)
+    name = workload if isinstance(workload, str) else _callable_name(workload)
+    if isinstance(workload, str) and workload not in workloads_module.WORKLOADS:
+        raise ValueError(
+            "unknown workload %r; known: %s"
+            % (workload, ", ".join(sorted(workloads_module.WORKLOADS)))
+        )
+    recorded = set(record)
+    if recorded:
+        if directory is None:
+            raise ValueError("recording episodes needs a directory to put them in")
+        stray = sorted(recorded.difference(range(len(grid))))
+        if stray:
+            raise ValueError(
+                "record names episodes %s, but the grid has %d" % (stray, len(grid))
+            )
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+    tasks = [
+        (
+            workload,
+            name,
+            episode,
+            seed,
+            orders,
+            tick_size,
+            None if episode not in recorded else _episode_path(directory, episode),
+        )
+        for episode, seed in enumerate(grid)
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        return [_run_episode(task) for task in tasks]
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_episode, tasks, chunksize=chunksize))
+
+
+def _episode_path(directory: str | os.PathLike[str] | None, episode: int) -> str:
+    assert directory is not None
+    return str(Path(directory) / ("episode-%04d.db" % (episode,)))
+
+
+def _callable_name(episode: Episode) -> str:
+    return "%s:%s" % (episode.__module__, episode.__qualname__)
+
+
+def _run_episode(task: tuple[Any, ...]) -> EpisodeResult:
+    """One episode, start to finish, in whichever process it landed in."""
+    workload, name, episode, seed, orders, tick_size, path = task
+    sink = None
+    if path is not None:
+        from .sinks.sqlite import SQLiteSink
+
+        sink = SQLiteSink(
+            path, meta={"seed": seed, "episode": episode, "workload": name}
+        )
+
+    result = None
+    trades = None
+    book = None
+    # Closed whatever the episode does, so that a callable that raises does
+    # not leave its recording unflushed in a pool worker. The exception is
+    # the episode's, and goes on to the caller.
+    try:
+        if isinstance(workload, str):
+            ops = workloads_module.generate(workload, seed, orders)
+            spec = workloads_module.WORKLOADS[workload]
+            book = build_book(spec, sink)
+            instrument = workloads_module.INSTRUMENT
+            submit = book.submit_quiet
+            trades = 0
+            start = perf_counter()
+            for tid, side, order_type, qty, price, _kind in ops:
+                trades += submit(tid, instrument, side, order_type, qty, price).trades
+            seconds = perf_counter() - start
+        else:
+            book = OrderBook(tick_size=tick_size, sink=sink)
+            start = perf_counter()
+            result = workload(book, seed)
+            seconds = perf_counter() - start
+    finally:
+        if book is not None:
+            book.close()
+        elif sink is not None:
+            sink.close()
+
+    return EpisodeResult(
+        episode=episode,
+        seed=seed,
+        orders=sum(1 for _ in book.orders()),
+        trades=trades,
+        seconds=seconds,
+        last_prices=tuple(
+            (symbol, book.getLastPrice(symbol)) for symbol in book.instruments()
+        ),
+        holdings=tuple(sorted(book.holdings())),
+        path=path,
+        result=result,
+    )
+
+
+# -- the command line ------------------------------------------------------
+
+
+def _seed_grid(text: str) -> list[int]:
+    """`"0-7,12,20-21"` as `[0, ..., 7, 12, 20, 21]`. Ranges are inclusive."""
+    grid: list[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        try:
+            if dash:
+                grid.extend(range(int(first), int(last) + 1))
+            else:
+                grid.append(int(first))
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                "%r is not a seed or an inclusive range of seeds" % (part,)
+            ) from None
+    if not grid:
+        raise argparse.ArgumentTypeError("the seed grid is empty")
+    return grid
+
+
+def _episode_callable(text: str) -> Episode:
+    """`"package.module:function"`, imported."""
+    module, colon, attribute = text.partition(":")
+    if not colon or not module or not attribute:
+        raise argparse.ArgumentTypeError("%r is not module:function" % (text,))
+    try:
+        target = importlib.import_module(module)
+        for piece in attribute.split("."):
+            target = getattr(target, piece)
+    except (ImportError, AttributeError) as exc:
+        raise argparse.ArgumentTypeError("cannot import %r: %s" % (text, exc)) from None
+    if not callable(target):
+        raise argparse.ArgumentTypeError("%r is not callable" % (text,))
+    return target
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m PyLOB.sweep",
+        description=(
+            "Run one fresh-engine episode per seed over a process pool, and "
+            "print one JSON object per episode in grid order."
+        ),
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--workload",
+        choices=sorted(workloads_module.WORKLOADS),
+        help="a bench.workloads name",
+    )
+    source.add_argument(
+        "--episode",
+        type=_episode_callable,
+        help="module:function taking (book, seed); its return value is "
+        "reported, and must be JSON-serializable here",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=_seed_grid,
+        required=True,
+        help="seeds and inclusive ranges, e.g. 0-31,40",
+    )
+    parser.add_argument(
+        "--orders", type=int, default=None, help="override a workload's length"
+    )
+    parser.add_argument(
+        "--record",
+        type=_seed_grid,
+        default=[],
+        help="episode indices to record, e.g. 0,5-7 (needs --directory)",
+    )
+    parser.add_argument("--directory", type=Path, default=None)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="default: one per core"
+    )
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument(
+        "--tick-size",
+        type=float,
+        default=0.01,
+        help="an --episode book's tick (default: %(default)s)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.record and args.directory is None:
+        parser.error("--record needs --directory")
+    try:
+        results = sweep(
+            args.workload or args.episode,
+            args.seeds,
+            orders=args.orders,
+            record=args.record,
+            directory=args.directory,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            tick_size=args.tick_size,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    for result in results:
+        print(json.dumps(result._asdict()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
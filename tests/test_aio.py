@@ -0,0 +1,142 @@
+"""`PyLOB.aio.AsyncOrderBook`: coroutines in, the engine's own calls out.
+
+The main check drives a front with many concurrent coroutines and gives a
+plain engine the same calls in the order the front received them; the
+results, the stream and the book must match. The rest check that a refusal
+reaches only its own caller, that a cancelled request is never made, that a
+full batch does not wait out `linger`, that modifies and cancels reach the
+engine in turn, and that a closed front refuses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+from PyLOB import InvalidOrder, OrderBook, UnknownOrder
+from PyLOB.aio import AsyncOrderBook
+from PyLOB.sinks import ListSink
+
+
+def engine():
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink)
+    book.configure_instrument("FAKE", "USD")
+    return book, sink
+
+
+def test_concurrent_submissions_run_as_the_calls_they_are():
+    async def agent(front, tid, rng, log):
+        for _ in range(40):
+            side = rng.choice(("bid", "ask"))
+            price = round(rng.gauss(100.0, 0.3), 2)
+            qty = rng.randint(1, 9)
+            order, trades = await front.submit(tid, "FAKE", side, "limit", qty, price)
+            log.append(((tid, "FAKE", side, "limit", qty, price), order.idNum, trades))
+
+    async def session():
+        book, sink = engine()
+        log = []
+        async with AsyncOrderBook(book, max_batch=16) as front:
+            await asyncio.gather(
+                *(agent(front, tid, random.Random(tid), log) for tid in range(1, 9))
+            )
+        return front, book, sink, log
+
+    front, book, sink, log = asyncio.run(session())
+    stats = front.stats()
+    assert stats.requests == 320 and stats.withdrawn == 0
+    assert 1 < stats.largest_batch <= 16 and stats.mean_batch > 1
+
+    direct, direct_sink = engine()
+    for op, idNum, trades in sorted(log, key=lambda entry: entry[1]):
+        again, again_trades = direct.submit(*op)
+        assert again.idNum == idNum and again_trades == trades
+    assert sink.events == direct_sink.events
+    assert sorted(book.holdings()) == sorted(direct.holdings())
+
+
+def test_a_refusal_is_raised_to_its_caller_alone():
+    async def session():
+        book, _ = engine()
+        front = AsyncOrderBook(book)
+        results = await asyncio.gather(
+            front.submit(1, "FAKE", "ask", "limit", 5, 100.0),
+            front.submit(2, "FAKE", "bid", "limit", 0, 100.0),
+            front.cancel(99),
+            front.submit(2, "FAKE", "bid", "limit", 2, 100.0),
+            return_exceptions=True,
+        )
+        await front.close()
+        return front, results
+
+    front, (resting, refused, unknown, taker) = asyncio.run(session())
+    assert isinstance(refused, InvalidOrder)
+    assert isinstance(unknown, UnknownOrder)
+    assert resting[0].fulfilled == 2 and len(taker[1]) == 1
+    assert front.stats().batches == 1 and front.stats().requests == 4
+
+
+def test_a_request_withdrawn_before_its_turn_is_never_made():
+    async def session():
+        book, sink = engine()
+        front = AsyncOrderBook(book, linger=60.0)
+        kept = asyncio.ensure_future(front.submit(1, "FAKE", "bid", "limit", 1, 99.0))
+        dropped = asyncio.ensure_future(
+            front.submit(2, "FAKE", "bid", "limit", 1, 98.0)
+        )
+        await asyncio.sleep(0)
+        assert front.queue_depth == 2
+        dropped.cancel()
+        await front.close()
+        return front, book, await kept
+
+    front, book, (order, _) = asyncio.run(session())
+    assert [o.idNum for o in book.orders()] == [order.idNum]
+    assert front.stats().withdrawn == 1 and front.stats().requests == 1
+
+
+def test_a_full_batch_does_not_wait_out_its_linger():
+    async def session():
+        book, _ = engine()
+        front = AsyncOrderBook(book, max_batch=4, linger=60.0)
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(front.submit(1, "FAKE", "bid", "limit", 1, 99.0) for _ in range(4))
+            ),
+            timeout=5,
+        )
+        return front.stats()
+
+    assert asyncio.run(session()).batches == 1
+
+
+def test_modify_and_cancel_reach_the_engine_in_turn():
+    async def session():
+        book, _ = engine()
+        async with AsyncOrderBook(book) as front:
+            order, _ = await front.submit(1, "FAKE", "bid", "limit", 5, 99.0)
+            modified, trades = await front.modify(order.idNum, qty=3)
+            quiet = await front.submit_quiet(2, "FAKE", "ask", "limit", 1, 99.0)
+            cancelled = await front.cancel(order.idNum)
+        return order, modified, trades, quiet, cancelled
+
+    order, modified, trades, quiet, cancelled = asyncio.run(session())
+    assert modified is order and cancelled is order and not trades
+    assert quiet.filled == 1 and order.cancelled and order.fulfilled == 1
+
+
+def test_a_closed_front_refuses_and_bad_settings_are_refused():
+    async def session():
+        book, _ = engine()
+        front = AsyncOrderBook(book)
+        await front.close()
+        await front.close()
+        with pytest.raises(InvalidOrder):
+            await front.submit(1, "FAKE", "bid", "limit", 1, 99.0)
+
+    asyncio.run(session())
+    for bad in ({"max_batch": 0}, {"max_batch": 2.5}, {"linger": -1.0}):
+        with pytest.raises(InvalidOrder):
+            AsyncOrderBook(OrderBook(), **bad)
@@ -0,0 +1,117 @@
+"""`subscribe_bbo`: the touch, once per operation, and only when it moved.
+
+Two promises. Every report is the touch `getBestBid`/`getBestAsk` and
+`getVolumeAtPrice` would have read after that operation; and no operation
+that left the touch as it was reports at all. A randomized session checks
+both against a poller that re-reads the touch after every call.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from PyLOB import InvalidOrder, OrderBook, TopOfBook
+
+
+def polled(book, symbol="FAKE"):
+    bid, ask = book.getBestBid(symbol), book.getBestAsk(symbol)
+    return TopOfBook(
+        symbol,
+        bid,
+        0 if bid is None else book.depth(symbol, "bid", 1)[0][1],
+        ask,
+        0 if ask is None else book.depth(symbol, "ask", 1)[0][1],
+    )
+
+
+@pytest.mark.parametrize("layout", [{}, {"columnar": True}, {"archive": True}])
+def test_reports_are_exactly_the_operations_that_moved_the_touch(layout):
+    book = OrderBook(tick_size=0.01, **layout)
+    reports = []
+    book.subscribe_bbo("FAKE", reports.append)
+    assert reports == [TopOfBook("FAKE", None, 0, None, 0)]
+
+    rng = random.Random(9)
+    ids = []
+    last = reports[0]
+    quiet = 0
+    for _ in range(2000):
+        before = len(reports)
+        roll = rng.random()
+        try:
+            if roll < 0.15 and ids:
+                book.cancel(rng.choice(ids))
+            elif roll < 0.25 and ids:
+                book.modify(rng.choice(ids), qty=rng.randint(1, 9))
+            elif roll < 0.3 and ids:
+                book.modify(rng.choice(ids), price=round(rng.gauss(100, 0.5), 2))
+            elif roll < 0.35:
+                book.submit_many(
+                    "FAKE",
+                    [(1, "bid", "limit", 2, 99.0), (2, "ask", "limit", 2, 101.0)],
+                )
+            else:
+                kind = "market" if roll > 0.95 else "limit"
+                price = None if kind == "market" else round(rng.gauss(100, 0.5), 2)
+                side = rng.choice(("bid", "ask"))
+                order, _ = book.submit(
+                    rng.randint(1, 3), "FAKE", side, kind, rng.randint(1, 9), price
+                )
+                ids.append(order.idNum)
+        except InvalidOrder:
+            pass
+        now = polled(book)
+        if roll >= 0.35 or roll < 0.3:
+            assert len(reports) - before == (now != last)
+        assert reports[-1] == now
+        quiet += len(reports) == before
+        last = now
+    assert quiet > 200
+
+
+def test_a_walk_reports_once_and_a_change_behind_the_touch_not_at_all():
+    book = OrderBook(tick_size=0.01)
+    for price in (101.0, 101.5, 102.0):
+        book.submit(1, "FAKE", "ask", "limit", 2, price)
+    reports = []
+    book.subscribe_bbo("FAKE", reports.append)
+
+    book.submit(2, "FAKE", "bid", "limit", 5, 101.5)
+    assert reports[1:] == [TopOfBook("FAKE", 101.5, 1, 102.0, 2)]
+
+    book.submit(3, "FAKE", "bid", "limit", 7, 99.0)
+    book.submit(3, "FAKE", "ask", "limit", 7, 105.0)
+    assert len(reports) == 2
+
+
+def test_a_handle_and_the_halves_of_submit_report_too():
+    book = OrderBook(tick_size=0.01)
+    handle = book.instrument("FAKE")
+    reports = []
+    book.subscribe_bbo("FAKE", reports.append)
+
+    handle.submit(1, "bid", "limit", 3, 99.0)
+    order = book.create_order(2, "FAKE", "bid", "limit", 1, 99.5)
+    assert len(reports) == 2
+    book.match(order)
+    assert len(reports) == 2
+    book.rest(order)
+    assert reports[-1] == TopOfBook("FAKE", 99.5, 1, None, 0)
+
+
+def test_unsubscribing_the_last_takes_the_touch_off_the_feed():
+    book = OrderBook(tick_size=0.01)
+    first, second = [], []
+    book.subscribe_bbo("FAKE", first.append)
+    book.subscribe_bbo("FAKE", second.append)
+    book.submit(1, "FAKE", "bid", "limit", 1, 99.0)
+    assert len(first) == len(second) == 2
+
+    book.unsubscribe_bbo("FAKE", first.append)
+    book.submit(1, "FAKE", "bid", "limit", 1, 99.5)
+    assert len(first) == 2 and len(second) == 3
+    book.unsubscribe_bbo("FAKE", second.append)
+    assert book.book("FAKE").bids._feed is None
+    with pytest.raises(InvalidOrder):
+        book.unsubscribe_bbo("FAKE", second.append)
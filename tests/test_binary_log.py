@@ -0,0 +1,384 @@
+"""The binary log: `BinaryLogSink`, read back, replayed and converted.
+
+`PyLOB.sinks.binlog` makes four claims, and each is held down here:
+
+    the log reads back as the stream it was given, exactly, however it is
+    split into segments and however much of its index is missing
+                                    `test_a_binary_log_reads_back_*`
+                                    `test_start_and_stop_read_*`
+
+    it plugs into `replay` as `read_events` does
+                                    `test_a_replay_from_a_binary_log_*`
+
+    a killed sink leaves every event `consume` returned from, and a sink
+    that could not write stops and says so; neither log reads as complete
+                                    `test_a_killed_sink_*`
+                                    `test_a_full_disk_stops_the_recording_*`
+
+    `convert_binary_log` writes the database `SQLiteSink` would have
+                                    `test_a_converted_log_is_the_database_*`
+
+The sessions are the replay suite's workload, borrowed as
+`test_sink_durability.py` borrows it, and that suite's synthetic stream for
+what the engine would not emit.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import signal
+import sqlite3
+import subprocess
+import sys
+from dataclasses import astuple
+from dataclasses import replace as replace_field
+
+import pytest
+from PyLOB import replay
+from PyLOB.engine import OrderBook
+from PyLOB.events import is_replayable
+from PyLOB.sinks import ListSink
+from PyLOB.sinks.binlog import (
+    _END_PAYLOAD,
+    _INDEX_ENTRY,
+    _RECORD,
+    BinaryLogSink,
+    check_binary_log,
+    convert_binary_log,
+    read_binary_log,
+    read_binary_records,
+)
+from PyLOB.sinks.sqlite import (
+    EventLogError,
+    IncompleteLogError,
+    SQLiteSink,
+    check_log,
+    read_events,
+)
+
+import test_replay as replay_suite
+from test_sink_durability import by_rowid, dump, ended, session, stream, trader
+
+# --------------------------------------------------------------------------
+# sessions
+# --------------------------------------------------------------------------
+
+
+def record(sink, seed=5, n_ops=600):
+    """The replay suite's workload into `sink`, beside a `ListSink` of it.
+
+    Returns the engine and the events it emitted. The engine is not closed:
+    the caller closes the sink, or does not.
+    """
+    listed = ListSink()
+    book = replay_suite.configure(OrderBook(tick_size=replay_suite.TICK, sink=listed))
+    replay_suite.run_workload(book, random.Random(seed), n_ops=n_ops)
+    for event in listed.events:
+        sink.consume(event)
+    return book, listed.events
+
+
+def write(path, events, **options):
+    """`events` into a new binary log at `path`, closed."""
+    with BinaryLogSink(path, **options) as sink:
+        for event in events:
+            sink.consume(event)
+
+
+def exactly(events):
+    """Events with the type of each field, which `==` on dataclasses ignores."""
+    return [(event, [type(value) for value in astuple(event)]) for event in events]
+
+
+# --------------------------------------------------------------------------
+# reading back
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("segment_size", (4096, 64 << 20))
+def test_a_binary_log_reads_back_the_stream_it_was_given(tmp_path, segment_size):
+    """Every event, in order, across as many segments as it took."""
+    path = tmp_path / "session.log"
+    with BinaryLogSink(path, segment_size=segment_size, index_every=16) as sink:
+        _, events = record(sink)
+
+    segments = sorted(path.glob("*.seg"))
+    assert (len(segments) > 10) == (segment_size == 4096)
+    check_binary_log(path)
+    assert list(read_binary_log(path)) == events
+    assert list(read_binary_log(path, replayable_only=True)) == [
+        event for event in events if is_replayable(event)
+    ]
+
+
+def test_an_event_the_layout_cannot_hold_is_written_as_json(tmp_path):
+    """The mixture `SQLiteSink` writes, with the `int` clock kept an `int`."""
+    events = [
+        session(),
+        replace_field(trader(1), timestamp=5),
+        replace_field(trader(2), name="t" * 70_000),
+        trader(3),
+    ]
+    path = tmp_path / "mixed.log"
+    write(path, events, segment_size=4096)
+
+    records = list(read_binary_records(path))
+    assert [record.json for record in records] == [False, True, True, False]
+    assert exactly(list(read_binary_log(path))) == exactly(events)
+
+
+def test_records_are_views_of_the_mapped_log(tmp_path):
+    """`read_binary_records` copies nothing, and each record decodes alone."""
+    path = tmp_path / "session.log"
+    with BinaryLogSink(path) as sink:
+        _, events = record(sink, n_ops=200)
+
+    records = list(read_binary_records(path))
+    assert [record.seq for record in records] == [event.seq for event in events]
+    assert [record.kind for record in records] == [event.KIND for event in events]
+    assert [record.replayable for record in records] == [
+        is_replayable(event) for event in events
+    ]
+    assert all(type(record.payload) is memoryview for record in records)
+    assert all(record.payload.readonly for record in records)
+    assert [record.decode() for record in records] == events
+
+
+@pytest.mark.parametrize("index", ("whole", "missing", "wrong"))
+def test_start_and_stop_read_what_read_events_reads(tmp_path, index):
+    """The same slices, whether the index is sound, gone, or lying."""
+    binary, database = tmp_path / "session.log", tmp_path / "session.db"
+    with BinaryLogSink(binary, segment_size=8192, index_every=8) as sink:
+        _, events = record(sink, n_ops=300)
+    with SQLiteSink(database) as sink:
+        for event in events:
+            sink.consume(event)
+
+    indexes = sorted(binary.glob("*.idx"))
+    assert any(entry.stat().st_size for entry in indexes)
+    for entry in indexes:
+        if index == "missing":
+            entry.unlink()
+        elif index == "wrong":
+            # Every entry names the seq before the record it points at, so
+            # a read trusting it would start one record late.
+            pairs = _INDEX_ENTRY.iter_unpack(entry.read_bytes())
+            entry.write_bytes(
+                b"".join(_INDEX_ENTRY.pack(seq - 1, at) for seq, at in pairs)
+            )
+
+    last = events[-1].seq
+    for start, stop in ((0, None), (1, 2), (14, 300), (250, None), (last, None)):
+        assert list(read_binary_log(binary, start=start, stop=stop)) == list(
+            read_events(database, start=start, stop=stop)
+        ), (start, stop)
+    assert list(read_binary_log(binary, start=last + 1)) == []
+
+
+def test_a_replay_from_a_binary_log_reaches_the_session_s_end_state(tmp_path):
+    """`replay(read_binary_log(path))`, as `replay(read_events(path))`."""
+    path = tmp_path / "session.log"
+    with BinaryLogSink(path, segment_size=4096) as sink:
+        book, _ = record(sink, seed=7)
+
+    replayed, _ = replay(read_binary_log(path))
+    replay_suite.assert_same_end_state(
+        replay_suite.capture(book), replay_suite.capture(replayed)
+    )
+
+
+# --------------------------------------------------------------------------
+# converting
+# --------------------------------------------------------------------------
+
+
+def test_a_converted_log_is_the_database_a_sqlite_sink_writes(tmp_path):
+    """Row for row and rowid for rowid, with the log's own end."""
+    binary, recorded = tmp_path / "session.log", tmp_path / "recorded.db"
+    converted = tmp_path / "converted.db"
+    with BinaryLogSink(binary) as sink:
+        _, events = record(sink)
+    with SQLiteSink(recorded) as sink:
+        for event in events:
+            sink.consume(event)
+
+    assert convert_binary_log(binary, converted) == len(events)
+    check_log(converted)
+    assert by_rowid(converted) == by_rowid(recorded)
+    assert dump(converted) == dump(recorded)
+    assert ended(converted) == ended(recorded)
+
+    with pytest.raises(FileExistsError):
+        convert_binary_log(binary, converted)
+
+
+def test_an_unfinished_log_converts_only_when_asked_to_and_stays_unfinished(
+    tmp_path, caplog
+):
+    path = tmp_path / "unfinished.log"
+    sink = BinaryLogSink(path)
+    for event in stream(20):
+        sink.consume(event)
+    sink.flush()  # the session dies here, unclosed
+
+    with pytest.raises(IncompleteLogError):
+        convert_binary_log(path, tmp_path / "refused.db")
+    assert not (tmp_path / "refused.db").exists()
+
+    converted = tmp_path / "prefix.db"
+    with caplog.at_level(logging.WARNING):
+        assert convert_binary_log(path, converted, strict=False) == 20
+    assert "prefix" in caplog.text
+    assert ended(converted) == []
+    with pytest.raises(IncompleteLogError):
+        check_log(converted)
+
+
+# --------------------------------------------------------------------------
+# ending, and being killed
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs SIGKILL")
+def test_a_killed_sink_leaves_every_event_it_returned_from(tmp_path):
+    """No `flush`, no `close`, no finalizer: the mapping is all there is."""
+    path = tmp_path / "killed.log"
+    script = (
+        "import os, signal\n"
+        "from PyLOB.events import SessionStarted, TraderConfigured\n"
+        "from PyLOB.sinks.binlog import BinaryLogSink\n"
+        "sink = BinaryLogSink(%r, segment_size=4096)\n"
+        "sink.consume(SessionStarted(seq=0, timestamp=0.0, tick_size=0.01))\n"
+        "for seq in range(1, 200):\n"
+        "    sink.consume(\n"
+        "        TraderConfigured(seq, 0.0, seq, 't%%d' %% seq, False, 0.0, 0.0, 0.0)\n"
+        "    )\n"
+        "os.kill(os.getpid(), signal.SIGKILL)\n"
+    ) % str(path)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == -signal.SIGKILL, result.stderr
+
+    # Rolled over at least once, so the kill found a segment mid-write.
+    assert len(list(path.glob("*.seg"))) > 1
+    with pytest.raises(IncompleteLogError, match="200 event"):
+        check_binary_log(path)
+    with pytest.raises(IncompleteLogError):
+        list(read_binary_log(path))
+    assert list(read_binary_log(path, strict=False)) == stream(200)
+
+
+def test_a_full_disk_stops_the_recording_and_says_so(tmp_path, monkeypatch):
+    """The next segment cannot be had: what came before it is the log."""
+    path = tmp_path / "full.log"
+    sink = BinaryLogSink(path, segment_size=4096)
+    events = stream(400)
+    for event in events[:100]:
+        sink.consume(event)
+    written = len(list(path.glob("*.seg")))
+
+    def no_space(fd, offset, length):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("os.posix_fallocate", no_space, raising=False)
+    monkeypatch.setattr("os.ftruncate", no_space)
+    for event in events[100:]:
+        sink.consume(event)  # does not raise
+    monkeypatch.undo()
+
+    with pytest.raises(OSError, match="No space"):
+        sink.flush()
+    for _ in range(2):
+        with pytest.raises(OSError, match="No space"):
+            sink.close()
+    assert len(list(path.glob("*.seg"))) == written
+
+    with pytest.raises(IncompleteLogError):
+        check_binary_log(path)
+    kept = list(read_binary_log(path, strict=False))
+    assert 100 <= len(kept) < 400
+    assert kept == events[: len(kept)]
+
+
+def test_a_closed_sink_refuses_events_and_a_used_directory_refuses_a_sink(
+    tmp_path,
+):
+    path = tmp_path / "session.log"
+    sink = BinaryLogSink(path)
+    sink.consume(session())
+    sink.close()
+    sink.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        sink.consume(trader(1))
+    with pytest.raises(FileExistsError, match="one log per session"):
+        BinaryLogSink(path)
+    with pytest.raises(ValueError, match="segment_size"):
+        BinaryLogSink(tmp_path / "small.log", segment_size=100)
+    with pytest.raises(ValueError, match="index_every"):
+        BinaryLogSink(tmp_path / "unindexed.log", index_every=0)
+
+
+# --------------------------------------------------------------------------
+# a log that is wrong
+# --------------------------------------------------------------------------
+
+
+def test_a_missing_segment_is_a_gap(tmp_path):
+    path = tmp_path / "gap.log"
+    write(path, stream(400), segment_size=4096)
+    segments = sorted(path.glob("*.seg"))
+    assert len(segments) > 2
+    segments[1].unlink()
+
+    with pytest.raises(EventLogError, match="not contiguous"):
+        check_binary_log(path)
+
+
+def test_a_log_cut_short_after_closing_is_refused(tmp_path):
+    """The end record's count is what tells a shortened log from a whole one."""
+    path = tmp_path / "cut.log"
+    write(path, stream(20))
+    last = list(read_binary_records(path))[-1]
+    cut = _RECORD.size + len(last.payload)
+    end = _RECORD.size + _END_PAYLOAD.size
+    del last
+    (segment,) = path.glob("*.seg")
+    data = segment.read_bytes()
+    segment.write_bytes(data[: -(cut + end)] + data[-end:])
+
+    with pytest.raises(EventLogError, match="closed holding 20"):
+        check_binary_log(path)
+    with pytest.raises(EventLogError):
+        list(read_binary_log(path))
+    assert list(read_binary_log(path, strict=False)) == stream(19)
+
+
+def test_a_file_that_is_not_a_segment_is_refused(tmp_path):
+    path = tmp_path / "session.log"
+    write(path, stream(20))
+    (path / ("%020d.seg" % 0)).write_bytes(b"SQLite format 3\0" + bytes(100))
+    with pytest.raises(EventLogError, match="not a segment"):
+        check_binary_log(path)
+    with pytest.raises(EventLogError, match="no such directory"):
+        check_binary_log(tmp_path / "nowhere.log")
+
+
+def test_a_binary_log_is_smaller_than_its_database(tmp_path):
+    """The log alone: no projections, no per-row overhead, no JSON."""
+    binary, database = tmp_path / "session.log", tmp_path / "session.db"
+    with BinaryLogSink(binary) as sink:
+        _, events = record(sink)
+    with SQLiteSink(database) as sink:
+        for event in events:
+            sink.consume(event)
+
+    logged = sum(segment.stat().st_size for segment in binary.glob("*"))
+    conn = sqlite3.connect(database)
+    try:
+        (pages,) = conn.execute("PRAGMA page_count").fetchone()
+        (page_size,) = conn.execute("PRAGMA page_size").fetchone()
+    finally:
+        conn.close()
+    assert logged < pages * page_size / 2
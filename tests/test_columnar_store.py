@@ -0,0 +1,174 @@
+"""`OrderBook(columnar=True)`: orders as rows of columns, and nothing else moving.
+
+A columnar engine keeps no `Order` objects -- every order is a row across a
+set of `array` columns and what it hands back is an `OrderView` onto the row.
+These tests run one session into a columnar book and an ordinary one and
+compare the trades, the stream, the book and the refusals; check that a view
+follows its row and that `materialize` copies it out; check that supplied
+identifiers and values wider than a column still read back whole; and measure
+what a resting order costs in each layout.
+"""
+
+from __future__ import annotations
+
+import random
+import tracemalloc
+
+import pytest
+from PyLOB import OrderView
+from PyLOB.engine import DuplicateOrderID, InvalidOrder, Order, OrderBook, UnknownOrder
+from PyLOB.sinks import ListSink
+
+INSTRUMENTS = ("FAKE", "OTHER")
+CURRENCY = "USD"
+FIELDS = (
+    "idNum",
+    "tid",
+    "instrument",
+    "side",
+    "order_type",
+    "price",
+    "tick",
+    "qty",
+    "timestamp",
+    "priority",
+    "fulfilled",
+    "value",
+    "commission",
+    "cancelled",
+    "cancel_reason",
+    "remaining",
+    "filled",
+    "resting",
+)
+
+
+def build(columnar):
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink, columnar=columnar)
+    for symbol in INSTRUMENTS:
+        book.configure_instrument(symbol, CURRENCY)
+    for tid in (1, 2, 3):
+        book.configure_trader(tid, commission_min=0.25, allow_self_matching=tid == 3)
+    return book, sink
+
+
+def fields(order):
+    return tuple(getattr(order, name) for name in FIELDS)
+
+
+def drive(book, rng_seed, steps=3000):
+    rng = random.Random(rng_seed)
+    ids = []
+    for _ in range(steps):
+        roll = rng.random()
+        if roll < 0.12 and ids:
+            idNum = rng.choice(ids)
+            try:
+                book.cancelOrder(None, idNum)
+            except InvalidOrder as exc:
+                yield "refused", str(exc)
+        elif roll < 0.2 and ids:
+            idNum = rng.choice(ids)
+            order = book.order(idNum)
+            update = dict(side=order.side, qty=rng.randint(0, 8) or None, price=None)
+            if roll < 0.16:
+                update["price"] = round(rng.uniform(99.0, 101.0), 2)
+            try:
+                yield "modified", book.modifyOrder(idNum, update)[0]
+            except InvalidOrder as exc:
+                yield "refused", str(exc)
+        else:
+            symbol = rng.choice(INSTRUMENTS)
+            side = rng.choice(("bid", "ask"))
+            kind = "market" if roll > 0.93 else "limit"
+            price = None if kind == "market" else round(rng.gauss(100.0, 0.5), 2)
+            order, trades = book.submit(
+                rng.choice((1, 2, 3)), symbol, side, kind, rng.randint(1, 9), price
+            )
+            ids.append(order.idNum)
+            yield "submitted", (fields(order), trades)
+
+
+def test_a_columnar_engine_runs_the_same_session():
+    objects, objects_sink = build(columnar=False)
+    columns, columns_sink = build(columnar=True)
+
+    assert list(drive(columns, 11)) == list(drive(objects, 11))
+    assert columns_sink.events == objects_sink.events
+    assert sorted(columns.holdings()) == sorted(objects.holdings())
+    for symbol in INSTRUMENTS:
+        for side in ("bid", "ask"):
+            assert columns.depth(symbol, side) == objects.depth(symbol, side)
+            assert [fields(o) for o in columns.snapshot(symbol, side)] == [
+                fields(o) for o in objects.snapshot(symbol, side)
+            ]
+
+    assert [fields(o) for o in columns.orders()] == [
+        fields(o) for o in objects.orders()
+    ]
+    assert all(type(order) is OrderView for order in columns.orders())
+    assert not columns._orders
+    assert repr(columns) == repr(objects)
+
+
+def test_a_view_is_live_and_materializes_to_the_order_it_reads_as():
+    book, _ = build(columnar=True)
+    bid, _ = book.submit(1, "FAKE", "bid", "limit", 5, 100.0)
+    book.submit(2, "FAKE", "ask", "limit", 2, 100.0)
+
+    assert bid.fulfilled == 2 and bid.remaining == 3 and bid.resting
+    assert bid == book.order(bid.idNum) and bid is not book.order(bid.idNum)
+    assert len({bid, book.order(bid.idNum)}) == 1
+
+    detached = bid.materialize()
+    assert type(detached) is Order
+    assert fields(detached) == fields(bid)
+    book.cancelOrder(None, bid.idNum)
+    assert bid.cancelled and not detached.cancelled
+
+
+def test_a_look_alike_order_is_not_the_engine_s():
+    book, _ = build(columnar=True)
+    order, _ = book.submit(1, "FAKE", "bid", "limit", 5, 100.0)
+    with pytest.raises(UnknownOrder):
+        book.match(order.materialize())
+
+
+def test_supplied_identifiers_out_of_order_still_resolve():
+    book, _ = build(columnar=True)
+    for idNum in (50, 10, 60, 20, 5):
+        book.submit(1, "FAKE", "bid", "limit", 1, 90.0 + idNum / 100, idNum=idNum)
+    book.submit(2, "FAKE", "ask", "limit", 1, 99.0)
+
+    for idNum in (50, 10, 60, 20, 5, 61):
+        assert book.order(idNum).idNum == idNum
+    assert book.order(30) is None and book.order(4) is None
+    for idNum in (10, 60, 61):
+        with pytest.raises(DuplicateOrderID):
+            book.submit(1, "FAKE", "bid", "limit", 1, 90.0, idNum=idNum)
+
+
+def test_values_the_columns_cannot_hold_are_kept_whole():
+    book, _ = build(columnar=True)
+    wide = 2**70
+    book.submit(1, "FAKE", "ask", "limit", 5, 100.0)
+    bid, trades = book.submit(wide, "FAKE", "bid", "limit", 1, 100.0, idNum=wide)
+
+    assert book.order(wide).tid == wide and bid.idNum == wide
+    assert trades[0].bid_tid == wide
+    assert book.order(1).fulfilled == 1
+
+
+def test_a_resting_order_costs_a_fraction_of_an_object():
+    def weight(columnar):
+        tracemalloc.start()
+        try:
+            book = OrderBook(tick_size=0.01, columnar=columnar)
+            for index in range(5000):
+                book.submit(1, "FAKE", "bid", "limit", 1, 50.0 + index % 200 / 100)
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    assert weight(columnar=True) * 5 < 2 * weight(columnar=False)
@@ -588,6 +588,8 @@ SURFACE = {
     "configure_trader": (EMITS, "TraderConfigured"),
     # -- operations: recorded, and re-issued by a replay as the same call
     "submit": (EMITS, "Accepted, then Filled per execution, then any IOC cancel"),
+    "submit_many": (EMITS, "what the same submit loop emits, event for event"),
+    "submit_quiet": (EMITS, "what submit emits; only the return value differs"),
     "processOrder": (EMITS, "submit in the legacy dict shape"),
     "cancelOrder": (EMITS, "Cancelled(REQUESTED)"),
     "modifyOrder": (EMITS, "Modified, then any Filled the new price causes"),
@@ -643,6 +645,22 @@ SURFACE = {
         "bead's; the recipe asks for the instrument the scenario configured",
     ),
     "instruments": (QUERY, "every instrument with a book"),
+    "subscribe_levels": (
+        QUERY,
+        "attaches an observer to an instrument's levels: nothing a replay "
+        "could re-issue, and nothing the book itself reads",
+    ),
+    "unsubscribe_levels": (QUERY, "detaches one; test_level_feed covers both"),
+    "subscribe_bbo": (
+        QUERY,
+        "attaches a top-of-book observer, for subscribe_levels' reasons",
+    ),
+    "unsubscribe_bbo": (QUERY, "detaches one; test_bbo_feed covers both"),
+    "instrument": (
+        QUERY,
+        "a handle on one instrument's book, creating it as book does; what the "
+        "handle submits is submit's, and is covered in test_instrument_handle",
+    ),
     "snapshot": (QUERY, "resting orders in matching priority order"),
     "getBestBid": (QUERY, "book-queries"),
     "getWorstBid": (QUERY, "book-queries"),
@@ -700,6 +718,26 @@ def _emit_recipe(book):
     return lambda: book.emit(event)
 
 
+def _unsubscribe_recipe(book):
+    """`unsubscribe_levels` needs a subscriber to detach."""
+    book.subscribe_levels(INSTRUMENT, _ignore)
+    return lambda: book.unsubscribe_levels(INSTRUMENT, _ignore)
+
+
+def _ignore(side, price, volume):
+    pass
+
+
+def _unsubscribe_bbo_recipe(book):
+    """`unsubscribe_bbo` needs a subscriber to detach."""
+    book.subscribe_bbo(INSTRUMENT, _ignore_top)
+    return lambda: book.unsubscribe_bbo(INSTRUMENT, _ignore_top)
+
+
+def _ignore_top(top):
+    pass
+
+
 #: name -> a callable that performs the member's own setup and returns the
 #: one call to be measured. Nothing outside the returned callable is observed,
 #: so a recipe may accept, rest and cancel as much as it needs to first.
@@ -716,6 +754,12 @@ RECIPES = {
         qty=3,
         price=100.0,
     ),
+    "submit_many": lambda b: lambda: b.submit_many(
+        INSTRUMENT, [(2, "bid", "limit", 3, 100.0), (3, "ask", "limit", 1, 101.0)]
+    ),
+    "submit_quiet": lambda b: lambda: b.submit_quiet(
+        2, INSTRUMENT, "bid", "limit", 3, 100.0
+    ),
     "processOrder": lambda b: lambda: b.processOrder(
         dict(tid=2, instrument=INSTRUMENT, side="bid", type="limit", qty=3, price=100.0)
     ),
@@ -751,6 +795,11 @@ RECIPES = {
     "orders": lambda b: lambda: list(b.orders()),
     "book": lambda b: lambda: b.book(INSTRUMENT),
     "instruments": lambda b: lambda: list(b.instruments()),
+    "subscribe_levels": lambda b: lambda: b.subscribe_levels(INSTRUMENT, _ignore),
+    "unsubscribe_levels": _unsubscribe_recipe,
+    "subscribe_bbo": lambda b: lambda: b.subscribe_bbo(INSTRUMENT, _ignore_top),
+    "unsubscribe_bbo": _unsubscribe_bbo_recipe,
+    "instrument": lambda b: lambda: b.instrument(INSTRUMENT),
     "snapshot": lambda b: lambda: b.snapshot(INSTRUMENT, "bid"),
     "getBestBid": lambda b: lambda: b.getBestBid(INSTRUMENT),
     "getWorstBid": lambda b: lambda: b.getWorstBid(INSTRUMENT),
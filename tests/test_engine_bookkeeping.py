@@ -392,6 +392,30 @@ def test_the_grid_is_a_spacing_and_not_a_count_of_decimal_places():
     assert quantize_price(103.0, 5) == 105.0
 
 
+def test_the_books_tick_counts_land_where_the_decimal_grid_does():
+    """The float shortcut `OrderBook.quantize` takes agrees with the exact grid.
+
+    A book carries prices as whole ticks and converts with a few float
+    operations, handing only near-ties and very wide ratios to `decimal`.
+    "Provably the same answer" is an argument about rounding error, so this
+    checks it where it is tightest: exact half-ticks on either side of the
+    double, prices whose double is not the decimal written, ticks that are
+    not powers of ten, and ratios from a fraction of a tick to billions.
+    """
+    ticks = (0.0001, 0.01, 0.05, 0.25, 0.3, 1, 5, 1e-8, 12.5)
+    for tick_size in ticks:
+        book = OrderBook(tick_size=tick_size)
+        for whole in (0, 1, 2, 3, 7, 99, 10_001, 123_456_789, 2**31 + 3):
+            for offset in (0.0, 0.5, 0.4999, 0.5001, 0.25, -0.5):
+                price = round((whole + offset) * tick_size, 12)
+                if price <= 0:
+                    continue
+                assert book.quantize(price) == quantize_price(price, tick_size), (
+                    tick_size,
+                    price,
+                )
+
+
 # --------------------------------------------------------------------------
 # the commission formula
 # --------------------------------------------------------------------------
@@ -67,8 +67,10 @@ alternative was silence.
     `_compact` gated on `_best`, which matching keeps short, so the gate never
     opened and `_worst` grew one entry per level creation for the life of the
     process (499,000 entries and a 234ms first query, measured at 1M
-    operations). And a price can be in a heap twice, which let one match walk
-    receive the same level twice with its skip cursor reset.
+    operations). And a price could be in a heap twice, which let one match walk
+    receive the same level twice with its skip cursor reset. The heaps are gone
+    -- a side keeps one sorted ladder of its live ticks -- and the shapes that
+    broke them are kept here against the ladder that replaced them.
 
 `lob-8r6` -- what "finished" means
     `cancelOrder` refused an order with `qty=10, fulfilled=10` and
@@ -89,12 +91,12 @@ alternative was silence.
     shim had not.
 
 The engine is exercised through its public surface wherever the finding can be
-seen there. It cannot always be: a heap's length is the subject of `lob-n3n`,
-so those tests read `BookSide._best` and `._worst` directly and say so.
+seen there. It cannot always be: a structure's length is the subject of
+`lob-n3n`, so those tests read `BookSide._ladder` directly and say so.
 """
 
 import math
-from contextlib import closing, contextmanager
+from contextlib import contextmanager
 
 import pytest
 from PyLOB.engine import (
@@ -654,18 +656,16 @@ def test_a_level_that_gains_a_second_trader_is_walked_order_by_order():
 # --------------------------------------------------------------------------
 
 
-def test_the_worst_price_heap_is_bounded_under_churn():
+def test_the_ladder_is_bounded_under_churn():
     """20,000 create/consume cycles over one live level (the review's shape).
 
-    Measured before the fix: `_worst` held 20,001 entries against a single live
-    level, because `_compact`'s gate read `_best` -- which matching drains --
-    and `_worst` is peeked only by `getWorst*`. Both heaps now answer to the
-    same bound, and it is the bound `_compact`'s docstring claims.
+    Measured before the heaps went: `_worst` held 20,001 entries against a
+    single live level, because `_compact`'s gate read `_best` -- which matching
+    drains -- and `_worst` is peeked only by `getWorst*`. The ladder drops a
+    level the moment it empties, so it holds the live levels and nothing else.
 
-    The level has to be emptied *by matching* rather than by cancellation, and
-    that is the whole finding: matching pops the stale entry off `_best` on its
-    way past, so the heap the gate was reading stayed short and the gate never
-    opened. A cancel-only churn grows both heaps together and compacts itself.
+    The level has to be emptied *by matching* rather than by cancellation,
+    because that is the path the finding was on.
     """
     book = make_book()
     book.submit(1, INSTRUMENT, "bid", "limit", 1, 99.0)  # the one live level
@@ -675,88 +675,76 @@ def test_the_worst_price_heap_is_bounded_under_churn():
         book.submit(2, INSTRUMENT, "ask", "limit", 1, 100.0)
 
     bids = book.book(INSTRUMENT).bids
-    live = len(bids)
-    assert live == 1
-    assert len(bids._worst) <= 2 * live + 16, len(bids._worst)
-    assert len(bids._best) <= 2 * live + 16, len(bids._best)
+    assert len(bids) == 1
+    assert len(bids._ladder) == 1, len(bids._ladder)
     assert book.getWorstBid(INSTRUMENT) == 99.0
     assert book.getBestBid(INSTRUMENT) == 99.0
 
 
-def test_a_level_is_handed_out_once_per_walk_despite_a_duplicated_price():
-    """A price re-created before its stale entry surfaced is in the heap twice.
+def test_a_level_is_handed_out_once_per_walk_after_being_re_created():
+    """A price emptied and re-created is in the ladder once, and walked once.
 
-    Handing the level over twice in one walk restarts the caller's cursor into
-    it from the front, which is how a market order came to yield 902 levels out
-    of a book that had two. The walk drops the second copy, which is also how
-    the heap sheds it.
+    Under the heaps this was a stale entry plus a fresh one, and handing the
+    level over twice in one walk restarted the caller's cursor into it from
+    the front -- which is how a market order came to yield 902 levels out of a
+    book that had two.
     """
     book = make_book()
     book.submit(1, INSTRUMENT, "bid", "limit", 1, 100.0)  # the better price, on top
     stale, _ = book.submit(1, INSTRUMENT, "bid", "limit", 1, 99.0)
-    book.cancelOrder("bid", stale.idNum)  # 99.0 is stale but not on top
-    book.submit(1, INSTRUMENT, "bid", "limit", 1, 99.0)  # ... and now duplicated
+    book.cancelOrder("bid", stale.idNum)  # 99.0 emptied but not on top
+    book.submit(1, INSTRUMENT, "bid", "limit", 1, 99.0)  # ... and re-created
 
     bids = book.book(INSTRUMENT).bids
-    stored = 99.0 * bids._best_sign
-    assert bids._best.count(stored) == 2, "the duplicate this test needs is not there"
+    assert len(bids._ladder) == len(bids) == 2
 
-    with closing(bids.match_levels(None)) as walk:
-        handed_out = [level.price for level in walk]
+    handed_out = [level.price for level in bids.match_levels(None)]
 
     assert handed_out == [100.0, 99.0]
-    assert bids._best.count(stored) == 1
     assert book.getBestBid(INSTRUMENT) == 100.0
     assert book.getWorstBid(INSTRUMENT) == 99.0
 
 
-def test_a_compaction_mid_walk_does_not_re_yield_the_level_being_held():
-    """The other way a price is duplicated, and the one the fixed gate opened.
-
-    `_compact` fires from `_drop`, so a level emptying mid-walk rebuilds
-    `_best` from the live levels -- re-adding the price of a level the walk
-    has popped and is still holding, which then comes back to the top of the
-    heap and is handed out a second time, with the caller's skip cursor into
-    it reset to the front.
+def test_levels_emptying_mid_walk_do_not_re_yield_the_level_being_held():
+    """The walk survives the ladder changing underneath it.
 
-    That was previously unreachable, because the gate `_compact` read never
-    opened; tightening it (the first half of lob-n3n) is what makes this walk
-    have to survive on its own terms. The level kept alive here is the top of
-    the book, emptied by nobody, while everything under it drains.
+    Under the heaps, a level emptying mid-walk fired `_compact`, which rebuilt
+    `_best` from the live levels -- re-adding the price of a level the walk had
+    popped and was still holding, which then came back to the top and was
+    handed out a second time. The ladder walk asks for the next level by
+    position relative to the last one, so whatever the caller removes, it
+    moves strictly down the book. The level kept alive here is the top of the
+    book, emptied by nobody, while everything under it drains.
     """
     book = make_book()
     prices = [101.0] + [100.0 - i * TICK for i in range(100)]
     for price in prices:
         book.submit(1, INSTRUMENT, "bid", "limit", 1, price)
     bids = book.book(INSTRUMENT).bids
-    assert len(bids._worst) == 101, len(bids._worst)
+    assert len(bids._ladder) == 101, len(bids._ladder)
 
     handed_out = []
-    with closing(bids.match_levels(None)) as walk:
-        for level in walk:
-            handed_out.append(level.price)
-            if level.price != 101.0:
-                # What a fill does to an exhausted level: drop it, which is
-                # what calls `_compact`.
-                for order in list(level):
-                    bids.remove(order)
+    for level in bids.match_levels(None):
+        handed_out.append(level.price)
+        if level.price != 101.0:
+            # What a fill does to an exhausted level: drop it.
+            for order in list(level):
+                bids.remove(order)
 
     assert handed_out == sorted(prices, reverse=True)
     assert len(handed_out) == len(set(handed_out)), "a level was handed out twice"
-    assert len(bids) == 1
+    assert len(bids) == 1 and len(bids._ladder) == 1
     assert book.getBestBid(INSTRUMENT) == 101.0
     assert book.getWorstBid(INSTRUMENT) == 101.0
-    assert bids._best.count(101.0 * bids._best_sign) == 1
 
 
-def test_a_sweep_that_compacts_mid_walk_leaves_the_book_intact():
+def test_a_sweep_past_a_gated_level_leaves_the_book_intact():
     """The same thing through the front door: a market order across 92 levels.
 
     The taker is gated against the top of the book, so that level survives the
-    whole walk while the levels under it drain and compaction fires underneath
-    it. What must come out the other side is the ordinary contract -- the fills
-    the taker was entitled to, the gated order untouched, and both heaps
-    bounded and still answering correctly.
+    whole walk while the levels under it drain. What must come out the other
+    side is the ordinary contract -- the fills the taker was entitled to, the
+    gated order untouched, and the ladder exactly the live levels.
     """
     book = make_book()
     mine, _ = book.submit(1, INSTRUMENT, "bid", "limit", 1, 101.0)  # gated, survives
@@ -772,18 +760,17 @@ def test_a_sweep_that_compacts_mid_walk_leaves_the_book_intact():
 
     bids = book.book(INSTRUMENT).bids
     assert len(bids) == 9  # the gated level, plus the 8 the taker did not reach
-    assert len(bids._worst) <= 2 * len(bids) + 16, len(bids._worst)
-    assert len(bids._best) <= 2 * len(bids) + 16, len(bids._best)
+    assert len(bids._ladder) == 9, len(bids._ladder)
     assert book.getBestBid(INSTRUMENT) == 101.0
     assert book.getWorstBid(INSTRUMENT) == pytest.approx(100.0 - 99 * TICK)
 
 
-def test_the_heaps_still_answer_correctly_after_heavy_churn():
-    """Compaction is a rebuild of live state, so the queries it feeds must agree.
+def test_the_ladder_still_answers_correctly_after_heavy_churn():
+    """The ladder is maintained incrementally, so the queries it feeds must agree.
 
-    Brute force against the level dict, which is the record compaction rebuilds
-    from -- the check that the bound in `_compact` was tightened without
-    tightening what it returns.
+    Brute force against the level dict, which is the record every query used
+    to sort -- the check that keeping the order eagerly did not lose a level
+    or misplace one.
     """
     book = make_book()
     resting = []
@@ -798,9 +785,9 @@ def test_the_heaps_still_answer_correctly_after_heavy_churn():
     live = {order.price for order in resting}
     assert book.getBestBid(INSTRUMENT) == max(live)
     assert book.getWorstBid(INSTRUMENT) == min(live)
-    assert {level.price for level in bids.levels()} == live
-    assert len(bids._worst) <= 2 * len(live) + 16
-    assert len(bids._best) <= 2 * len(live) + 16
+    assert [level.price for level in bids.levels()] == sorted(live, reverse=True)
+    assert [level.price for level in bids.levels(3)] == sorted(live)[:-4:-1]
+    assert len(bids._ladder) == len(live)
 
 
 # --------------------------------------------------------------------------
@@ -1038,19 +1025,21 @@ class ProbingSink:
         )
 
 
-def test_a_sink_reading_the_book_mid_walk_is_told_two_different_things():
-    """`getBestAsk` is None for a side `snapshot` and `getWorstAsk` say is occupied.
+def test_a_sink_reading_the_book_mid_walk_is_told_one_thing():
+    """The four price and volume queries agree even from inside `consume`.
 
     `book-queries` requires a price to read `None` "only when that side of the
     book is empty" and requires a snapshot to agree with the price and volume
-    queries taken at the same moment. Both hold for every caller who waits for
-    an operation to return. A sink does not wait: `match_levels` has lifted the
-    level off the best-price heap and left it in the book, so from inside
-    `consume` the same side answers `None` and 100.0 at once.
-
-    Nothing here is a contract the engine offers -- it is the cost of breaking
-    the one `events.EventSink` states, pinned so that the docstrings saying so
-    stay honest.
+    queries taken at the same moment. Under the heaps a sink was told two
+    things at once: `match_levels` had lifted the level it was working off the
+    best-price heap, so `getBestAsk` read `None` for a side `snapshot` and
+    `getWorstAsk` reported occupied. The ladder walk holds a position rather
+    than a level, so there is nothing lifted out to disagree about.
+
+    Still not a contract the engine offers -- a sink reading mid-operation is
+    the one `events.EventSink` rules out, and a taker mid-walk still says it
+    rests from no level -- but the disagreement pinned here is gone, and this
+    says so.
     """
     sink = ProbingSink()
     book = make_book(sink=sink)
@@ -1060,12 +1049,11 @@ def test_a_sink_reading_the_book_mid_walk_is_told_two_different_things():
 
     assert len(sink.observations) == 1
     seen = sink.observations[0]
-    assert seen["best_ask"] is None, seen
+    assert seen["best_ask"] == 100.0, seen
     assert seen["worst_ask"] == 100.0 and seen["snapshot"] == [100.0], seen
     assert seen["volume"] == 2, seen
 
-    # Settled, the same four queries agree, which is the contract the sink was
-    # not in a position to observe.
+    # Settled, the same four queries say the same again.
     assert book.getBestAsk(INSTRUMENT) == 100.0
     assert book.getWorstAsk(INSTRUMENT) == 100.0
     assert [order.price for order in book.snapshot(INSTRUMENT, "ask")] == [100.0]
@@ -1166,7 +1154,10 @@ def test_an_accepted_order_says_it_rests_before_any_level_holds_it():
 def test_assigning_a_resting_orders_price_leaves_a_cancelled_order_counted():
     """`o.price = x` files the order under a level that no longer knows it.
 
-    `BookSide.remove` looks the order up by its *current* price, finds no such
+    The book indexes by `tick`, the price counted on the grid, so the
+    assignment that does the damage is the pair -- `price` alone leaves the
+    order misreporting itself, which is the milder half of the same mistake.
+    `BookSide.remove` looks the order up by its *current* tick, finds no such
     level, and returns False -- so `cancelOrder` sets the flag, emits, returns
     the order, and leaves it in the level it was actually resting in. The
     engine then reports a cancelled order in `snapshot`, its quantity in
@@ -1178,7 +1169,8 @@ def test_assigning_a_resting_orders_price_leaves_a_cancelled_order_counted():
     book = make_book()
     order, _ = book.submit(1, INSTRUMENT, "ask", "limit", 5, 100.0)
 
-    order.price = 200.0  # the assignment `Order` forbids
+    # The assignment `Order` forbids.
+    order.price, order.tick = 200.0, round(200.0 / TICK)
     book.cancelOrder("ask", order.idNum)
 
     assert order.cancelled and not order.resting
@@ -1190,7 +1182,7 @@ def test_assigning_a_resting_orders_price_leaves_a_cancelled_order_counted():
 def test_assigning_a_resting_orders_price_makes_matching_raise_after_accepting():
     """The same desynchronization, reached by a taker instead of by a cancel.
 
-    `BookSide.fill` finds no level under the maker's new price, so it advances
+    `BookSide.fill` finds no level under the maker's new tick, so it advances
     `fulfilled` and leaves the maker in the queue with nothing left. The walk's
     replacement cursor hands the same maker over again, `_execute` asks for a
     fill of zero, and `fill` refuses it -- from the middle of a submission
@@ -1203,7 +1195,8 @@ def test_assigning_a_resting_orders_price_makes_matching_raise_after_accepting()
     sink = ListSink()
     book = make_book(sink=sink)
     maker, _ = book.submit(1, INSTRUMENT, "ask", "limit", 5, 100.0)
-    maker.price = 200.0  # the assignment `Order` forbids
+    # The assignment `Order` forbids.
+    maker.price, maker.tick = 200.0, round(200.0 / TICK)
     before = len(sink.events)
 
     with pytest.raises(InvalidOrder, match="fill quantity must be positive"):
@@ -1215,14 +1208,14 @@ def test_assigning_a_resting_orders_price_makes_matching_raise_after_accepting()
     assert book.balance(2, INSTRUMENT) == 5.0
 
 
-def test_an_unclosed_match_walk_hides_the_levels_it_is_holding():
-    """An open walk reads from the outside exactly like a corrupted heap.
+def test_an_unclosed_match_walk_hides_nothing():
+    """An open walk leaves the book reading exactly as it did before.
 
-    `match_levels` lifts each price off `_best` before yielding its level and
-    pushes back the survivors in a `finally`, so a walk that is neither closed
-    nor exhausted leaves live levels invisible to `best_price` -- a book whose
-    top is missing, with `_levels` and the snapshot still reporting it. Closing
-    the walk is the whole repair, and `OrderBook.match` is written around that.
+    Under the heaps, `match_levels` lifted each price off `_best` before
+    yielding its level and pushed back the survivors in a `finally`, so a walk
+    neither closed nor exhausted left live levels invisible to `best_price`.
+    The ladder walk takes nothing out, so there is nothing to put back and no
+    `finally` for `OrderBook.match` to get right.
     """
     book = make_book()
     for price in (100.0, 100.01, 100.02):
@@ -1231,8 +1224,8 @@ def test_an_unclosed_match_walk_hides_the_levels_it_is_holding():
 
     walk = asks.match_levels(None)
     assert next(walk).price == 100.0
-    assert asks.best_price() == 100.01, "the walk is holding 100.0"
-    assert asks.level_at(100.0) is not None, "and the level is still live"
+    assert asks.best_price() == 100.0, "the walk is holding nothing"
+    assert asks.level_at(100.0) is not None
 
     walk.close()
     assert asks.best_price() == 100.0
@@ -0,0 +1,145 @@
+"""`OrderBook.instrument(symbol)`: one instrument, addressed without its name.
+
+A handle resolves the instrument and its sides once and then does what the
+string-addressed calls do. A session driven through a handle is compared with
+the same session driven by name, return value by return value and event by
+event; the other tests check that a handle refuses orders on another
+instrument and keeps naming its own.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from PyLOB import InstrumentHandle
+from PyLOB.engine import InvalidOrder, OrderBook
+from PyLOB.sinks import ListSink
+
+INSTRUMENT = "FAKE"
+CURRENCY = "USD"
+
+
+def build(trade_tape=False):
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink)
+    book.configure_instrument(INSTRUMENT, CURRENCY, trade_tape=trade_tape)
+    for tid in (1, 2, 3):
+        book.configure_trader(tid, commission_min=0.25)
+    return book, sink
+
+
+class ByName:
+    """The string-addressed API, spelled as a handle so one driver runs both."""
+
+    def __init__(self, book):
+        self.book = book
+
+    def submit(self, *args):
+        return self.book.submit(args[0], INSTRUMENT, *args[1:])
+
+    def cancel(self, idNum, **kwargs):
+        return self.book.cancel(idNum, **kwargs)
+
+    def modify(self, idNum, **kwargs):
+        return self.book.modify(idNum, **kwargs)
+
+    def reads(self):
+        book = self.book
+        return (
+            book.getBestBid(INSTRUMENT),
+            book.getWorstBid(INSTRUMENT),
+            book.getBestAsk(INSTRUMENT),
+            book.getWorstAsk(INSTRUMENT),
+            book.getLastPrice(INSTRUMENT),
+            book.depth(INSTRUMENT, "bid", 3),
+            book.depth(INSTRUMENT, "ask"),
+            book.getVolumeAtPrice(INSTRUMENT, "ask", 100.2),
+            [o.idNum for o in book.snapshot(INSTRUMENT, "bid")],
+        )
+
+
+def reads(handle):
+    return (
+        handle.best_bid(),
+        handle.worst_bid(),
+        handle.best_ask(),
+        handle.worst_ask(),
+        handle.last_price,
+        handle.depth("bid", 3),
+        handle.depth(handle.asks.side),
+        handle.volume_at("ask", 100.2),
+        [o.idNum for o in handle.snapshot("bid")],
+    )
+
+
+def drive(target, read, seed, steps=2000):
+    rng = random.Random(seed)
+    ids = []
+    for step in range(steps):
+        roll = rng.random()
+        try:
+            if roll < 0.1 and ids:
+                yield target.cancel(rng.choice(ids)).idNum
+            elif roll < 0.18 and ids:
+                order, trades = target.modify(
+                    rng.choice(ids), qty=rng.randint(1, 8), price=None
+                )
+                yield order.idNum, list(trades)
+            else:
+                kind = "market" if roll > 0.93 else "limit"
+                price = None if kind == "market" else round(rng.gauss(100, 0.3), 2)
+                order, trades = target.submit(
+                    rng.choice((1, 2, 3)),
+                    rng.choice(("bid", "ask")),
+                    kind,
+                    rng.randint(1, 9),
+                    price,
+                )
+                ids.append(order.idNum)
+                yield order.idNum, order.remaining, list(trades)
+        except InvalidOrder as exc:
+            yield str(exc)
+        if step % 25 == 0:
+            yield read()
+
+
+@pytest.mark.parametrize("trade_tape", [False, True])
+def test_a_session_through_a_handle_is_the_session_by_name(trade_tape):
+    named, named_sink = build(trade_tape)
+    handled, handled_sink = build(trade_tape)
+    handle = handled.instrument(INSTRUMENT)
+    by_name = ByName(named)
+
+    assert list(drive(handle, lambda: reads(handle), 5)) == list(
+        drive(by_name, by_name.reads, 5)
+    )
+    assert handled_sink.events == named_sink.events
+    assert sorted(handled.holdings()) == sorted(named.holdings())
+
+
+def test_a_handle_refuses_another_instrument_s_order_before_anything_moves():
+    book, sink = build()
+    other, _ = book.submit(1, "OTHER", "bid", "limit", 5, 100.0)
+    handle = book.instrument(INSTRUMENT)
+    before = len(sink.events), book.time
+
+    with pytest.raises(InvalidOrder):
+        handle.cancel(other.idNum)
+    with pytest.raises(InvalidOrder):
+        handle.modify(other.idNum, qty=1)
+    assert (len(sink.events), book.time) == before
+    assert other.resting
+
+
+def test_a_handle_follows_the_instrument_it_names():
+    book, _ = build()
+    handle = book.instrument("NEW")
+    assert isinstance(handle, InstrumentHandle)
+    assert "NEW" in book.instruments() and handle.currency is None
+    book.configure_instrument("NEW", "EUR", price_band=(99.0, 101.0))
+    assert handle.currency == "EUR"
+    handle.submit(1, "bid", "limit", 2, 100.0)
+    assert book.depth("NEW", "bid") == handle.depth("bid") == ((100.0, 2),)
+    with pytest.raises(InvalidOrder):
+        handle.side("sideways")
@@ -0,0 +1,145 @@
+"""`subscribe_levels`: a ladder kept from deltas is the ladder `depth` reads.
+
+The feed's whole promise is that a consumer applying its deltas -- set the
+volume, delete on 0 -- holds the book's Level 2 view without polling it. So
+the check is a randomized session of every kind of level write, on every
+storage layout, with the consumer's ladder compared against `depth` after
+each operation.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from PyLOB import InvalidOrder, OrderBook, Side
+from PyLOB.sinks import ListSink
+
+
+class Ladder:
+    """A subscriber that keeps `{price: volume}` per side from the deltas."""
+
+    def __init__(self):
+        self.sides = {Side.BID: {}, Side.ASK: {}}
+        self.deltas = []
+
+    def __call__(self, side, price, volume):
+        self.deltas.append((side, price, volume))
+        if volume:
+            self.sides[side][price] = volume
+        else:
+            del self.sides[side][price]
+
+    def depth(self, side):
+        levels = self.sides[side].items()
+        return tuple(sorted(levels, reverse=side is Side.BID))
+
+
+def session(book, ladder, steps=1500, seed=5):
+    rng = random.Random(seed)
+    ids = []
+    for _ in range(steps):
+        roll = rng.random()
+        try:
+            if roll < 0.15 and ids:
+                book.cancel(rng.choice(ids))
+            elif roll < 0.3 and ids:
+                idNum = rng.choice(ids)
+                if roll < 0.22:
+                    book.modify(idNum, qty=rng.randint(1, 9))
+                else:
+                    book.modify(idNum, price=round(rng.gauss(100.0, 0.4), 2))
+            else:
+                kind = "market" if roll > 0.95 else "limit"
+                price = None if kind == "market" else round(rng.gauss(100.0, 0.4), 2)
+                order, _ = book.submit(
+                    rng.randint(1, 3),
+                    "FAKE",
+                    rng.choice(("bid", "ask")),
+                    kind,
+                    rng.randint(1, 9),
+                    price,
+                )
+                ids.append(order.idNum)
+        except InvalidOrder:
+            pass
+        for side in (Side.BID, Side.ASK):
+            assert ladder.depth(side) == book.depth("FAKE", side)
+
+
+@pytest.mark.parametrize(
+    "layout", [{}, {"columnar": True}, {"archive": True}, {"band": True}]
+)
+def test_a_ladder_built_from_deltas_is_depth(layout):
+    band = layout.pop("band", False)
+    book = OrderBook(tick_size=0.01, **layout)
+    book.configure_instrument("FAKE", "USD", price_band=(99.0, 101.0) if band else None)
+    ladder = Ladder()
+    book.subscribe_levels("FAKE", ladder)
+    session(book, ladder)
+    assert ladder.deltas
+
+
+def test_a_late_subscriber_is_handed_the_book_first():
+    book = OrderBook(tick_size=0.01)
+    book.submit(1, "FAKE", "bid", "limit", 4, 99.0)
+    book.submit(1, "FAKE", "bid", "limit", 2, 99.5)
+    book.submit(2, "FAKE", "ask", "limit", 3, 101.0)
+
+    ladder = Ladder()
+    book.subscribe_levels("FAKE", ladder)
+    assert ladder.deltas == [
+        (Side.BID, 99.5, 2),
+        (Side.BID, 99.0, 4),
+        (Side.ASK, 101.0, 3),
+    ]
+    book.submit(2, "FAKE", "ask", "market", 3)
+    assert ladder.deltas[3:] == [(Side.BID, 99.5, 0), (Side.BID, 99.0, 3)]
+
+
+def test_a_reprice_leaves_the_old_level_before_joining_the_new_one():
+    book = OrderBook(tick_size=0.01)
+    order, _ = book.submit(1, "FAKE", "bid", "limit", 4, 99.0)
+    ladder = Ladder()
+    book.subscribe_levels("FAKE", ladder)
+    book.modify(order.idNum, price=99.25)
+    assert ladder.deltas[1:] == [(Side.BID, 99.0, 0), (Side.BID, 99.25, 4)]
+
+
+def test_subscribers_are_per_instrument_and_can_leave():
+    book = OrderBook(tick_size=0.01)
+    fake, other = Ladder(), Ladder()
+    book.subscribe_levels("FAKE", fake)
+    book.subscribe_levels("OTHER", other)
+    book.submit(1, "OTHER", "bid", "limit", 1, 10.0)
+    assert not fake.deltas and other.deltas == [(Side.BID, 10.0, 1)]
+
+    book.unsubscribe_levels("OTHER", other)
+    book.submit(1, "OTHER", "bid", "limit", 1, 10.0)
+    assert len(other.deltas) == 1
+    with pytest.raises(InvalidOrder):
+        book.unsubscribe_levels("OTHER", other)
+
+
+def test_the_feed_records_nothing_and_changes_no_outcome():
+    def run(subscribed):
+        sink = ListSink()
+        book = OrderBook(tick_size=0.01, sink=sink)
+        book.configure_instrument("FAKE", "USD")
+        ladder = Ladder()
+        if subscribed:
+            book.subscribe_levels("FAKE", ladder)
+        session(book, ladder if subscribed else _Silent(book), steps=400)
+        return sink.events, sorted(book.holdings())
+
+    assert run(subscribed=True) == run(subscribed=False)
+
+
+class _Silent:
+    """Stands in for a ladder on an unsubscribed book: reads `depth` back."""
+
+    def __init__(self, book):
+        self.book = book
+
+    def depth(self, side):
+        return self.book.depth("FAKE", side)
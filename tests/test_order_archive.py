@@ -0,0 +1,167 @@
+"""`OrderBook(archive=True)`: finished orders out of the store, and still answered for.
+
+An archiving engine moves each finished order into columns and answers for
+it from there. It must do that without anything else moving: the same
+trades, the same stream, the same book, the same refusals -- and every order
+reading back with the fields it finished with.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from PyLOB import ArchivedOrder
+from PyLOB.engine import DuplicateOrderID, InvalidOrder, Order, OrderBook
+from PyLOB.sinks import ListSink
+
+INSTRUMENTS = ("FAKE", "OTHER")
+CURRENCY = "USD"
+FIELDS = ArchivedOrder._fields
+
+
+def build(archive):
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink, archive=archive)
+    for symbol in INSTRUMENTS:
+        book.configure_instrument(symbol, CURRENCY)
+    for tid in (1, 2, 3):
+        book.configure_trader(tid, commission_min=0.25)
+    return book, sink
+
+
+def fields(order):
+    return tuple(getattr(order, name) for name in FIELDS) + (
+        order.cancelled,
+        order.remaining,
+        order.filled,
+        order.resting,
+    )
+
+
+def drive(book, rng_seed, steps=3000):
+    rng = random.Random(rng_seed)
+    ids = []
+    for _ in range(steps):
+        roll = rng.random()
+        if roll < 0.12 and ids:
+            idNum = rng.choice(ids)
+            try:
+                book.cancelOrder(None, idNum)
+            except InvalidOrder as exc:
+                yield "refused", str(exc)
+        elif roll < 0.2 and ids:
+            idNum = rng.choice(ids)
+            order = book.order(idNum)
+            update = dict(side=order.side, qty=rng.randint(0, 8) or None, price=None)
+            if roll < 0.16:
+                update["price"] = round(rng.uniform(99.0, 101.0), 2)
+            try:
+                yield "modified", book.modifyOrder(idNum, update)[0]
+            except InvalidOrder as exc:
+                yield "refused", str(exc)
+        else:
+            symbol = rng.choice(INSTRUMENTS)
+            side = rng.choice(("bid", "ask"))
+            kind = "market" if roll > 0.93 else "limit"
+            price = None if kind == "market" else round(rng.gauss(100.0, 0.5), 2)
+            order, trades = book.submit(
+                rng.choice((1, 2, 3)), symbol, side, kind, rng.randint(1, 9), price
+            )
+            ids.append(order.idNum)
+            yield "submitted", (fields(order), trades)
+
+
+def test_an_archiving_engine_runs_the_same_session():
+    kept, kept_sink = build(archive=False)
+    archived, archived_sink = build(archive=True)
+
+    assert list(drive(archived, 8)) == list(drive(kept, 8))
+    assert archived_sink.events == kept_sink.events
+    assert sorted(archived.holdings()) == sorted(kept.holdings())
+    for symbol in INSTRUMENTS:
+        for side in ("bid", "ask"):
+            assert archived.depth(symbol, side) == kept.depth(symbol, side)
+
+    everything = [fields(order) for order in kept.orders()]
+    assert [fields(order) for order in archived.orders()] == everything
+    for order in kept.orders():
+        assert fields(archived.order(order.idNum)) == fields(order)
+
+    # The store holds what is still working and nothing else.
+    live = [order for order in kept.orders() if order.resting]
+    assert len(archived._orders) == len(live)
+    assert all(type(archived.order(o.idNum)) is Order for o in live)
+    assert repr(archived) == repr(kept)
+
+
+def test_an_archived_identifier_cannot_be_supplied_again():
+    book, _ = build(archive=True)
+    order, _ = book.submit(1, "FAKE", "bid", "market", 1)
+    assert isinstance(book.order(order.idNum), ArchivedOrder)
+    with pytest.raises(DuplicateOrderID):
+        book.submit(1, "FAKE", "bid", "limit", 1, 99.0, idNum=order.idNum)
+
+
+def test_orders_the_columns_cannot_hold_are_kept_whole():
+    book, _ = build(archive=True)
+    wide = 2**70
+    far = 10**12
+    book.submit(1, "FAKE", "ask", "limit", 5, 100.0)
+    book.submit(wide, "FAKE", "bid", "limit", 1, 100.0)
+    book.submit(2, "FAKE", "bid", "limit", 1, 100.0, idNum=far)
+    rested, _ = book.submit(3, "FAKE", "bid", "limit", 1, 99.0)
+    book.cancelOrder(None, rested.idNum)
+
+    archive = book._archive
+    assert len(archive) == 3
+    assert book.order(2).tid == wide
+    assert book.order(far).tid == 2 and far in archive
+    assert book.order(rested.idNum).cancelled
+    assert len(archive.flags) < 100
+    assert [order.idNum for order in book.orders()] == [1, 2, far, rested.idNum]
+
+
+def test_orders_that_finish_out_of_identifier_order_stay_in_the_columns():
+    """Resting orders outlived by later ones: the usual session.
+
+    A market order on an empty book finishes first, with the highest
+    identifier so far, and every resting order below it finishes after.
+    """
+    book, _ = build(archive=True)
+    resting = [
+        book.submit(1, "FAKE", "ask", "limit", 1, 100.0 + step / 100)[0].idNum
+        for step in range(200)
+    ]
+    book.submit(3, "OTHER", "bid", "market", 1)
+    for _ in resting:
+        book.submit(2, "FAKE", "bid", "market", 1)
+
+    archive = book._archive
+    assert archive.base == 1
+    assert len(archive) == 401
+    assert not archive._overflow
+    assert len(archive.flags) < 800
+    assert [book.order(idNum).filled for idNum in resting] == [True] * 200
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda book, idNum: book.cancelOrder(None, idNum),
+        lambda book, idNum: book.cancelOrder("ask", idNum),
+        lambda book, idNum: book.modifyOrder(
+            idNum, dict(side="bid", qty=5, price=None)
+        ),
+    ],
+)
+def test_a_finished_order_is_refused_the_same_way_archived_or_not(call):
+    messages = []
+    for archive in (False, True):
+        book, _ = build(archive=archive)
+        book.submit(1, "FAKE", "ask", "limit", 2, 100.0)
+        filled, _ = book.submit(2, "FAKE", "bid", "limit", 2, 100.0)
+        with pytest.raises(InvalidOrder) as refused:
+            call(book, filled.idNum)
+        messages.append(str(refused.value))
+    assert messages[0] == messages[1]
@@ -0,0 +1,129 @@
+"""`configure_instrument(price_band=...)`: a layout, and nothing a caller can see.
+
+The band backs each `BookSide` with one slot per tick across a price range, in
+place of the sorted ladder, for instruments whose prices stay inside it. The
+promise is that it changes the cost of an operation and never its outcome --
+so the test is a differential one between two books that differ in nothing
+but the band, over a workload that deliberately strays outside it.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from PyLOB.engine import InvalidOrder, OrderBook
+
+INSTRUMENT = "FAKE"
+CURRENCY = "USD"
+TICK = 0.01
+
+
+def make_book(price_band=None):
+    book = OrderBook(tick_size=TICK)
+    book.configure_instrument(INSTRUMENT, CURRENCY, price_band=price_band)
+    for tid in (1, 2, 3):
+        book.configure_trader(tid, allow_self_matching=tid == 3)
+    return book
+
+
+def view(book):
+    """Everything the read side says about the book, in one comparable value."""
+    sides = {}
+    for side in ("bid", "ask"):
+        sides[side] = (
+            book.depth(INSTRUMENT, side),
+            book.depth(INSTRUMENT, side, 3),
+            [order.idNum for order in book.snapshot(INSTRUMENT, side)],
+            [
+                book.getVolumeAtPrice(INSTRUMENT, side, 99.0 + step * 0.05)
+                for step in range(41)
+            ],
+        )
+    return (
+        sides,
+        book.getBestBid(INSTRUMENT),
+        book.getWorstBid(INSTRUMENT),
+        book.getBestAsk(INSTRUMENT),
+        book.getWorstAsk(INSTRUMENT),
+        book.getLastPrice(INSTRUMENT),
+    )
+
+
+def test_a_banded_book_trades_and_reports_exactly_as_a_sparse_one():
+    rng = random.Random(20261018)
+    sparse = make_book()
+    banded = make_book(price_band=(99.5, 100.5))
+    resting = []
+
+    for step in range(3000):
+        roll = rng.random()
+        if roll < 0.1 and resting:
+            idNum = resting.pop(rng.randrange(len(resting)))
+            if sparse.order(idNum).resting:
+                for book in (sparse, banded):
+                    book.cancelOrder(None, idNum)
+        elif roll < 0.18 and resting:
+            idNum = rng.choice(resting)
+            if sparse.order(idNum).resting:
+                update = dict(
+                    side=sparse.order(idNum).side,
+                    qty=rng.randint(1, 9),
+                    price=round(rng.uniform(99.0, 101.0), 2),
+                )
+                left, right = (
+                    book.modifyOrder(idNum, dict(update)) for book in (sparse, banded)
+                )
+                assert left[0] == right[0], step
+        else:
+            side = rng.choice(("bid", "ask"))
+            order_type = "market" if roll > 0.95 else "limit"
+            # Mostly inside the band, with a tail either side of it.
+            price = None
+            if order_type == "limit":
+                price = round(rng.gauss(100.0, 0.4), 2)
+            tid, qty = rng.choice((1, 2, 3)), rng.randint(1, 9)
+            (left, left_trades), (right, right_trades) = (
+                book.submit(tid, INSTRUMENT, side, order_type, qty, price)
+                for book in (sparse, banded)
+            )
+            assert left_trades == right_trades, step
+            assert left.idNum == right.idNum
+            resting.append(left.idNum)
+        if step % 50 == 0:
+            assert view(sparse) == view(banded), step
+
+    assert view(sparse) == view(banded)
+
+
+def test_a_band_set_over_resting_orders_re_files_them_in_place():
+    """Configured late -- after orders rest -- the queues are exactly as they were."""
+    sparse = make_book()
+    banded = make_book()
+    for book in (sparse, banded):
+        for price in (99.0, 99.8, 100.0, 100.0, 100.3, 101.7):
+            book.submit(1, INSTRUMENT, "bid", "limit", 2, price)
+            book.submit(2, INSTRUMENT, "ask", "limit", 2, price + 5)
+
+    banded.configure_instrument(INSTRUMENT, CURRENCY, price_band=(99.5, 100.5))
+    assert view(banded) == view(sparse)
+
+    for book in (sparse, banded):
+        book.submit(2, INSTRUMENT, "ask", "market", 8)
+    assert view(banded) == view(sparse)
+    assert banded.getBestBid(INSTRUMENT) == 99.8
+
+
+@pytest.mark.parametrize(
+    "price_band",
+    [(100.5, 99.5), (100.0,), "99-101", (0.0, 100.0), (1.0, 1.0 + TICK * (1 << 21))],
+)
+def test_a_band_that_is_not_one_is_refused_before_anything_changes(price_band):
+    book = make_book()
+    book.submit(1, INSTRUMENT, "bid", "limit", 2, 100.0)
+
+    with pytest.raises(InvalidOrder):
+        book.configure_instrument(INSTRUMENT, "EUR", price_band=price_band)
+
+    assert book.book(INSTRUMENT).currency == CURRENCY
+    assert book.depth(INSTRUMENT, "bid") == ((100.0, 2),)
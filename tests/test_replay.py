@@ -44,6 +44,7 @@ whole ledger, more than one instrument.
 from __future__ import annotations
 
 import random
+import sqlite3
 import subprocess
 import sys
 from collections import Counter
@@ -53,11 +54,11 @@ from typing import NamedTuple
 import PyLOB
 import pytest
 from harness import MONEY_ABS, MONEY_REL
-from PyLOB import ReplayError, replay
+from PyLOB import ReplayError, replay, verify_replay
 from PyLOB.engine import OrderBook as InMemoryOrderBook
-from PyLOB.events import Filled, is_replayable
+from PyLOB.events import Accepted, Filled, is_replayable
 from PyLOB.sinks import ListSink
-from PyLOB.sinks.sqlite import SQLiteSink, read_events
+from PyLOB.sinks.sqlite import SQLiteSink, book_at, read_checkpoint, read_events
 
 # --------------------------------------------------------------------------
 # comparing money
@@ -593,6 +594,337 @@ def test_the_replayable_column_and_the_filter_agree(tmp_path):
     assert trade_log(trades_from_filtered) == trade_log(trades_from_whole)
 
 
+# --------------------------------------------------------------------------
+# the trusted path
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("seed", SEEDS[:3])
+def test_a_trusted_replay_rebuilds_the_same_session(tmp_path, seed):
+    """`trusted=True` skips the gate and nothing that decides an outcome.
+
+    Read back from a database, so the events are what a real recording
+    decodes to, and compared three ways: the end state, the trades, and the
+    stream the trusted replay itself records -- which is the original's,
+    event for event.
+    """
+    db_path = tmp_path / ("session%d.db" % seed)
+    book = build_recorded(db_path)
+    trades, _ = run_workload(book, random.Random(seed), n_ops=800)
+    original = capture(book)
+    book.close()
+
+    sink = ListSink()
+    trusted_book, trusted_trades = replay(read_events(db_path), sink=sink, trusted=True)
+
+    assert_same_end_state(original, capture(trusted_book))
+    assert trade_log(trusted_trades) == trade_log(trades)
+    assert sink.events == list(read_events(db_path))
+
+
+def test_a_trusted_replay_does_not_go_through_the_gate(monkeypatch):
+    """What makes it the fast path: `create_order` is never called."""
+    events = recorded_events(n_ops=200)
+    baseline, baseline_trades = replay(events)
+
+    def gate(*args, **kwargs):
+        raise AssertionError("the trusted path reached the input gate")
+
+    monkeypatch.setattr(InMemoryOrderBook, "create_order", gate)
+    book, trades = replay(events, trusted=True)
+    assert_same_end_state(capture(baseline), capture(book))
+    assert trade_log(trades) == trade_log(baseline_trades)
+
+    # And the identifier counter is re-seeded exactly as the gate re-seeds it.
+    assert book._next_idNum == baseline._next_idNum
+
+
+# --------------------------------------------------------------------------
+# replaying from a checkpoint
+# --------------------------------------------------------------------------
+
+
+def build_checkpointed(db_path, buffer_size, checkpoint_every=250):
+    """`build_recorded`, with a sink that takes checkpoints."""
+    sink = SQLiteSink(
+        db_path, buffer_size=buffer_size, checkpoint_every=checkpoint_every
+    )
+    return configure(InMemoryOrderBook(tick_size=TICK, sink=sink))
+
+
+def checkpoint_seqs(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [seq for (seq,) in conn.execute("SELECT seq FROM checkpoint")]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("seed", SEEDS[:3])
+def test_a_replay_from_the_last_checkpoint_reaches_the_same_end_state(tmp_path, seed):
+    """The tail after a checkpoint, re-issued onto it, ends where the session did.
+
+    What a checkpoint replay holds is the book and not the store: the orders
+    resting at the checkpoint and those the tail accepted. Each of those is
+    compared with the original's, and so are the queues, ledgers and prices.
+    """
+    db_path = tmp_path / ("session%d.db" % seed)
+    book = build_checkpointed(db_path, buffer_size=64)
+    trades, _ = run_workload(book, random.Random(seed), n_ops=1500)
+    original = capture(book)
+    book.close()
+
+    checkpoint = read_checkpoint(db_path)
+    assert checkpoint is not None and checkpoint.seq > 2000
+    resumed, tail_trades = replay(
+        read_events(db_path, start=checkpoint.seq + 1), checkpoint=checkpoint
+    )
+    state = capture(resumed)
+
+    assert state.queues == original.queues
+    assert state.balances == approx_money(original.balances)
+    assert state.last_price == original.last_price
+    assert state.orders and all(
+        original.orders[idNum] == order for idNum, order in state.orders.items()
+    )
+    assert trade_log(tail_trades) == trade_log(
+        [trade for trade in trades if trade.trade_id >= checkpoint.next_trade_id]
+    )
+    assert (resumed._next_idNum, resumed._next_priority, resumed._next_trade_id) == (
+        book._next_idNum,
+        book._next_priority,
+        book._next_trade_id,
+    )
+
+
+@pytest.mark.parametrize("buffer_size", (1, 7, 1000))
+def test_every_checkpoint_is_the_state_a_replay_to_it_reaches(tmp_path, buffer_size):
+    """Each checkpoint, loaded, is the engine a full replay up to its `seq` is.
+
+    Across buffer sizes on both sides of `checkpoint_every`, because the cut
+    is made inside a flush: a buffer of one makes every flush a single event,
+    and one larger than the interval takes one checkpoint per flush. Every
+    checkpoint must also sit between operations, with a command next.
+    """
+    db_path = tmp_path / "session.db"
+    book = build_checkpointed(db_path, buffer_size=buffer_size)
+    run_workload(book, random.Random(5), n_ops=1500)
+    book.close()
+
+    seqs = checkpoint_seqs(db_path)
+    assert len(seqs) >= 2
+    for seq in seqs:
+        checkpoint = read_checkpoint(db_path, seq=seq)
+        assert checkpoint.seq == seq
+        after = next(read_events(db_path, start=seq + 1), None)
+        assert after is None or is_replayable(after)
+
+        full, _ = replay(read_events(db_path, stop=seq + 1))
+        loaded, trades = replay([], checkpoint=checkpoint)
+        assert trades == []
+        expected, actual = capture(full), capture(loaded)
+        assert actual.queues == expected.queues
+        assert actual.balances == expected.balances
+        assert actual.last_price == expected.last_price
+        assert (loaded.time, loaded._next_idNum, loaded._next_priority) == (
+            full.time,
+            full._next_idNum,
+            full._next_priority,
+        )
+        assert loaded._next_trade_id == full._next_trade_id
+
+
+def test_read_checkpoint_answers_none_when_there_is_none_to_start_from(tmp_path):
+    """No checkpoints asked for, or none yet at the bound: replay from the start."""
+    plain = tmp_path / "plain.db"
+    book = build_recorded(plain)
+    run_workload(book, random.Random(1), n_ops=200)
+    book.close()
+    assert read_checkpoint(plain) is None
+
+    checkpointed = tmp_path / "checkpointed.db"
+    book = build_checkpointed(checkpointed, buffer_size=16, checkpoint_every=100)
+    run_workload(book, random.Random(1), n_ops=200)
+    book.close()
+    first = checkpoint_seqs(checkpointed)[0]
+    assert read_checkpoint(checkpointed, seq=first - 1) is None
+    assert read_checkpoint(checkpointed, seq=first).seq == first
+
+
+def test_a_replay_from_a_checkpoint_refuses_a_sink(tmp_path):
+    """Its stream would open mid-session, with no `SessionStarted` to say so."""
+    db_path = tmp_path / "session.db"
+    book = build_checkpointed(db_path, buffer_size=16, checkpoint_every=100)
+    run_workload(book, random.Random(2), n_ops=100)
+    book.close()
+
+    with pytest.raises(ReplayError, match="checkpoint"):
+        replay([], checkpoint=read_checkpoint(db_path), sink=ListSink())
+
+
+# --------------------------------------------------------------------------
+# the book at a point in the recording
+# --------------------------------------------------------------------------
+
+
+def same_book(actual, expected):
+    """The parts of two end states a point-in-time query answers for."""
+    actual, expected = capture(actual), capture(expected)
+    assert actual.queues == expected.queues
+    assert actual.balances == expected.balances
+    assert actual.last_price == expected.last_price
+
+
+@pytest.mark.parametrize("checkpoint_every", (None, 300))
+def test_book_at_a_seq_is_the_book_a_replay_to_it_builds(tmp_path, checkpoint_every):
+    """With checkpoints or without, the answer is the full replay's.
+
+    The points include ones on a fill, part-way through the operation that
+    caused it: the answer there is the book once that operation was done,
+    which is what replaying every command up to the point builds.
+    """
+    db_path = tmp_path / "session.db"
+    sink = SQLiteSink(db_path, buffer_size=32, checkpoint_every=checkpoint_every)
+    book = configure(InMemoryOrderBook(tick_size=TICK, sink=sink))
+    run_workload(book, random.Random(9), n_ops=800)
+    original = capture(book)
+    book.close()
+
+    events = list(read_events(db_path))
+    fills = [event.seq for event in events if isinstance(event, Filled)]
+    points = [0, 5, 299, 300, 301, 777, fills[10], fills[len(fills) // 2]]
+    for seq in points:
+        expected, _ = replay(read_events(db_path, stop=seq + 1))
+        same_book(book_at(db_path, seq=seq), expected)
+
+    last = events[-1].seq
+    assert capture(book_at(db_path, seq=last)).queues == original.queues
+    assert capture(book_at(db_path, seq=last + 1000)).queues == original.queues
+
+
+def test_book_at_a_timestamp_is_the_book_before_the_clock_passes_it(tmp_path):
+    """By the clock: everything stamped at or before the time, and nothing after.
+
+    The workload leaves the engine clock to step one per operation, so every
+    operation has a time of its own and the two questions name one point.
+    """
+    db_path = tmp_path / "session.db"
+    book = build_checkpointed(db_path, buffer_size=32, checkpoint_every=200)
+    run_workload(book, random.Random(4), n_ops=600)
+    book.close()
+
+    events = list(read_events(db_path))
+    for clock in (0.0, 1.0, 150.0, 150.5, 401.0):
+        seq = max(event.seq for event in events if event.timestamp <= clock)
+        same_book(book_at(db_path, timestamp=clock), book_at(db_path, seq=seq))
+
+
+def test_book_at_needs_exactly_one_point(tmp_path):
+    db_path = tmp_path / "session.db"
+    book = build_recorded(db_path)
+    run_workload(book, random.Random(1), n_ops=20)
+    book.close()
+
+    with pytest.raises(ValueError, match="exactly one"):
+        book_at(db_path)
+    with pytest.raises(ValueError, match="exactly one"):
+        book_at(db_path, seq=3, timestamp=3.0)
+    with pytest.raises(ValueError, match="seq"):
+        book_at(db_path, seq=-1)
+
+
+# --------------------------------------------------------------------------
+# verifying a replay as it goes
+# --------------------------------------------------------------------------
+
+# `verify_replay` reads the *whole* stream -- the fills are what it checks --
+# so these pass `ListSink` lists and unfiltered `read_events` and never the
+# `replayable_only` read the replay tests above are free to use.
+
+
+def test_a_faithful_recording_verifies_fill_for_fill(tmp_path):
+    """Every recorded fill is re-derived, and the verdict counts them."""
+    db_path = tmp_path / "session.db"
+    book = build_recorded(db_path)
+    trades, _ = run_workload(book, random.Random(SEEDS[0]), n_ops=600)
+    book.close()
+
+    for trusted in (False, True):
+        verdict = verify_replay(read_events(db_path), trusted=trusted)
+        assert verdict.ok, verdict.divergence
+        assert verdict.fills == len(trades) > 0
+        assert verdict.events == len(list(read_events(db_path)))
+        assert verdict.events_per_second > 0
+
+
+@pytest.mark.parametrize("field", ["price", "qty", "bid_commission"])
+def test_a_tampered_fill_is_the_divergence_and_names_its_field(field):
+    events = recorded_events(n_ops=300)
+    at = [i for i, e in enumerate(events) if isinstance(e, Filled)][5]
+    original = events[at]
+    tampered = replace_field(original, **{field: getattr(original, field) + 1})
+    events[at] = tampered
+
+    verdict = verify_replay(events)
+    assert not verdict.ok
+    divergence = verdict.divergence
+    assert divergence.seq == original.seq
+    assert divergence.recorded == tampered
+    assert divergence.replayed == original
+    assert divergence.diff == (
+        (field, getattr(tampered, field), getattr(original, field)),
+    )
+    assert verdict.fills == 5
+
+
+def test_verification_stops_at_the_first_divergence():
+    """The rest of a generator is not read: finding where is the point."""
+    events = recorded_events(n_ops=300)
+    at = [i for i, e in enumerate(events) if isinstance(e, Filled)][0]
+    events[at] = replace_field(events[at], trade_id=events[at].trade_id + 100)
+
+    stream = iter(events)
+    verdict = verify_replay(stream)
+    assert verdict.divergence.diff[0][0] == "trade_id"
+    assert verdict.events == at + 1
+    assert next(stream) is events[at + 1]
+
+
+def test_a_fill_missing_on_either_side_is_a_divergence():
+    events = recorded_events(n_ops=300)
+    fills = [i for i, e in enumerate(events) if isinstance(e, Filled)]
+    gone = events[fills[3]]
+
+    # A recorded fill dropped: the rebuilt engine made one the log lacks.
+    divergence = verify_replay([e for e in events if e is not gone]).divergence
+    assert (divergence.seq, divergence.recorded) == (gone.seq, None)
+    assert divergence.replayed == gone
+
+    # A recorded fill repeated: the log has one the engine did not make.
+    doubled = events[: fills[3] + 1] + events[fills[3] :]
+    divergence = verify_replay(doubled).divergence
+    assert (divergence.recorded, divergence.replayed) == (gone, None)
+
+    # The last fill dropped is caught at the end of the stream, not missed.
+    last = events[fills[-1]]
+    truncated = [e for e in events if e is not last]
+    assert verify_replay(truncated).divergence.replayed == last
+
+
+def test_a_command_the_engine_refuses_is_a_divergence_not_an_exception():
+    events = recorded_events(n_ops=300)
+    first = next(e for e in events if isinstance(e, Accepted))
+    events.append(replace_field(first, seq=events[-1].seq + 1))
+
+    divergence = verify_replay(events).divergence
+    assert divergence.seq == events[-1].seq
+    assert divergence.error is not None
+    assert (divergence.recorded, divergence.replayed) == (None, None)
+
+    with pytest.raises(ReplayError, match="not SessionStarted"):
+        verify_replay(events[1:])
+
+
 # --------------------------------------------------------------------------
 # what replay refuses
 # --------------------------------------------------------------------------
@@ -0,0 +1,159 @@
+"""`ShardedOrderBook`: instruments over worker processes, one session to a caller.
+
+A sharded session is run beside one `OrderBook` given the same operations,
+and the trades, the books and the stream -- queue stamps aside -- must agree,
+with the stream replaying into a single engine. The rest check quiet batch
+counts, a refusal raised only after every worker has answered, routing by
+order identifier, and a closed book refusing calls.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import random
+
+import pytest
+from PyLOB import OrderBook, replay
+from PyLOB.engine import InvalidOrder, UnknownOrder
+from PyLOB.sharded import ShardedOrderBook
+from PyLOB.sinks import ListSink
+
+SYMBOLS = ("AAA", "BBB", "CCC", "DDD", "EEE")
+CURRENCY = "USD"
+
+
+def configure(book):
+    for symbol in SYMBOLS:
+        book.configure_instrument(symbol, CURRENCY)
+    book.configure_trader(1, commission_min=0.25)
+    book.configure_trader(3, allow_self_matching=True)
+
+
+def ops(seed, n):
+    rng = random.Random(seed)
+    for _ in range(n):
+        kind = "market" if rng.random() > 0.9 else "limit"
+        price = None if kind == "market" else round(rng.gauss(100.0, 0.5), 2)
+        yield (
+            rng.choice((1, 2, 3)),
+            rng.choice(SYMBOLS),
+            rng.choice(("bid", "ask")),
+            kind,
+            rng.randint(1, 9),
+            price,
+        )
+
+
+def comparable(events):
+    """The stream less what a worker stamps for itself: queue position."""
+    out = []
+    for event in events:
+        fields = dataclasses.asdict(event)
+        fields.pop("priority", None)
+        out.append((type(event).__name__, fields))
+    return out
+
+
+def holdings(book):
+    return {(tid, symbol): amount for tid, symbol, amount in book.holdings()}
+
+
+@pytest.fixture
+def pair():
+    single_sink, sharded_sink = ListSink(), ListSink()
+    single = OrderBook(tick_size=0.01, sink=single_sink)
+    sharded = ShardedOrderBook(shards=3, tick_size=0.01, sink=sharded_sink)
+    configure(single)
+    configure(sharded)
+    yield single, single_sink, sharded, sharded_sink
+    sharded.close()
+
+
+def test_a_sharded_session_trades_and_records_what_one_engine_does(pair):
+    single, single_sink, sharded, sharded_sink = pair
+    batch = list(ops(1, 2000))
+    trades = []
+    for op in batch:
+        trades += single.submit(*op)[1]
+
+    orders, sharded_trades = sharded.submit_batch(batch)
+    assert sharded_trades == trades
+    assert [o.idNum for o in orders] == list(range(1, len(batch) + 1))
+
+    # One at a time, through the routed calls.
+    for step, op in enumerate(ops(2, 200)):
+        left, right = single.submit(*op), sharded.submit(*op)
+        assert left[1] == right[1] and left[0].remaining == right[0].remaining
+        if step % 7 == 0 and left[0].resting:
+            single.cancel(left[0].idNum)
+            assert sharded.cancel(left[0].idNum).cancelled
+        elif step % 5 == 0 and left[0].resting:
+            assert single.modify(left[0].idNum, price=99.5)[1] == list(
+                sharded.modify(left[0].idNum, price=99.5)[1]
+            )
+
+    assert comparable(sharded_sink.events) == comparable(single_sink.events)
+    for symbol in SYMBOLS:
+        for side in ("bid", "ask"):
+            assert sharded.depth(symbol, side) == single.depth(symbol, side)
+        assert sharded.getLastPrice(symbol) == single.getLastPrice(symbol)
+    expected = holdings(single)
+    assert holdings(sharded) == pytest.approx(expected)
+    assert sharded.balance(1, CURRENCY) == pytest.approx(expected[1, CURRENCY])
+
+    rebuilt, replayed = replay(sharded_sink.events)
+    assert [t.trade_id for t in replayed] == list(range(1, len(replayed) + 1))
+    for symbol in SYMBOLS:
+        assert rebuilt.depth(symbol, "ask") == single.depth(symbol, "ask")
+
+
+def test_a_quiet_batch_counts_what_a_full_one_reports():
+    batch = list(ops(3, 1500))
+    full_sink, quiet_sink = ListSink(), ListSink()
+    with ShardedOrderBook(shards=2, tick_size=0.01, sink=full_sink) as full:
+        with ShardedOrderBook(shards=2, tick_size=0.01, sink=quiet_sink) as quiet:
+            configure(full)
+            configure(quiet)
+            orders, trades = full.submit_batch(batch)
+            counted = quiet.submit_batch(batch, quiet=True)
+            assert [c.idNum for c in counted] == [o.idNum for o in orders]
+            assert sum(c.trades for c in counted) == len(trades)
+            assert [c.filled for c in counted] == [
+                sum(t.qty for t in trades if t.taker_idNum == o.idNum) for o in orders
+            ]
+            assert quiet.depth("AAA", "bid") == full.depth("AAA", "bid")
+    assert quiet_sink.events == full_sink.events
+
+
+@pytest.mark.parametrize("quiet", [False, True])
+def test_a_refusal_in_a_batch_raises_after_every_worker_answers(pair, quiet):
+    _, _, sharded, _ = pair
+    batch = [
+        (1, "AAA", "bid", "limit", 5, 100.0),
+        (1, "BBB", "bid", "limit", 0, 100.0),
+        (1, "AAA", "bid", "limit", 5, 100.1),
+        (1, "CCC", "ask", "limit", 5, 100.0),
+    ]
+    with pytest.raises(InvalidOrder):
+        sharded.submit_batch(batch, quiet=quiet)
+    # The refused op's worker stopped there; the others ran to the end.
+    assert sharded.depth("AAA", "bid") == ((100.1, 5), (100.0, 5))
+    assert sharded.depth("CCC", "ask") == ((100.0, 5),)
+    assert sharded.order(2) is None and sharded.order(4).idNum == 4
+
+
+def test_an_order_is_routed_by_its_identifier(pair):
+    _, _, sharded, _ = pair
+    with pytest.raises(UnknownOrder):
+        sharded.cancel(99)
+    order, _ = sharded.submit(2, "EEE", "ask", "limit", 3, 101.0)
+    assert sharded.order(order.idNum).remaining == 3
+    assert [o.idNum for o in sharded.orders()] == [order.idNum]
+
+
+def test_a_closed_book_refuses_and_closing_twice_is_harmless():
+    book = ShardedOrderBook(shards=2, tick_size=0.01)
+    book.close()
+    book.close()
+    with pytest.raises(InvalidOrder):
+        book.submit(1, "AAA", "bid", "limit", 1, 100.0)
@@ -64,13 +64,20 @@ not involve waiting for a real disk to fill is to arrange the failure.
 
 from __future__ import annotations
 
+import gc
 import json
 import logging
 import math
 import random
 import shutil
+import signal
 import sqlite3
+import subprocess
+import sys
+import threading
+import time
 from contextlib import suppress
+from dataclasses import asdict, astuple
 from dataclasses import replace as replace_field
 
 import PyLOB
@@ -78,14 +85,17 @@ import pytest
 from PyLOB.engine import InvalidOrder, OrderBook
 from PyLOB.events import (
     STREAM_VERSION,
+    Cancelled,
     ClosableEventSink,
     EventSink,
+    Filled,
     InstrumentConfigured,
     SessionStarted,
     TraderConfigured,
     close_sink,
 )
 from PyLOB.sinks import ListSink
+from PyLOB.sinks.process import SQLiteProcessSink
 from PyLOB.sinks.sqlite import (
     DEFAULT_BUFFER_SIZE,
     MIN_READABLE_SCHEMA_VERSION,
@@ -97,8 +107,14 @@ from PyLOB.sinks.sqlite import (
     decode_event,
     read_events,
     read_meta,
+    rebuild_projections,
 )
 
+# The replay suite is a sibling test module, borrowed the way
+# `test_sink_equality` borrows it: for a workload that modifies orders and
+# trades in two currencies, which this suite's own does not.
+import test_replay as replay_suite
+
 TICK = 0.01
 INSTRUMENT = "FAKE"
 CURRENCY = "USD"
@@ -1684,7 +1700,7 @@ def test_decode_event_refuses_a_field_it_does_not_understand(tmp_path):
         seq, kind, payload = conn.execute(
             "SELECT seq, kind, payload FROM event ORDER BY seq LIMIT 1"
         ).fetchone()
-        data = json.loads(payload)
+        data = asdict(decode_event(kind, payload))
         data["settlement_lag"] = 3
         conn.execute(
             "UPDATE event SET payload = ? WHERE seq = ?", (json.dumps(data), seq)
@@ -1847,6 +1863,22 @@ V3_TABLES = (
 )
 
 
+def as_json_payloads(conn):
+    """Rewrite every `event.payload` as JSON, the one encoding before schema 7.
+
+    No older recording holds a binary payload, so an older file aged without
+    this would carry a version-7 log under an older label -- and would not
+    exercise the JSON half of `decode_event` it is there to read through.
+    """
+    for seq, kind, payload in conn.execute(
+        "SELECT seq, kind, payload FROM event"
+    ).fetchall():
+        conn.execute(
+            "UPDATE event SET payload = ? WHERE seq = ?",
+            (json.dumps(asdict(decode_event(kind, payload))), seq),
+        )
+
+
 def as_version_3(source, target):
     """Rebuild the recording at `source` as a genuine version-3 file.
 
@@ -1875,6 +1907,7 @@ def as_version_3(source, target):
                 "INSERT INTO main.%s (%s) SELECT %s FROM src.%s"
                 % (table, columns, columns, table)
             )
+        as_json_payloads(conn)
         conn.commit()
     finally:
         conn.close()
@@ -1933,6 +1966,7 @@ def as_version_4(source, target):
         )
         conn.execute("DROP TABLE session")
         conn.execute("ALTER TABLE session_v4 RENAME TO session")
+        as_json_payloads(conn)
         for seq, payload in conn.execute(
             "SELECT seq, payload FROM event WHERE kind = ?", (SessionStarted.KIND,)
         ).fetchall():
@@ -2174,6 +2208,538 @@ def test_reading_an_older_file_says_what_it_does_not_carry(tmp_path, caplog):
     assert "trade_leg" not in caplog.text
 
 
+# --------------------------------------------------------------------------
+# the binary payload (schema 7)
+# --------------------------------------------------------------------------
+
+
+def payload_types(path):
+    """`typeof(payload)` for every row of the log, in `seq` order."""
+    conn = sqlite3.connect(path)
+    try:
+        return [
+            row[0]
+            for row in conn.execute("SELECT typeof(payload) FROM event ORDER BY seq")
+        ]
+    finally:
+        conn.close()
+
+
+def same_exactly(read, emitted):
+    """Equal, and every field of the same type: 5 == 5.0, and is not exact."""
+    assert read == emitted
+    for a, b in zip(read, emitted):
+        assert [type(v) for v in astuple(a)] == [type(v) for v in astuple(b)], a
+
+
+def test_an_engine_session_is_logged_in_the_binary_layout(tmp_path):
+    """Every event the engine emits fits the layout, and reads back exactly."""
+    listed = ListSink()
+    book = OrderBook(tick_size=TICK, sink=listed)
+    book.configure_instrument(INSTRUMENT, CURRENCY)
+    for tid in range(1, 5):
+        book.configure_trader(tid, name="t%d" % tid, commission_per_unit=0.01)
+    workload(book, random.Random(5), n_ops=300)
+
+    path = tmp_path / "binary.db"
+    with SQLiteSink(path, buffer_size=29) as sink:
+        for event in listed.events:
+            sink.consume(event)
+
+    assert set(payload_types(path)) == {"blob"}
+    assert {type(event) for event in listed.events} >= {Filled, Cancelled}
+    same_exactly(list(read_events(path)), listed.events)
+
+
+def test_an_event_the_layout_cannot_hold_exactly_is_logged_as_json(tmp_path):
+    """A caller's `int` clock is kept an `int`, not coerced to a float.
+
+    The engine stamps events with whatever `time` it was handed, so an `int`
+    reaches a field the class calls `float`; `struct` would pack it as a
+    double without complaint and read back `5.0`. A name longer than its
+    16-bit length would not pack at all. Both go to JSON, row by row, and the
+    log is the mixture.
+    """
+    events = [
+        session(),
+        replace_field(trader(1), timestamp=5),
+        replace_field(trader(2), name="t" * 70_000),
+        trader(3),
+    ]
+    path = tmp_path / "mixed.db"
+    with SQLiteSink(path) as sink:
+        for event in events:
+            sink.consume(event)
+
+    assert payload_types(path) == ["blob", "text", "text", "blob"]
+    same_exactly(list(read_events(path)), events)
+
+
+def test_a_binary_payload_from_a_newer_pylob_is_refused(tmp_path):
+    """ADR-0008's refusal, in the layout with no names to refuse by.
+
+    A field added at the end of a class adds to the field count in the
+    header, and that is what an older reader sees: refused as an
+    `EventLogError` saying so, rather than unpacked short and misread.
+    """
+    path = tmp_path / "binary.db"
+    with SQLiteSink(path) as sink:
+        sink.consume(session())
+        sink.consume(trader(1))
+    conn = sqlite3.connect(path)
+    try:
+        (payload,) = conn.execute("SELECT payload FROM event WHERE seq = 1").fetchone()
+    finally:
+        conn.close()
+    assert decode_event(TraderConfigured.KIND, payload) == trader(1)
+
+    newer = bytes((payload[0], payload[1] + 1)) + payload[2:] + bytes(8)
+    with pytest.raises(EventLogError, match="newer PyLOB"):
+        decode_event(TraderConfigured.KIND, newer)
+    with pytest.raises(EventLogError, match="binary format 9"):
+        decode_event(TraderConfigured.KIND, bytes((9,)) + payload[1:])
+    with pytest.raises(EventLogError, match="truncated"):
+        decode_event(TraderConfigured.KIND, payload[:-12])
+
+
+# --------------------------------------------------------------------------
+# the writer thread
+# --------------------------------------------------------------------------
+
+
+def checkpoints(path):
+    """Every `checkpoint` row, in `seq` order."""
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT * FROM checkpoint ORDER BY seq").fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("buffer_size", (1, 7, DEFAULT_BUFFER_SIZE))
+def test_a_threaded_sink_writes_the_database_an_unthreaded_one_does(
+    tmp_path, buffer_size
+):
+    """The writer thread moves the flush and changes nothing it writes.
+
+    Checkpoints are asked for as well, since their trackers are fold state and
+    the fold is what moved to the other thread.
+    """
+    paths = {}
+    for threaded in (False, True):
+        path = paths[threaded] = tmp_path / ("threaded-%s.db" % threaded)
+        sink = SQLiteSink(
+            path, buffer_size=buffer_size, checkpoint_every=40, threaded=threaded
+        )
+        book = OrderBook(tick_size=TICK, sink=sink)
+        book.configure_instrument(INSTRUMENT, CURRENCY)
+        for tid in range(1, 5):
+            book.configure_trader(tid, name="t%d" % tid, commission_per_unit=0.01)
+        workload(book, random.Random(41), n_ops=400)
+        book.close()
+
+    assert dump(paths[True]) == dump(paths[False])
+    assert checkpoints(paths[True]) == checkpoints(paths[False])
+    assert ended(paths[True]) == ended(paths[False])
+    check_log(paths[True])
+
+
+def test_a_threaded_flush_waits_for_the_writer_and_reports_its_losses(tmp_path):
+    """`flush` raises for a loss the writer made, once; `close` on every call."""
+    path = tmp_path / "threaded-loss.db"
+    sink = SQLiteSink(path, buffer_size=8, threaded=True)
+    for event in stream(24, poison_at={9}):
+        sink.consume(event)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        sink.flush()
+    # Everything handed over is on disk by the time `flush` returns.
+    assert seqs(path) == [seq for seq in range(24) if seq != 9]
+    assert losses(path) == [(9, 9, 1)]
+    sink.flush()  # nothing new was lost since the last one said so
+
+    for _ in range(2):
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.close()
+    assert ended(path)
+
+
+def test_a_threaded_sink_holds_at_most_max_pending_buffers(tmp_path):
+    """A writer that cannot keep up makes `consume` wait, not the queue grow."""
+    sink = SQLiteSink(
+        tmp_path / "backpressure.db", buffer_size=1, threaded=True, max_pending=1
+    )
+    gate = threading.Event()
+    write = sink._flush
+
+    def held(buffered):
+        gate.wait(timeout=10)
+        write(buffered)
+
+    sink._flush = held
+    events = stream(4)
+    sink.consume(events[0])  # taken by the writer, which waits at the gate
+    sink.consume(events[1])  # waits in the queue, which is now full
+    blocked = threading.Thread(target=sink.consume, args=(events[2],))
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive(), "a third buffer was accepted past max_pending=1"
+
+    gate.set()
+    blocked.join(timeout=10)
+    assert not blocked.is_alive()
+    sink.consume(events[3])
+    sink.close()
+    assert seqs(tmp_path / "backpressure.db") == [0, 1, 2, 3]
+
+
+def test_max_pending_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="max_pending"):
+        SQLiteSink(tmp_path / "nowhere.db", threaded=True, max_pending=0)
+
+
+# --------------------------------------------------------------------------
+# recording the log alone
+# --------------------------------------------------------------------------
+
+
+def by_rowid(path):
+    """Every projection's rows with their rowids, in rowid order."""
+    conn = sqlite3.connect(path)
+    try:
+        return {
+            table: conn.execute(
+                "SELECT rowid, * FROM %s ORDER BY rowid" % table
+            ).fetchall()
+            for table in PROJECTIONS
+        }
+    finally:
+        conn.close()
+
+
+def replay_session(path, buffer_size, log_only):
+    """The replay suite's workload -- modifies, two currencies -- into `path`."""
+    sink = SQLiteSink(path, buffer_size=buffer_size, log_only=log_only)
+    book = replay_suite.configure(OrderBook(tick_size=replay_suite.TICK, sink=sink))
+    replay_suite.run_workload(book, random.Random(5), n_ops=600)
+    return book, sink
+
+
+@pytest.mark.parametrize("buffer_size", (1, 7, DEFAULT_BUFFER_SIZE))
+def test_a_log_only_sink_builds_the_database_an_eager_one_writes(tmp_path, buffer_size):
+    """Row for row and rowid for rowid, once `close` has rebuilt it."""
+    paths = {}
+    for log_only in (False, True):
+        path = paths[log_only] = tmp_path / ("log-only-%s.db" % log_only)
+        book, sink = replay_session(path, buffer_size, log_only)
+        if log_only:
+            sink.flush()
+            assert all(not rows for rows in by_rowid(path).values())
+        book.close()
+
+    assert by_rowid(paths[True]) == by_rowid(paths[False])
+    assert dump(paths[True]) == dump(paths[False])
+    assert ended(paths[True]) == ended(paths[False])
+    check_log(paths[True])
+
+
+def test_a_killed_log_only_session_is_rebuilt_on_demand(tmp_path):
+    """`rebuild_projections` gives a killed run its projections, and no end."""
+    eager, killed = tmp_path / "eager.db", tmp_path / "killed.db"
+    book, sink = replay_session(eager, 64, log_only=False)
+    book.close()
+    book, sink = replay_session(killed, 64, log_only=True)
+    sink.flush()
+    expected = seqs(killed)  # the session dies here, unclosed
+
+    assert rebuild_projections(killed) == len(expected)
+    assert seqs(killed) == expected
+    assert by_rowid(killed) == by_rowid(eager)
+    assert rebuild_projections(killed) == len(expected)
+    assert by_rowid(killed) == by_rowid(eager)
+    assert ended(killed) == []
+    with pytest.raises(IncompleteLogError):
+        check_log(killed)
+
+
+def test_a_projection_the_schema_refuses_fails_the_rebuild_not_the_log(tmp_path):
+    """The poison event is in the log; `close` raises, and still ends it."""
+    path = tmp_path / "log-only-poison.db"
+    sink = SQLiteSink(path, buffer_size=8, log_only=True)
+    for event in stream(20, poison_at={9}):
+        sink.consume(event)
+
+    for _ in range(2):
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.close()
+    assert seqs(path) == list(range(20))
+    assert losses(path) == []
+    assert ended(path) == [(19, 20)]
+    assert dump(path, ("trader",)) == {"trader": []}
+
+
+def test_a_log_only_sink_takes_no_checkpoints(tmp_path):
+    with pytest.raises(ValueError, match="log_only"):
+        SQLiteSink(tmp_path / "nowhere.db", log_only=True, checkpoint_every=10)
+
+
+def test_rebuild_projections_refuses_a_file_with_no_tables(tmp_path):
+    path = tmp_path / "empty.db"
+    sqlite3.connect(path).close()
+    with pytest.raises(EventLogError, match="no tables"):
+        rebuild_projections(path)
+
+
+# --------------------------------------------------------------------------
+# one write per projection row per flush
+# --------------------------------------------------------------------------
+
+
+def fill_five_times(path, buffer_size):
+    """An ask accepted and flushed, then hit by five one-lot bids in one flush.
+
+    Returns the statements the second flush executed, one per row written.
+    """
+    book, sink = build(path, buffer_size=buffer_size)
+    book.submit(
+        tid=1,
+        instrument=INSTRUMENT,
+        side="ask",
+        order_type="limit",
+        qty=5,
+        price=100.0,
+    )
+    sink.flush()
+    executed = []
+    sink.connection.set_trace_callback(executed.append)
+    for _ in range(5):
+        book.submit(
+            tid=2,
+            instrument=INSTRUMENT,
+            side="bid",
+            order_type="limit",
+            qty=1,
+            price=100.0,
+        )
+    sink.flush()
+    sink.connection.set_trace_callback(None)
+    book.close()
+    return executed
+
+
+def test_a_flush_writes_each_projection_row_once(tmp_path):
+    """Five fills of one order: one update, four balances, one last price."""
+    executed = fill_five_times(tmp_path / "netted.db", DEFAULT_BUFFER_SIZE)
+
+    def count(prefix):
+        return sum(" ".join(sql.split()).startswith(prefix) for sql in executed)
+
+    assert count("UPDATE orders") == 1, "the resting ask's five fills"
+    assert count("INSERT INTO orders") == 5, "each bid, inserted already filled"
+    assert count("INSERT INTO trade") == 5, "a trade is a row of its own"
+    assert count("INSERT INTO balance") == 4, "two traders, two holdings each"
+    assert count("UPDATE instrument") == 1
+    assert count("INSERT INTO event") == 5 * 2, "each bid's Accepted and Filled"
+
+    fill_five_times(tmp_path / "unbatched.db", 1)
+    assert by_rowid(tmp_path / "netted.db") == by_rowid(tmp_path / "unbatched.db")
+
+
+@pytest.mark.parametrize("buffer_size", (7, DEFAULT_BUFFER_SIZE))
+def test_netting_writes_what_a_buffer_of_one_writes(tmp_path, buffer_size):
+    """Row for row, rowid for rowid, and every balance to the bit.
+
+    The replay suite's workload modifies, cancels and fills the same orders
+    across and within flushes, which is every stretch `_net_orders` merges.
+    A balance is compared by its bits, since `==` would let a re-associated
+    sum that rounds to the same value hide a change in where it rounds.
+    """
+    paths = {}
+    for size in (1, buffer_size):
+        path = paths[size] = tmp_path / ("buffered-%d.db" % size)
+        book, _ = replay_session(path, size, log_only=False)
+        book.close()
+
+    assert by_rowid(paths[buffer_size]) == by_rowid(paths[1])
+
+    def bits(path):
+        conn = sqlite3.connect(path)
+        try:
+            return [
+                (tid, symbol, math.copysign(1.0, amount), amount.hex())
+                for tid, symbol, amount in conn.execute(
+                    "SELECT tid, symbol, amount FROM balance ORDER BY rowid"
+                )
+            ]
+        finally:
+            conn.close()
+
+    assert bits(paths[buffer_size]) == bits(paths[1])
+
+
+def test_a_failed_batch_takes_its_movements_back_out_of_the_totals(tmp_path):
+    """The salvage re-adds what the failed write had added, and only once."""
+    recorded = ListSink()
+    book = replay_suite.configure(OrderBook(tick_size=replay_suite.TICK, sink=recorded))
+    replay_suite.run_workload(book, random.Random(5), n_ops=300)
+    fills = [i for i, event in enumerate(recorded.events) if isinstance(event, Filled)]
+    events = list(recorded.events)
+    poisoned = events[fills[len(fills) // 2]]
+    events[fills[len(fills) // 2]] = replace_field(
+        poisoned, ask_commission_delta=float("nan")
+    )
+
+    paths = {}
+    for size in (1, 64):
+        path = paths[size] = tmp_path / ("poisoned-%d.db" % size)
+        sink = SQLiteSink(path, buffer_size=size)
+        for event in events:
+            sink.consume(event)
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.close()
+        assert [seq for seq, *_ in losses(path)] == [poisoned.seq]
+
+    assert by_rowid(paths[64]) == by_rowid(paths[1])
+
+
+# --------------------------------------------------------------------------
+# the recording process
+# --------------------------------------------------------------------------
+
+
+def wait_for(condition, timeout=10.0):
+    """Poll `condition` until it holds; fail after `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "gave up waiting"
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize("buffer_size", (7, DEFAULT_BUFFER_SIZE))
+def test_a_process_sink_writes_the_database_an_in_process_one_does(
+    tmp_path, buffer_size
+):
+    """The child is a `SQLiteSink`, fed the same events in the same batches."""
+    paths = {}
+    for cls in (SQLiteSink, SQLiteProcessSink):
+        path = paths[cls] = tmp_path / ("%s.db" % cls.__name__)
+        sink = cls(path, buffer_size=buffer_size, checkpoint_every=40, meta={"n": 1})
+        book = OrderBook(tick_size=TICK, sink=sink)
+        book.configure_instrument(INSTRUMENT, CURRENCY)
+        for tid in range(1, 5):
+            book.configure_trader(tid, name="t%d" % tid, commission_per_unit=0.01)
+        workload(book, random.Random(43), n_ops=400)
+        book.close()
+
+    recorded, expected = paths[SQLiteProcessSink], paths[SQLiteSink]
+    assert dump(recorded) == dump(expected)
+    assert checkpoints(recorded) == checkpoints(expected)
+    assert ended(recorded) == ended(expected)
+    assert payload_types(recorded) == payload_types(expected)
+    assert read_meta(recorded) == {"n": 1}
+    check_log(recorded)
+
+
+def test_a_process_sink_reports_the_losses_its_child_made(tmp_path):
+    """The child's loss crosses the pipe: once to `flush`, always to `close`."""
+    path = tmp_path / "process-loss.db"
+    sink = SQLiteProcessSink(path, buffer_size=8)
+    for event in stream(24, poison_at={9}):
+        sink.consume(event)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        sink.flush()
+    assert seqs(path) == [seq for seq in range(24) if seq != 9]
+    assert losses(path) == [(9, 9, 1)]
+    sink.flush()  # nothing new was lost since the last one said so
+
+    for _ in range(2):
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.close()
+    assert ended(path)
+    with pytest.raises(RuntimeError, match="closed"):
+        sink.consume(trader(24))
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs SIGKILL")
+def test_a_killed_parent_leaves_what_it_sent_and_no_end_row(tmp_path):
+    """The child writes every event it was sent, and does not forge the end.
+
+    The parent sends two buffers of eight and is killed holding four more,
+    which die with it as they would with an in-process sink. Killed rather
+    than exited, so no finalizer runs: the pipe closing is all the child is
+    told.
+    """
+    path = tmp_path / "killed-parent.db"
+    script = (
+        "import os, signal\n"
+        "from PyLOB.events import SessionStarted, TraderConfigured\n"
+        "from PyLOB.sinks.process import SQLiteProcessSink\n"
+        "sink = SQLiteProcessSink(%r, buffer_size=8)\n"
+        "sink.consume(SessionStarted(seq=0, timestamp=0.0, tick_size=0.01))\n"
+        "for seq in range(1, 20):\n"
+        "    sink.consume(TraderConfigured(seq, 0.0, seq, 't', False, 0.0, 0.0, 0.0))\n"
+        "os.kill(os.getpid(), signal.SIGKILL)\n"
+    ) % str(path)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == -signal.SIGKILL, result.stderr
+
+    wait_for(lambda: path.exists() and len(seqs(path)) == 16)
+    assert seqs(path) == list(range(16))
+    assert ended(path) == []
+    with pytest.raises(IncompleteLogError):
+        check_log(path)
+
+
+def test_a_process_sink_dropped_unclosed_is_an_unfinished_session(tmp_path):
+    """Garbage, or the interpreter exiting, tells the child the same thing."""
+    path = tmp_path / "dropped.db"
+    sink = SQLiteProcessSink(path, buffer_size=8)
+    for event in stream(20):
+        sink.consume(event)
+    recorder = sink._process
+    del sink
+    gc.collect()
+
+    assert not recorder.is_alive()
+    assert seqs(path) == list(range(16))
+    assert ended(path) == []
+    with pytest.raises(IncompleteLogError):
+        check_log(path)
+
+
+def test_a_dead_recording_process_is_reported_from_then_on(tmp_path):
+    path = tmp_path / "dead-child.db"
+    sink = SQLiteProcessSink(path, buffer_size=8)
+    for event in stream(8):
+        sink.consume(event)
+    sink.flush()
+    sink._process.kill()
+    sink._process.join(timeout=10)
+
+    for event in stream(24)[8:]:
+        sink.consume(event)
+    with pytest.raises(RuntimeError, match="recording process exited"):
+        sink.flush()
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="recording process exited"):
+            sink.close()
+    assert seqs(path) == list(range(8))
+    assert ended(path) == []
+
+
+def test_a_process_sink_refuses_what_sqlite_sink_refuses(tmp_path):
+    """Opening waits for the child, so its refusal is this constructor's."""
+    with pytest.raises(TypeError, match="meta"):
+        SQLiteProcessSink(tmp_path / "bad-meta.db", meta={"seed": [1, 2]})
+    with pytest.raises(ValueError, match="checkpoint_every"):
+        SQLiteProcessSink(tmp_path / "bad-checkpoint.db", checkpoint_every=0)
+    with pytest.raises(ValueError, match="buffer_size"):
+        SQLiteProcessSink(tmp_path / "bad-buffer.db", buffer_size=0)
+
+
 # --------------------------------------------------------------------------
 # the other sink this package ships
 # --------------------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""`submit_many`: the `submit` loop, in one call, and indistinguishable from it.
+
+Recordings and replays must not change because a caller batched, so every
+check here runs the same ops both ways, into two fresh books, and compares
+what was emitted, what was returned, and what the books hold afterwards --
+for rows and for columns, for enum members and their strings, and for a batch
+cut short by an op `submit` refuses.
+"""
+
+from __future__ import annotations
+
+import pytest
+from PyLOB.bench import workloads
+from PyLOB.engine import InvalidOrder, OrderBook
+from PyLOB.events import OrderType, Side
+from PyLOB.sinks import ListSink
+
+INSTRUMENT = workloads.INSTRUMENT
+CURRENCY = workloads.CURRENCY
+
+
+def build():
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink)
+    book.configure_instrument(INSTRUMENT, CURRENCY)
+    for tid in range(1, 5):
+        book.configure_trader(tid, commission_min=0.5)
+    return book, sink
+
+
+def state(book):
+    return (
+        [(o.idNum, o.price, o.remaining, o.cancelled) for o in book.orders()],
+        book.depth(INSTRUMENT, "bid"),
+        book.depth(INSTRUMENT, "ask"),
+        sorted(book.holdings()),
+        sorted(book._traders),
+        book.time,
+    )
+
+
+def looped(ops):
+    book, sink = build()
+    orders, trades = [], []
+    for tid, side, order_type, qty, price in ops:
+        order, filled = book.submit(tid, INSTRUMENT, side, order_type, qty, price)
+        orders.append(order)
+        trades += filled
+    return book, sink, orders, trades
+
+
+def batched(ops):
+    book, sink = build()
+    orders, trades = book.submit_many(INSTRUMENT, ops)
+    return book, sink, orders, trades
+
+
+def test_a_workload_batched_emits_and_leaves_what_the_loop_does():
+    ops = [op[:5] for op in workloads.generate("mixed-v1", 7, 3000)]
+    # A trader nobody configured, resting behind the touch: `match` registers
+    # one before it finds nothing to walk, so the batch has to as well.
+    ops.append((9, "bid", "limit", 1, 1.0))
+
+    book, sink, orders, trades = looped(ops)
+    other, other_sink, other_orders, other_trades = batched(ops)
+
+    assert other_sink.events == sink.events
+    assert other_trades == trades
+    assert [o.idNum for o in other_orders] == [o.idNum for o in orders]
+    assert state(other) == state(book)
+
+
+def test_columns_are_the_same_ops():
+    ops = [op[:5] for op in workloads.generate("mixed-v1", 11, 400)]
+    columns = dict(zip(("tid", "side", "type", "qty", "price"), map(list, zip(*ops))))
+
+    _, sink, _, trades = batched(ops)
+    other, other_sink = build()
+    _, other_trades = other.submit_many(INSTRUMENT, columns)
+
+    assert other_sink.events == sink.events
+    assert other_trades == trades
+
+
+def test_enum_members_and_their_strings_are_one_input():
+    ops = [(1, "bid", "limit", 2, 99.0), (2, "ask", "market", 1, None)]
+    members = [
+        (1, Side.BID, OrderType.LIMIT, 2, 99.0),
+        (2, Side.ASK, "market", 1, None),
+    ]
+    assert batched(members)[1].events == batched(ops)[1].events
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        (2, "buy", "limit", 1, 100.0),
+        (2, "bid", "stop", 1, 100.0),
+        (2, ["bid"], "limit", 1, 100.0),
+        (2, "bid", "limit", 0, 100.0),
+        (2, "bid", "market", 1, 100.0),
+    ],
+)
+def test_a_refused_op_raises_with_the_ops_before_it_standing(bad):
+    ops = [(1, "ask", "limit", 3, 100.0), (2, "bid", "limit", 1, 100.0), bad]
+    ops.append((2, "bid", "limit", 1, 100.0))
+
+    book, sink = build()
+    stood = [book.submit(tid, INSTRUMENT, *op) for tid, *op in ops[:2]]
+    other, other_sink = build()
+    with pytest.raises(InvalidOrder) as refused:
+        other.submit_many(INSTRUMENT, ops)
+
+    orders, trades = refused.value.partial
+    assert [order.idNum for order in orders] == [order.idNum for order, _ in stood]
+    assert list(trades) == [trade for _, made in stood for trade in made]
+    assert other_sink.events == sink.events
+    assert state(other) == state(book)
+
+
+def test_columns_of_different_lengths_are_refused_before_anything_runs():
+    book, sink = build()
+    before = list(sink.events)
+    columns = dict(tid=[1, 2], side=["bid"], type=["limit"] * 2, qty=[1, 1])
+    with pytest.raises(InvalidOrder, match="price"):
+        book.submit_many(INSTRUMENT, columns)
+    columns["price"] = [99.0, 98.0]
+    with pytest.raises(InvalidOrder, match="one length"):
+        book.submit_many(INSTRUMENT, columns)
+    assert sink.events == before
@@ -0,0 +1,64 @@
+"""`submit_quiet`: `submit` to the letter, reporting a count instead of trades.
+
+Each workload runs through `submit` into one book and through `submit_quiet`
+into another, and the stream, the ledgers and the book must come out equal,
+with each count what the `Trade` list beside it sums to. A refused quiet
+submission must leave the book as it found it.
+"""
+
+from __future__ import annotations
+
+import pytest
+from PyLOB import FillCount
+from PyLOB.bench import workloads
+from PyLOB.engine import InvalidOrder, OrderBook
+from PyLOB.sinks import ListSink
+
+INSTRUMENT = workloads.INSTRUMENT
+CURRENCY = workloads.CURRENCY
+
+
+def build(trade_tape=False):
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink)
+    book.configure_instrument(INSTRUMENT, CURRENCY, trade_tape=trade_tape)
+    for tid in range(1, 5):
+        book.configure_trader(tid, commission_min=0.5)
+    return book, sink
+
+
+def state(book):
+    return (
+        [(o.idNum, o.remaining, o.value, o.commission) for o in book.orders()],
+        book.depth(INSTRUMENT, "bid"),
+        book.depth(INSTRUMENT, "ask"),
+        sorted(book.holdings()),
+        book.time,
+    )
+
+
+@pytest.mark.parametrize("trade_tape", [False, True])
+def test_a_quiet_workload_leaves_what_submit_does(trade_tape):
+    ops = [op[:5] for op in workloads.generate("mixed-v1", 3, 3000)]
+    loud, loud_sink = build(trade_tape)
+    quiet, quiet_sink = build(trade_tape)
+
+    for tid, side, order_type, qty, price in ops:
+        order, trades = loud.submit(tid, INSTRUMENT, side, order_type, qty, price)
+        counted = quiet.submit_quiet(tid, INSTRUMENT, side, order_type, qty, price)
+        assert counted == FillCount(
+            order.idNum, sum(trade.qty for trade in trades), len(trades)
+        )
+
+    assert quiet_sink.events == loud_sink.events
+    assert state(quiet) == state(loud)
+    if trade_tape:
+        assert list(quiet.book(INSTRUMENT).tape) == list(loud.book(INSTRUMENT).tape)
+
+
+def test_a_refused_quiet_submission_changes_nothing():
+    book, sink = build()
+    with pytest.raises(InvalidOrder):
+        book.submit_quiet(1, INSTRUMENT, "bid", "limit", 5)
+    assert sink.events[-1].__class__.__name__ == "TraderConfigured"
+    assert book.time == 0.0
@@ -0,0 +1,123 @@
+"""`PyLOB.sweep`: episodes over a seed grid, and the pool changing nothing.
+
+An episode is a fresh engine and a seed, so its result cannot depend on which
+process ran it or in what order -- the check is a pooled sweep against the
+same sweep run inline, field for field, less the wall time.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from PyLOB.bench import WORKLOADS, build_book, generate
+from PyLOB.events import Filled
+from PyLOB.sinks.sqlite import check_log, read_events, read_meta
+from PyLOB.sweep import main, sweep
+
+
+def drive(book, seed):
+    """A caller's episode: two traders crossing at a seed-dependent price."""
+    book.configure_instrument("XYZ", "EUR")
+    price = 100.0 + seed / 100
+    book.submit(1, "XYZ", "ask", "limit", 5, price)
+    order, trades = book.submit(2, "XYZ", "bid", "limit", 3, price)
+    return {"filled": order.fulfilled, "trades": len(trades)}
+
+
+def timeless(results):
+    return [result._replace(seconds=None) for result in results]
+
+
+@pytest.mark.parametrize("workload", ["mixed-v1", drive])
+def test_a_pooled_sweep_reports_what_an_inline_one_does(workload):
+    seeds = [3, 1, 4, 1, 5]
+    inline = sweep(workload, seeds, orders=400, workers=1)
+    pooled = sweep(workload, seeds, orders=400, workers=2, chunksize=2)
+
+    assert timeless(pooled) == timeless(inline)
+    assert [r.episode for r in pooled] == list(range(len(seeds)))
+    assert [r.seed for r in pooled] == seeds
+    # A repeated seed is the same episode twice.
+    assert timeless(pooled)[1][2:] == timeless(pooled)[3][2:]
+
+
+def test_named_workload_results_are_read_off_the_book():
+    (result,) = sweep("mixed-v1", [7], orders=500, workers=1)
+    book = build_book(WORKLOADS["mixed-v1"])
+    trades = sum(
+        len(book.submit(tid, "FAKE", side, order_type, qty, price)[1])
+        for tid, side, order_type, qty, price, _ in generate("mixed-v1", 7, 500)
+    )
+    assert result.orders == 500 and result.trades == trades > 0
+    assert result.last_prices[0][0] == "FAKE"
+    assert result.path is None and result.result is None
+
+
+def test_recorded_episodes_say_which_they_are(tmp_path):
+    results = sweep(drive, [10, 20, 30], record={1}, directory=tmp_path, workers=2)
+
+    assert [r.path is not None for r in results] == [False, True, False]
+    path = results[1].path
+    assert read_meta(path) == {
+        "seed": 20,
+        "episode": 1,
+        "workload": "test_sweep:drive",
+    }
+    assert sum(isinstance(e, Filled) for e in read_events(path)) == 1
+    assert results[1].result == {"filled": 3, "trades": 1}
+    assert results[1].trades is None
+
+
+def fail_after_trading(book, seed):
+    """A caller's episode that records a trade, then raises."""
+    drive(book, seed)
+    raise RuntimeError("episode %d went wrong" % seed)
+
+
+def test_an_episode_that_raises_still_closes_its_recording(tmp_path):
+    with pytest.raises(RuntimeError, match="episode 4 went wrong"):
+        sweep(fail_after_trading, [4], record={0}, directory=tmp_path, workers=1)
+
+    path = tmp_path / "episode-0000.db"
+    check_log(path)
+    assert any(isinstance(event, Filled) for event in read_events(path))
+
+
+def test_recording_without_a_directory_or_outside_the_grid_is_refused():
+    with pytest.raises(ValueError):
+        sweep("mixed-v1", [1, 2], record={0})
+    with pytest.raises(ValueError):
+        sweep("mixed-v1", [1, 2], record={2}, directory=".")
+    with pytest.raises(ValueError):
+        sweep("mixed-v2-does-not-exist", [1])
+
+
+def test_the_command_line_prints_one_json_object_per_episode(tmp_path, capsys):
+    code = main(
+        [
+            "--workload",
+            "mixed-v1",
+            "--seeds",
+            "1-2,9",
+            "--orders",
+            "300",
+            "--workers",
+            "1",
+            "--record",
+            "2",
+            "--directory",
+            str(tmp_path),
+        ]
+    )
+    assert code == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["seed"] for line in lines] == [1, 2, 9]
+    assert lines[2]["path"] == str(tmp_path / "episode-0002.db")
+    assert read_meta(lines[2]["path"])["workload"] == "mixed-v1"
+
+
+def test_the_command_line_refuses_a_grid_it_cannot_read():
+    with pytest.raises(SystemExit) as exited:
+        main(["--workload", "mixed-v1", "--seeds", "1-x"])
+    assert exited.value.code == 2
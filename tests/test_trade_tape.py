@@ -0,0 +1,114 @@
+"""`configure_instrument(trade_tape=True)`: trades kept as columns, reported alike.
+
+A taped instrument keeps its executions as array rows and hands back
+`TradeRange`s over them where an untaped one hands back lists. The main check
+runs one workload into two books that differ by the tape alone and compares
+the trades, the events and the book. The rest cover a range's slices and
+columns, the shared empty range, identifiers too wide for the columns, and
+turning the tape off.
+"""
+
+from __future__ import annotations
+
+import pytest
+from PyLOB import TradeRange, TradeTape
+from PyLOB.bench import workloads
+from PyLOB.engine import OrderBook, Side
+from PyLOB.sinks import ListSink
+
+INSTRUMENT = workloads.INSTRUMENT
+CURRENCY = workloads.CURRENCY
+
+
+def build(trade_tape=None):
+    sink = ListSink()
+    book = OrderBook(tick_size=0.01, sink=sink)
+    book.configure_instrument(INSTRUMENT, CURRENCY, trade_tape=trade_tape)
+    for tid in range(1, 11):
+        book.configure_trader(tid, commission_per_unit=0.01)
+    return book, sink
+
+
+def test_a_taped_book_reports_the_trades_a_listed_one_does():
+    ops = [op[:5] for op in workloads.generate("mixed-v1", 3, 2000)]
+    listed, listed_sink = build()
+    taped, taped_sink = build(trade_tape=True)
+
+    everything = []
+    for tid, side, order_type, qty, price in ops:
+        _, made = listed.submit(tid, INSTRUMENT, side, order_type, qty, price)
+        _, rows = taped.submit(tid, INSTRUMENT, side, order_type, qty, price)
+        assert isinstance(rows, TradeRange)
+        assert rows == made and list(rows) == made
+        everything += made
+
+    tape = taped.book(INSTRUMENT).tape
+    assert isinstance(tape, TradeTape)
+    assert list(tape) == everything
+    assert taped_sink.events == listed_sink.events
+    assert sorted(taped.holdings()) == sorted(listed.holdings())
+    assert list(tape.trade_id) == [trade.trade_id for trade in everything]
+
+
+def test_a_range_slices_and_reads_columns_without_building_trades():
+    book, _ = build(trade_tape=True)
+    for price in (100.0, 100.5, 101.0):
+        book.submit(1, INSTRUMENT, "ask", "limit", 2, price)
+    _, sweep = book.submit(2, INSTRUMENT, "bid", "market", 5)
+
+    assert len(sweep) == 3
+    assert sweep[1:].column("price") == sweep.column("price")[1:]
+    assert list(sweep.column("price")) == [100.0, 100.5, 101.0]
+    assert list(sweep.column("qty")) == [2, 2, 1]
+    assert sweep[-1].taker_side is Side.BID and sweep[-1].instrument == INSTRUMENT
+    assert sweep[::2] == [sweep[0], sweep[2]]
+    with pytest.raises(IndexError):
+        sweep[3]
+    with pytest.raises(KeyError):
+        sweep.column("instrument")
+
+
+def test_an_order_that_trades_nothing_shares_the_one_empty_range():
+    book, _ = build(trade_tape=True)
+    _, first = book.submit(1, INSTRUMENT, "bid", "limit", 1, 99.0)
+    _, second = book.submit(1, INSTRUMENT, "bid", "limit", 1, 98.0)
+    assert first is second
+    assert first == [] and len(first) == 0
+
+
+def test_identifiers_too_wide_for_an_array_move_the_tape_to_lists():
+    book, _ = build(trade_tape=True)
+    book.submit(1, INSTRUMENT, "ask", "limit", 2, 100.0)
+    book.submit(2, INSTRUMENT, "bid", "limit", 1, 100.0)
+    wide = 2**70
+    _, made = book.submit(wide, INSTRUMENT, "bid", "limit", 1, 100.0)
+
+    tape = book.book(INSTRUMENT).tape
+    assert [trade.bid_tid for trade in tape] == [2, wide]
+    assert made[0].bid_tid == wide
+    assert isinstance(tape.bid_tid, list)
+
+
+def test_the_tape_is_kept_until_it_is_turned_off():
+    book, _ = build(trade_tape=True)
+    book.submit(1, INSTRUMENT, "ask", "limit", 2, 100.0)
+    book.submit(2, INSTRUMENT, "bid", "market", 1)
+    tape = book.book(INSTRUMENT).tape
+
+    book.configure_instrument(INSTRUMENT, CURRENCY)
+    book.configure_instrument(INSTRUMENT, CURRENCY, trade_tape=True)
+    assert book.book(INSTRUMENT).tape is tape and len(tape) == 1
+
+    book.configure_instrument(INSTRUMENT, CURRENCY, trade_tape=False)
+    _, made = book.submit(2, INSTRUMENT, "bid", "market", 1)
+    assert type(made) is list and len(made) == 1
+    assert book.book(INSTRUMENT).tape is None
+
+
+def test_a_taped_batch_returns_one_range_over_its_rows():
+    ops = [op[:5] for op in workloads.generate("mixed-v1", 5, 500)]
+    listed, _ = build()
+    taped, _ = build(trade_tape=True)
+    _, made = listed.submit_many(INSTRUMENT, ops)
+    _, rows = taped.submit_many(INSTRUMENT, ops)
+    assert isinstance(rows, TradeRange) and rows == made
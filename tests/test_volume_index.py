@@ -0,0 +1,105 @@
+"""`getVolumeAtPrice` from the volume index: the same number the levels sum to.
+
+Each `BookSide` answers `volume_at` from a Fenwick tree once it has been asked,
+and keeps the tree current from every write that changes a level's volume.
+The checks here hold it to the brute-force definition in `book-queries`
+-- the resting orders that would trade against an opposite order at that
+price -- across a workload that grows the window and, once, outgrows it.
+"""
+
+from __future__ import annotations
+
+import random
+
+from PyLOB.engine import _VOLUME_INDEX_SPAN, OrderBook
+
+INSTRUMENT = "FAKE"
+TICK = 0.01
+
+
+def make_book():
+    book = OrderBook(tick_size=TICK)
+    book.configure_instrument(INSTRUMENT, "USD")
+    for tid in (1, 2):
+        book.configure_trader(tid)
+    return book
+
+
+def brute_volume(book, side, price):
+    qualifies = (lambda p: p >= price) if side == "bid" else (lambda p: p <= price)
+    return sum(
+        order.qty - order.fulfilled
+        for order in book.snapshot(INSTRUMENT, side)
+        if qualifies(order.price)
+    )
+
+
+def probes(book, rng):
+    prices = [round(rng.uniform(90.0, 110.0), 2) for _ in range(6)]
+    for side in ("bid", "ask"):
+        prices += [price for price, _ in book.depth(INSTRUMENT, side, 2)]
+    return prices
+
+
+def test_the_index_agrees_with_the_resting_orders_through_a_random_session():
+    rng = random.Random(4)
+    book = make_book()
+    resting = []
+
+    for step in range(2500):
+        roll = rng.random()
+        if roll < 0.12 and resting:
+            idNum = resting.pop(rng.randrange(len(resting)))
+            if book.order(idNum).resting:
+                book.cancelOrder(None, idNum)
+        elif roll < 0.22 and resting:
+            idNum = rng.choice(resting)
+            order = book.order(idNum)
+            if order.resting:
+                price = None
+                if roll < 0.17:
+                    price = round(rng.uniform(95.0, 105.0), 2)
+                update = dict(side=order.side, qty=rng.randint(1, 12), price=price)
+                book.modifyOrder(idNum, update)
+        else:
+            side = rng.choice(("bid", "ask"))
+            order_type = "market" if roll > 0.95 else "limit"
+            price = None
+            if order_type == "limit":
+                # Now and then far off, so the window has to grow to take it.
+                spread = 40.0 if rng.random() < 0.02 else 2.0
+                price = round(rng.gauss(100.0, spread), 2)
+                price = max(price, TICK)
+            tid, qty = rng.choice((1, 2)), rng.randint(1, 9)
+            order, _ = book.submit(tid, INSTRUMENT, side, order_type, qty, price)
+            resting.append(order.idNum)
+        if step % 25 == 0:
+            for side in ("bid", "ask"):
+                for price in probes(book, rng):
+                    assert book.getVolumeAtPrice(
+                        INSTRUMENT, side, price
+                    ) == brute_volume(book, side, price), (step, side, price)
+
+    assert book.book(INSTRUMENT).bids._volumes is not None
+
+
+def test_a_side_spread_too_wide_to_index_sums_its_levels_instead():
+    book = make_book()
+    low = 1.0
+    high = round(low + TICK * (_VOLUME_INDEX_SPAN + 10), 2)
+    book.submit(1, INSTRUMENT, "bid", "limit", 3, low)
+    book.submit(1, INSTRUMENT, "bid", "limit", 4, 50.0)
+    assert book.getVolumeAtPrice(INSTRUMENT, "bid", 25.0) == 4
+    bids = book.book(INSTRUMENT).bids
+    assert bids._volumes is not None
+
+    # A level far enough off that no window could hold both ends.
+    book.submit(1, INSTRUMENT, "bid", "limit", 5, high)
+    assert bids._volumes is None
+    assert book.getVolumeAtPrice(INSTRUMENT, "bid", 25.0) == 9
+    assert book.getVolumeAtPrice(INSTRUMENT, "bid", low) == 12
+
+    # Once the outlier trades away, the next query builds a fresh index.
+    book.submit(2, INSTRUMENT, "ask", "market", 5)
+    assert book.getVolumeAtPrice(INSTRUMENT, "bid", 25.0) == 4
+    assert bids._volumes is not None